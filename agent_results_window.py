@@ -6,12 +6,14 @@ from matplotlib.figure import Figure
 import pandas as pd
 import numpy as np
 from utils import format_currency, format_percentage
+from ticker_charts import TickerChartsPanel, compute_position_values
 
 class AgentResultsWindow:
     def __init__(self, parent, agent_simulation):
         self.parent = parent
         self.agent_simulation = agent_simulation
         self.window = None
+        self.ticker_charts = None
         
     def show(self):
         self.window = tk.Toplevel(self.parent)
@@ -75,85 +77,10 @@ class AgentResultsWindow:
         toolbar.update()
         
     def create_ticker_charts(self, parent):
-        canvas_frame = ttk.Frame(parent)
-        canvas_frame.pack(fill=tk.BOTH, expand=True)
-        
-        scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        canvas = tk.Canvas(canvas_frame, yscrollcommand=scrollbar.set)
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=canvas.yview)
-        
-        inner_frame = ttk.Frame(canvas)
-        canvas.create_window((0, 0), window=inner_frame, anchor='nw')
-        
         transactions = self.agent_simulation.agent_portfolio.transaction_history
         
         if not transactions:
-            ttk.Label(inner_frame, text="Brak transakcji").pack()
+            ttk.Label(parent, text="Brak transakcji").pack()
             return
         
-        df_transactions = pd.DataFrame(transactions)
-        tickers = df_transactions['ticker'].unique()
-        
-        for ticker in tickers:
-            self.create_ticker_portfolio_value_chart(inner_frame, ticker, df_transactions)
-        
-        inner_frame.update_idletasks()
-        canvas.config(scrollregion=canvas.bbox("all"))
-        
-    def create_ticker_portfolio_value_chart(self, parent, ticker, all_transactions):
-        frame = ttk.LabelFrame(parent, text=f"{ticker} - Wartość Portfolio", padding=10)
-        frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        ticker_transactions = all_transactions[all_transactions['ticker'] == ticker].copy()
-        ticker_transactions = ticker_transactions.sort_values('date')
-        
-        dates = []
-        portfolio_values = []
-        shares_held = 0
-        total_cost = 0
-        
-        for _, row in ticker_transactions.iterrows():
-            date = pd.to_datetime(row['date'])
-            action = row['action']
-            shares = row['shares']
-            price = row['price']
-            
-            if action == 'BUY':
-                total_cost += shares * price
-                shares_held += shares
-            elif action == 'SELL':
-                if shares_held > 0:
-                    cost_per_share = total_cost / shares_held
-                    total_cost -= shares * cost_per_share
-                    shares_held -= shares
-            
-            portfolio_value = shares_held * price
-            dates.append(date)
-            portfolio_values.append(portfolio_value)
-        
-        if not dates:
-            ttk.Label(frame, text="Brak danych dla tego tickera").pack()
-            return
-        
-        figure = Figure(figsize=(12, 5))
-        ax = figure.add_subplot(111)
-        
-        ax.plot(dates, portfolio_values, linewidth=2, color='#2ca02c', marker='o', markersize=4)
-        ax.fill_between(dates, portfolio_values, 0, alpha=0.3, color='#2ca02c')
-        ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
-        
-        ax.set_title(f'{ticker} - Wartość Pozycji w Portfolio', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Data', fontsize=11)
-        ax.set_ylabel('Wartość Portfolio ($)', fontsize=11)
-        ax.grid(True, alpha=0.3)
-        figure.autofmt_xdate()
-        
-        canvas_widget = FigureCanvasTkAgg(figure, frame)
-        canvas_widget.draw()
-        canvas_widget.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        toolbar = NavigationToolbar2Tk(canvas_widget, frame)
-        toolbar.update()
\ No newline at end of file
+        self.ticker_charts = TickerChartsPanel(parent, compute_position_values(transactions))
@@ -7,6 +7,53 @@ from abc import ABC, abstractmethod
 from portfolio_manager import PortfolioManager
 from transaction_logger import TransactionLogger
 from utils import format_currency, format_percentage, calculate_returns
+from metrics import get_metrics_registry
+from simulation_control import SimulationControl
+from checkpoint import save_checkpoint, load_checkpoint, remove_checkpoint
+from result_store import compute_fingerprint
+from analytics import compute_performance_metrics
+from config import DEFAULT_SETTINGS
+
+METRICS = get_metrics_registry()
+AGENT_DAYS = METRICS.counter('agent_days_total', "Days processed by AgentSimulation")
+AGENT_RUNS = METRICS.counter('agent_runs_total', "Finished AgentSimulation runs")
+RUNNING_AGENTS = METRICS.gauge('agent_running', "AgentSimulation runs in progress")
+
+AGENT_LOG_DIRECTORY = "agent_logs"
+
+class MarketSnapshot:
+    # Per-day arrays aligned with `tickers`; missing prices/probabilities and buy dates are NaN/NaT
+    def __init__(self, current_date, days_ahead, tickers, predictions, prices, probabilities, tradable,
+                 shares, avg_prices, buy_dates, portfolio, probability_map):
+        self.current_date = current_date
+        self.days_ahead = days_ahead
+        self.tickers = tickers
+        self.predictions = predictions
+        self.prices = prices
+        self.probabilities = probabilities
+        self.tradable = tradable
+        self.shares = shares
+        self.avg_prices = avg_prices
+        self.buy_dates = buy_dates
+        self.portfolio = portfolio
+        self.probability_map = probability_map
+        self.index = {ticker: position for position, ticker in enumerate(tickers)}
+        self._portfolio_summary = None
+    
+    def get_days_held(self):
+        return np.floor((np.datetime64(self.current_date, 'ns') - self.buy_dates) / np.timedelta64(1, 'D'))
+    
+    def get_profit_loss(self):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (self.prices - self.avg_prices) / self.avg_prices
+    
+    def get_price_dict(self):
+        return {self.tickers[i]: self.prices[i] for i in np.flatnonzero(self.tradable)}
+    
+    def get_portfolio_summary(self):
+        if self._portfolio_summary is None:
+            self._portfolio_summary = self.portfolio.get_portfolio_summary(self.get_price_dict())
+        return self._portfolio_summary
 
 class InvestmentStrategy(ABC):
     
@@ -25,6 +72,51 @@ class InvestmentStrategy(ABC):
     @abstractmethod
     def should_sell(self, ticker, position, current_price, buy_date, current_date, days_ahead):
         pass
+    
+    def rank_candidates(self, candidates, probabilities):
+        return candidates
+    
+    def get_allocation_slots(self, num_tickers):
+        return num_tickers
+    
+    def get_kernel_rules(self, days_ahead):
+        # Overrides of backtest_kernel.DEFAULT_RULES, or None when the rules cannot run in the compiled kernel
+        return None
+    
+    # Batch API over a MarketSnapshot; the defaults adapt the scalar methods above one ticker at a time
+    def should_buy_batch(self, snapshot):
+        mask = np.zeros(len(snapshot.tickers), dtype=bool)
+        for i in np.flatnonzero(snapshot.tradable & (snapshot.shares <= 0)):
+            mask[i] = self.should_buy(
+                snapshot.tickers[i], int(snapshot.predictions[i]), snapshot.prices[i],
+                snapshot.get_portfolio_summary(), {}
+            )
+        return mask
+    
+    def should_sell_batch(self, snapshot):
+        mask = np.zeros(len(snapshot.tickers), dtype=bool)
+        for i in np.flatnonzero(snapshot.tradable & (snapshot.shares > 0) & ~np.isnat(snapshot.buy_dates)):
+            ticker = snapshot.tickers[i]
+            mask[i] = self.should_sell(
+                ticker, snapshot.portfolio.get_position(ticker), snapshot.prices[i],
+                pd.Timestamp(snapshot.buy_dates[i]), snapshot.current_date, snapshot.days_ahead
+            )
+        return mask
+    
+    def rank_candidates_batch(self, snapshot, candidates):
+        ranked = self.rank_candidates([snapshot.tickers[i] for i in candidates], snapshot.probability_map)
+        return np.array([snapshot.index[ticker] for ticker in ranked], dtype=int)
+    
+    def calculate_position_sizes(self, snapshot, candidates, available_capital, num_tickers):
+        return np.array([
+            self.calculate_position_size(snapshot.tickers[i], available_capital, num_tickers, snapshot.prices[i])
+            for i in candidates
+        ], dtype=int)
+    
+    def _sizes_from_budget(self, snapshot, candidates, budget_per_stock):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shares = np.floor(budget_per_stock / snapshot.prices[candidates])
+        return np.maximum(np.nan_to_num(shares), 0).astype(int)
 
 class BasicStrategy(InvestmentStrategy):
     
@@ -42,6 +134,18 @@ class BasicStrategy(InvestmentStrategy):
     def should_sell(self, ticker, position, current_price, buy_date, current_date, days_ahead):
         days_held = (current_date - buy_date).days
         return days_held >= days_ahead
+    
+    def should_buy_batch(self, snapshot):
+        return snapshot.predictions == 1
+    
+    def should_sell_batch(self, snapshot):
+        return snapshot.get_days_held() >= snapshot.days_ahead
+    
+    def calculate_position_sizes(self, snapshot, candidates, available_capital, num_tickers):
+        return self._sizes_from_budget(snapshot, candidates, available_capital / num_tickers)
+    
+    def get_kernel_rules(self, days_ahead):
+        return {'hold_days': days_ahead}
 
 class AggressiveStrategy(InvestmentStrategy):
     
@@ -60,6 +164,18 @@ class AggressiveStrategy(InvestmentStrategy):
         days_held = (current_date - buy_date).days
         profit_loss = (current_price - position['avg_price']) / position['avg_price']
         return days_held >= days_ahead or profit_loss < -0.05
+    
+    def should_buy_batch(self, snapshot):
+        return snapshot.predictions == 1
+    
+    def should_sell_batch(self, snapshot):
+        return (snapshot.get_days_held() >= snapshot.days_ahead) | (snapshot.get_profit_loss() < -0.05)
+    
+    def calculate_position_sizes(self, snapshot, candidates, available_capital, num_tickers):
+        return self._sizes_from_budget(snapshot, candidates, (available_capital * 0.8) / num_tickers)
+    
+    def get_kernel_rules(self, days_ahead):
+        return {'hold_days': days_ahead, 'stop_loss': -0.05, 'budget_fraction': 0.8}
 
 class ConservativeStrategy(InvestmentStrategy):
     
@@ -81,21 +197,91 @@ class ConservativeStrategy(InvestmentStrategy):
         return (days_held >= days_ahead * 1.5 or 
                 profit_loss > 0.10 or 
                 profit_loss < -0.03)
+    
+    def should_buy_batch(self, snapshot):
+        return snapshot.predictions == 1
+    
+    def should_sell_batch(self, snapshot):
+        profit_loss = snapshot.get_profit_loss()
+        return (snapshot.get_days_held() >= snapshot.days_ahead * 1.5) | (profit_loss > 0.10) | (profit_loss < -0.03)
+    
+    def calculate_position_sizes(self, snapshot, candidates, available_capital, num_tickers):
+        return self._sizes_from_budget(snapshot, candidates, (available_capital * 0.5) / num_tickers)
+    
+    def get_kernel_rules(self, days_ahead):
+        return {'hold_days': days_ahead * 1.5, 'stop_loss': -0.03, 'take_profit': 0.10, 'budget_fraction': 0.5}
+
+class ConfidenceStrategy(InvestmentStrategy):
+    
+    def __init__(self, top_k=3, min_probability=0.5):
+        super().__init__("Confidence Strategy", f"Kupuj {top_k} najpewniejsze sygnały dnia (prawdopodobieństwo >= {min_probability:.0%})")
+        self.top_k = top_k
+        self.min_probability = min_probability
+    
+    def should_buy(self, ticker, prediction, current_price, portfolio_data, market_data):
+        return prediction == 1
+    
+    def rank_candidates(self, candidates, probabilities):
+        ranked = sorted(candidates, key=lambda ticker: probabilities.get(ticker, 0.5), reverse=True)
+        return [ticker for ticker in ranked if probabilities.get(ticker, 0.5) >= self.min_probability][:self.top_k]
+    
+    def get_allocation_slots(self, num_tickers):
+        return max(1, min(self.top_k, num_tickers))
+    
+    def calculate_position_size(self, ticker, available_capital, num_tickers, current_price):
+        max_per_stock = available_capital / num_tickers
+        shares = int(max_per_stock / current_price)
+        return max(shares, 0)
+    
+    def should_sell(self, ticker, position, current_price, buy_date, current_date, days_ahead):
+        days_held = (current_date - buy_date).days
+        return days_held >= days_ahead
+    
+    def should_buy_batch(self, snapshot):
+        return snapshot.predictions == 1
+    
+    def should_sell_batch(self, snapshot):
+        return snapshot.get_days_held() >= snapshot.days_ahead
+    
+    def rank_candidates_batch(self, snapshot, candidates):
+        probabilities = np.nan_to_num(snapshot.probabilities[candidates], nan=0.5)
+        order = np.argsort(-probabilities, kind='stable')
+        ranked = candidates[order][probabilities[order] >= self.min_probability]
+        return ranked[:self.top_k]
+    
+    def calculate_position_sizes(self, snapshot, candidates, available_capital, num_tickers):
+        return self._sizes_from_budget(snapshot, candidates, available_capital / num_tickers)
+    
+    def get_kernel_rules(self, days_ahead):
+        return {'hold_days': days_ahead, 'rank_by_probability': True, 'top_k': self.top_k,
+                'min_probability': self.min_probability}
 
 class AgentSimulation:
-    def __init__(self, trading_simulator, strategy=None, progress_callback=None):
+    def __init__(self, trading_simulator, strategy=None, progress_callback=None, control=None,
+                 checkpoint_path=None, checkpoint_interval=None, resume=False, result_store=None,
+                 log_directory=AGENT_LOG_DIRECTORY):
         self.trading_simulator = trading_simulator
         self.strategy = strategy or BasicStrategy()
         self.progress_callback = progress_callback
+        self.control = control or SimulationControl()
+        self.monitor = trading_simulator.monitor
+        
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval or DEFAULT_SETTINGS['checkpoint_interval_days']
+        self.resume = resume and checkpoint_path is not None and os.path.exists(checkpoint_path)
+        self.result_store = result_store
+        self.run_id = None
+        self.log_directory = log_directory
         
-        self.clean_agent_logs()
+        if not self.resume:
+            self.clean_agent_logs()
         
         self.agent_portfolio = PortfolioManager(
             trading_simulator.initial_capital,
             trading_simulator.commission
         )
         
-        self.agent_logger = TransactionLogger("agent_logs")
+        self.agent_logger = TransactionLogger(self.log_directory, monitor=self.monitor)
         
         self.positions_with_dates = {}
         
@@ -116,10 +302,11 @@ class AgentSimulation:
         
         self.is_running = False
         self.is_completed = False
+        self.is_cancelled = False
     
     def clean_agent_logs(self):
         try:
-            agent_logs_dir = "agent_logs"
+            agent_logs_dir = self.log_directory
             if os.path.exists(agent_logs_dir):
                 print(f"DEBUG: Usuwam stare pliki z {agent_logs_dir}")
                 shutil.rmtree(agent_logs_dir)
@@ -133,117 +320,214 @@ class AgentSimulation:
         if self.is_running:
             return False, "Symulacja już trwa"
         
-        if not self.trading_simulator.is_trained:
+        if not self.trading_simulator.is_trained and not self.resume:
             return False, "Model nie został wytrenowany"
         
         self.is_running = True
         self.is_completed = False
         self.stats['start_time'] = datetime.now()
+        RUNNING_AGENTS.inc()
         
         print(f"Rozpoczynam symulację agenta ze strategią: {self.strategy.name}")
         
-        self.trading_simulator.reset_simulation()
-        
-        simulation_day = 0
-        total_days = len(self.trading_simulator.trading_dates)
-        
         try:
-            while self.trading_simulator.can_go_next_day():
-                current_date = self.trading_simulator.get_current_date()
-                prices = self.trading_simulator.current_prices
-                
-                self._execute_daily_logic(current_date)
-                
-                self.agent_portfolio.record_daily_value(current_date, prices)
-                
-                self.trading_simulator.next_day()
-                simulation_day += 1
-                
-                if self.progress_callback:
-                    progress = (simulation_day / total_days) * 100
-                    self.progress_callback(simulation_day, total_days, progress)
-            
-            self._final_cleanup()
-            
-            self.stats['end_time'] = datetime.now()
-            self.is_completed = True
-            self.is_running = False
-            
-            self._finalize_simulation()
-            
-            print(f"DEBUG: Końcowa liczba rekordów w daily_portfolio_value: {len(self.agent_portfolio.daily_portfolio_value)}")
-            
-            return True, "Symulacja agenta zakończona pomyślnie"
+            if self.resume:
+                self._resume_from_checkpoint()
+            else:
+                self.trading_simulator.reset_simulation()
+            
+            simulation_day = self.trading_simulator.current_date_index
+            total_days = len(self.trading_simulator.trading_dates)
+            
+            with self.monitor.capture():
+                while self.trading_simulator.can_go_next_day():
+                    if not self.control.checkpoint():
+                        self.is_cancelled = True
+                        break
+                    
+                    self.process_day(self.trading_simulator.get_current_date())
+                    
+                    self.trading_simulator.next_day()
+                    simulation_day += 1
+                    AGENT_DAYS.inc()
+                    
+                    if self.checkpoint_path and simulation_day % self.checkpoint_interval == 0:
+                        self.save_checkpoint()
+                    
+                    last_day = not self.trading_simulator.can_go_next_day()
+                    if self.progress_callback and self.control.should_report(force=last_day):
+                        progress = (simulation_day / total_days) * 100
+                        self.progress_callback(simulation_day, total_days, progress)
+            
+            if self.is_cancelled:
+                if self.checkpoint_path:
+                    self.save_checkpoint()
+                self.is_running = False
+                print(f"Symulacja agenta przerwana po {simulation_day} dniach")
+                return False, f"Symulacja przerwana po {simulation_day} z {total_days} dni"
+            
+            return self.complete_simulation()
             
         except Exception as e:
             self.is_running = False
             return False, f"Błąd podczas symulacji: {str(e)}"
+        
+        finally:
+            RUNNING_AGENTS.dec()
     
-    def _execute_daily_logic(self, current_date):
-        predictions = self.trading_simulator.current_predictions
-        prices = self.trading_simulator.current_prices
+    def process_day(self, current_date):
+        self._execute_daily_logic(current_date)
+        self.agent_portfolio.record_daily_value(current_date, self.trading_simulator.current_prices)
+    
+    def complete_simulation(self):
+        self._final_cleanup()
+        
+        self.stats['end_time'] = datetime.now()
+        self.is_completed = True
+        self.is_running = False
         
-        self._check_sell_signals(current_date, prices)
-        self._check_buy_signals(current_date, predictions, prices)
+        self._finalize_simulation()
+        AGENT_RUNS.inc()
         
-        self.agent_portfolio.record_daily_value(current_date, prices)
+        if self.checkpoint_path:
+            remove_checkpoint(self.checkpoint_path)
         
-        portfolio_summary = self.agent_portfolio.get_portfolio_summary(prices)
-        self.agent_logger.log_daily_portfolio(current_date, portfolio_summary, predictions)
-    def _check_sell_signals(self, current_date, prices):
+        if self.result_store is not None:
+            self.save_result()
+        
+        print(f"DEBUG: Końcowa liczba rekordów w daily_portfolio_value: {len(self.agent_portfolio.daily_portfolio_value)}")
+        
+        return True, "Symulacja agenta zakończona pomyślnie"
+    
+    def get_state(self):
+        return {
+            'strategy': self.strategy.name,
+            'positions_with_dates': self.positions_with_dates,
+            'stats': self.stats,
+            'portfolio': self.agent_portfolio.get_state(),
+            'logger': self.agent_logger.get_state()
+        }
+    
+    def restore_state(self, state):
+        if state['strategy'] != self.strategy.name:
+            raise ValueError(f"Checkpoint dotyczy strategii {state['strategy']}, a nie {self.strategy.name}")
+        
+        self.positions_with_dates = state['positions_with_dates']
+        self.stats = state['stats']
+        self.agent_portfolio.restore_state(state['portfolio'])
+        self.agent_logger.restore_state(state['logger'])
+    
+    def save_checkpoint(self):
+        with self.monitor.phase('agent.checkpoint'):
+            size = save_checkpoint(self.checkpoint_path, {
+                'simulator': self.trading_simulator.get_state(),
+                'agent': self.get_state()
+            })
+        print(f"Zapisano checkpoint {self.checkpoint_path} ({size} B, dzień {self.trading_simulator.current_date_index})")
+    
+    def _resume_from_checkpoint(self):
+        state = load_checkpoint(self.checkpoint_path)
+        self.trading_simulator.restore_state(state['simulator'])
+        self.restore_state(state['agent'])
+        self.resume = False
+        print(f"Wznowiono symulację z checkpointu {self.checkpoint_path} (dzień {self.trading_simulator.current_date_index})")
+    
+    def get_fingerprint(self):
+        return compute_fingerprint(self.trading_simulator, self.strategy)
+    
+    def save_result(self):
+        try:
+            self.run_id = self.result_store.save_run(
+                self.get_fingerprint(),
+                self.trading_simulator.get_config(),
+                self.strategy.name,
+                self.stats,
+                self.agent_portfolio.daily_portfolio_value,
+                self.agent_portfolio.transaction_history
+            )
+            print(f"Zapisano wynik w bazie wyników (run {self.run_id})")
+        except Exception as e:
+            print(f"BŁĄD zapisu wyniku: {e}")
+    
+    def _execute_daily_logic(self, current_date):
+        with self.monitor.phase('agent.daily_logic'):
+            predictions = self.trading_simulator.current_predictions
+            prices = self.trading_simulator.current_prices
+            
+            with self.monitor.phase('agent.snapshot'):
+                snapshot = self.build_snapshot(current_date)
+            with self.monitor.phase('agent.sell_signals'):
+                self._check_sell_signals(current_date, snapshot)
+            with self.monitor.phase('agent.buy_signals'):
+                self._check_buy_signals(current_date, self.build_snapshot(current_date, snapshot))
+            
+            self.agent_portfolio.record_daily_value(current_date, prices)
+            
+            portfolio_summary = self.agent_portfolio.get_portfolio_summary(prices)
+            self.agent_logger.log_daily_portfolio(current_date, portfolio_summary, predictions)
+    
+    def build_snapshot(self, current_date, market=None):
+        # Passing a previous snapshot reuses its market arrays and only refreshes the holdings
+        if market is None:
+            arrays = self.trading_simulator.get_market_arrays()
+            tickers, predictions, prices = arrays['tickers'], arrays['predictions'], arrays['prices']
+            probabilities, tradable = arrays['probabilities'], arrays['tradable']
+        else:
+            tickers, predictions, prices = market.tickers, market.predictions, market.prices
+            probabilities, tradable = market.probabilities, market.tradable
+        
+        shares = np.zeros(len(tickers))
+        avg_prices = np.full(len(tickers), np.nan)
+        buy_dates = np.full(len(tickers), np.datetime64('NaT'), dtype='datetime64[ns]')
+        index = market.index if market is not None else {ticker: i for i, ticker in enumerate(tickers)}
+        
+        for ticker, position in self.agent_portfolio.positions.items():
+            if ticker in index:
+                shares[index[ticker]] = position['shares']
+                avg_prices[index[ticker]] = position['avg_price']
+        for ticker, position_info in self.positions_with_dates.items():
+            if ticker in index:
+                buy_dates[index[ticker]] = np.datetime64(position_info['buy_date'], 'ns')
+        
+        return MarketSnapshot(
+            current_date, self.trading_simulator.days_ahead, tickers, predictions, prices, probabilities, tradable,
+            shares, avg_prices, buy_dates, self.agent_portfolio, self.trading_simulator.get_current_probabilities()
+        )
+    
+    def _check_sell_signals(self, current_date, snapshot):
+        sell_mask = self.strategy.should_sell_batch(snapshot)
         positions_to_sell = []
         
         for ticker in list(self.positions_with_dates.keys()):
-            if ticker not in prices:
+            position = snapshot.index.get(ticker)
+            if position is None or not snapshot.tradable[position]:
                 continue
-                
-            position_info = self.positions_with_dates[ticker]
-            current_price = prices[ticker]
             
             portfolio_position = self.agent_portfolio.get_position(ticker)
             if portfolio_position['shares'] == 0:
                 del self.positions_with_dates[ticker]
                 continue
             
-            should_sell = self.strategy.should_sell(
-                ticker, portfolio_position, current_price,
-                position_info['buy_date'], current_date,
-                self.trading_simulator.days_ahead
-            )
-            
-            if should_sell:
-                positions_to_sell.append((ticker, portfolio_position['shares'], current_price))
+            if sell_mask[position]:
+                positions_to_sell.append((ticker, portfolio_position['shares'], snapshot.prices[position]))
         
         for ticker, shares, price in positions_to_sell:
             self._execute_sell(ticker, shares, price, current_date)
     
-    def _check_buy_signals(self, current_date, predictions, prices):
+    def _check_buy_signals(self, current_date, snapshot):
         available_cash = self.agent_portfolio.get_available_cash()
-        num_tickers = len(self.trading_simulator.tickers)
+        num_tickers = self.strategy.get_allocation_slots(len(snapshot.tickers))
         
-        for ticker in self.trading_simulator.tickers:
-            if ticker not in predictions or ticker not in prices:
-                continue
-            
-            prediction = predictions[ticker]
-            current_price = prices[ticker]
-            
-            current_position = self.agent_portfolio.get_position(ticker)
-            if current_position['shares'] > 0:
-                continue
-            
-            should_buy = self.strategy.should_buy(
-                ticker, prediction, current_price,
-                self.agent_portfolio.get_portfolio_summary(prices), {}
-            )
-            
-            if should_buy:
-                shares = self.strategy.calculate_position_size(
-                    ticker, available_cash, num_tickers, current_price
-                )
-                
-                if shares > 0:
-                    self._execute_buy(ticker, shares, current_price, current_date, prediction)
+        eligible = snapshot.tradable & (snapshot.shares <= 0)
+        candidates = np.flatnonzero(eligible & self.strategy.should_buy_batch(snapshot))
+        
+        ranked = self.strategy.rank_candidates_batch(snapshot, candidates)
+        sizes = self.strategy.calculate_position_sizes(snapshot, ranked, available_cash, num_tickers)
+        
+        for position, shares in zip(ranked, sizes):
+            if shares > 0:
+                self._execute_buy(snapshot.tickers[position], int(shares), snapshot.prices[position], current_date,
+                                  int(snapshot.predictions[position]))
     
     def _execute_buy(self, ticker, shares, price, date, prediction):
         ticker_row = self.trading_simulator.get_ticker_data_for_date(ticker, date)
@@ -355,11 +639,19 @@ class AgentSimulation:
         self.stats['return_percentage'] = final_portfolio['return_percentage']
         self.stats['accuracy'] = accuracy
         
+        with self.monitor.phase('agent.analytics'):
+            self.stats.update(compute_performance_metrics(
+                self.agent_portfolio.daily_portfolio_value,
+                self.agent_portfolio.transaction_history
+            ))
+        
         self.agent_logger.finalize_logs(final_portfolio)
         self._write_simulation_summary()
+        self.trading_simulator.write_performance_report(self.agent_logger.log_directory)
     
     def _write_simulation_summary(self):
-        summary_file = f"agent_logs/simulation_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        summary_file = os.path.join(self.agent_logger.log_directory,
+                                    f"simulation_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
         
         with open(summary_file, 'w', encoding='utf-8') as f:
             f.write("=" * 80 + "\n")
@@ -374,7 +666,18 @@ class AgentSimulation:
             f.write(f"Kapitał początkowy: {format_currency(self.trading_simulator.initial_capital)}\n")
             f.write(f"Wartość końcowa: {format_currency(self.stats['final_portfolio_value'])}\n")
             f.write(f"Całkowity zwrot: {format_currency(self.stats['total_return'])}\n")
-            f.write(f"Zwrot procentowy: {format_percentage(self.stats['return_percentage'])}\n\n")
+            f.write(f"Zwrot procentowy: {format_percentage(self.stats['return_percentage'])}\n")
+            f.write(f"CAGR: {format_percentage(self.stats['cagr'])}\n\n")
+            
+            f.write("RYZYKO:\n")
+            f.write("-" * 40 + "\n")
+            f.write(f"Zmienność (roczna): {format_percentage(self.stats['volatility'])}\n")
+            f.write(f"Sharpe ratio: {self.stats['sharpe_ratio']:.2f}\n")
+            f.write(f"Sortino ratio: {self.stats['sortino_ratio']:.2f}\n")
+            f.write(f"Maksymalne obsunięcie: {format_percentage(self.stats['max_drawdown'])}\n")
+            f.write(f"Najdłuższe obsunięcie: {self.stats['max_drawdown_duration']} dni\n")
+            f.write(f"Ekspozycja: {format_percentage(self.stats['exposure'])}\n")
+            f.write(f"Obrót (roczny): {self.stats['turnover']:.2f}x\n\n")
             
             f.write("STATYSTYKI TRANSAKCJI:\n")
             f.write("-" * 40 + "\n")
@@ -384,7 +687,9 @@ class AgentSimulation:
             f.write(f"Zyskowne transakcje: {self.stats['profitable_trades']}\n")
             f.write(f"Stratne transakcje: {self.stats['losing_trades']}\n")
             f.write(f"Najlepszy trade: {format_currency(self.stats['best_trade'])}\n")
-            f.write(f"Najgorszy trade: {format_currency(self.stats['worst_trade'])}\n\n")
+            f.write(f"Najgorszy trade: {format_currency(self.stats['worst_trade'])}\n")
+            f.write(f"Win rate (pełne pozycje): {format_percentage(self.stats['win_rate'])}\n")
+            f.write(f"Profit factor: {self.stats['profit_factor']:.2f}\n\n")
             
             f.write("SKUTECZNOŚĆ MODELU:\n")
             f.write("-" * 40 + "\n")
@@ -1,10 +1,17 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-from agent_simulation import AgentSimulation, BasicStrategy, AggressiveStrategy, ConservativeStrategy
+import os
+from agent_simulation import AgentSimulation, BasicStrategy, AggressiveStrategy, ConservativeStrategy, ConfidenceStrategy
 from agent_results_window import AgentResultsWindow
 from strategy_comparison import StrategyComparison
 from strategy_comparison_window import StrategyComparisonWindow
+from performance_report_window import PerformanceReportWindow
+from background_worker import BackgroundWorker
+from simulation_control import SimulationControl
+from checkpoint import get_checkpoint_path
+from result_store import ResultStore
+from result_history_window import ResultHistoryWindow
+from config import DEFAULT_SETTINGS
 from utils import format_currency, format_percentage
 
 class AgentWindow:
@@ -18,21 +25,30 @@ class AgentWindow:
         self.strategies = {
             "Basic Strategy": BasicStrategy(),
             "Aggressive Strategy": AggressiveStrategy(),
-            "Conservative Strategy": ConservativeStrategy()
+            "Conservative Strategy": ConservativeStrategy(),
+            "Confidence Strategy": ConfidenceStrategy()
         }
         
         self.progress_var = None
         self.progress_bar = None
         self.status_label = None
-        self.simulation_thread = None
+        self.worker = None
+        self.control = SimulationControl()
+        self.result_store = None
         
     def show(self):
         self.window = tk.Toplevel(self.parent)
         self.window.title("Agent Simulation")
-        self.window.geometry("800x500")
+        self.window.geometry("800x560")
         self.window.resizable(True, True)
         self.create_widgets()
-        self.update_progress()
+        self.worker = BackgroundWorker(self.window, name="agent_window")
+        
+        try:
+            self.result_store = ResultStore()
+        except Exception as e:
+            print(f"Baza wyników niedostępna: {e}")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
     
     def create_widgets(self):
         main_frame = ttk.Frame(self.window, padding="20")
@@ -79,11 +95,26 @@ class AgentWindow:
         self.compare_button = ttk.Button(buttons_frame, text="PorÃ³wnaj wszystkie strategie", command=self.start_comparison, style="Accent.TButton")
         self.compare_button.pack(side=tk.LEFT, padx=(0, 10))
         
+        self.resume_button = ttk.Button(buttons_frame, text="Wznów z checkpointu", command=self.resume_simulation)
+        self.resume_button.pack(side=tk.LEFT, padx=(0, 10))
+        
         self.stop_button = ttk.Button(buttons_frame, text="Zatrzymaj", command=self.stop_simulation, state="disabled")
         self.stop_button.pack(side=tk.LEFT, padx=(0, 10))
         
+        self.pause_button = ttk.Button(buttons_frame, text="Wstrzymaj", command=self.toggle_pause, state="disabled")
+        self.pause_button.pack(side=tk.LEFT, padx=(0, 10))
+        
         ttk.Button(buttons_frame, text="PokaÅ¼ logi agenta", command=self.show_agent_logs).pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Button(buttons_frame, text="Zamknij", command=self.window.destroy).pack(side=tk.RIGHT)
+        ttk.Button(buttons_frame, text="Raport wydajności", command=self.show_performance_report).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(buttons_frame, text="Historia wyników", command=self.show_result_history).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(buttons_frame, text="Zamknij", command=self.close).pack(side=tk.RIGHT)
+        
+        self.progress_var = tk.DoubleVar(value=0)
+        self.progress_bar = ttk.Progressbar(control_frame, variable=self.progress_var, maximum=100)
+        self.progress_bar.pack(fill=tk.X, pady=(15, 5))
+        
+        self.status_label = ttk.Label(control_frame, text="Gotowy")
+        self.status_label.pack(anchor=tk.W)
     
     def update_strategy_description(self, event=None):
         selected_strategy = self.strategy_combo.get()
@@ -92,104 +123,135 @@ class AgentWindow:
             self.strategy_desc_label.config(text=description)
     
     def progress_callback(self, current_day, total_days, progress):
-        pass
+        self.worker.post_progress(current_day, total_days)
     
-    def start_simulation(self):
-        if self.simulation_thread and self.simulation_thread.is_alive():
+    def on_progress(self, current_day, total_days):
+        if total_days > 0:
+            self.progress_var.set(current_day / total_days * 100)
+        if not self.control.is_paused():
+            self.status_label.config(text=f"Dzień {current_day} z {total_days}")
+    
+    def set_running(self, running):
+        self.start_button.config(state="disabled" if running else "normal")
+        self.compare_button.config(state="disabled" if running else "normal")
+        self.resume_button.config(state="disabled" if running else "normal")
+        self.stop_button.config(state="normal" if running else "disabled")
+        self.pause_button.config(state="normal" if running else "disabled", text="Wstrzymaj")
+        self.strategy_combo.config(state="disabled" if running else "readonly")
+    
+    def get_checkpoint_path(self, strategy_name):
+        return get_checkpoint_path(DEFAULT_SETTINGS['checkpoint_directory'], f"agent_{strategy_name}")
+    
+    def start_simulation(self, resume=False):
+        if self.worker.is_busy():
             messagebox.showwarning("Uwaga", "Symulacja już trwa!")
             return
         
         selected_strategy_name = self.strategy_combo.get()
         selected_strategy = self.strategies[selected_strategy_name]
         
-        self.agent_simulation = AgentSimulation(self.trading_simulator, selected_strategy, self.progress_callback)
-        self.simulation_thread = threading.Thread(target=self.run_simulation_thread, daemon=True)
-        self.simulation_thread.start()
+        self.control.reset()
+        self.agent_simulation = AgentSimulation(self.trading_simulator, selected_strategy, self.progress_callback,
+                                                self.control, checkpoint_path=self.get_checkpoint_path(selected_strategy_name),
+                                                resume=resume, result_store=self.result_store)
+        self.worker.submit(
+            lambda progress, cancel_event: self.agent_simulation.run_simulation(),
+            on_done=self.on_simulation_done,
+            on_progress=self.on_progress,
+            on_error=self.on_error
+        )
         
-        self.start_button.config(state="disabled")
-        self.compare_button.config(state="disabled")
-        self.stop_button.config(state="normal")
-        self.strategy_combo.config(state="disabled")
-        self.status_label.config(text="Rozpoczynanie symulacji...")
+        self.set_running(True)
+        self.progress_var.set(0)
+        self.status_label.config(text="Wznawianie symulacji..." if resume else "Rozpoczynanie symulacji...")
     
-    def run_simulation_thread(self):
-        try:
-            success, message = self.agent_simulation.run_simulation()
-            
-            def update_ui_after_completion():
-                self.start_button.config(state="normal")
-                self.compare_button.config(state="normal")
-                self.stop_button.config(state="disabled")
-                self.strategy_combo.config(state="readonly")
-                
-                if success:
-                    result = messagebox.askyesno("Sukces", f"{message}\n\nCzy chcesz zobaczyć wykresy wyników?")
-                    if result:
-                        self.show_results_window()
-                else:
-                    messagebox.showerror("Błąd", message)
-            
-            self.window.after(0, update_ui_after_completion)
-            
-        except Exception as e:
-            def show_error():
-                self.start_button.config(state="normal")
-                self.compare_button.config(state="normal")
-                self.stop_button.config(state="disabled")
-                self.strategy_combo.config(state="readonly")
-                messagebox.showerror("Błąd", f"Nieoczekiwany błąd: {str(e)}")
-            self.window.after(0, show_error)
+    def resume_simulation(self):
+        checkpoint_path = self.get_checkpoint_path(self.strategy_combo.get())
+        if not os.path.exists(checkpoint_path):
+            messagebox.showinfo("Checkpoint", "Brak zapisanego checkpointu dla wybranej strategii.")
+            return
+        self.start_simulation(resume=True)
+    
+    def on_simulation_done(self, result):
+        success, message = result
+        self.set_running(False)
+        
+        if self.control.is_cancelled():
+            self.status_label.config(text=message)
+        elif success:
+            self.status_label.config(text=message)
+            result = messagebox.askyesno("Sukces", f"{message}\n\nCzy chcesz zobaczyć wykresy wyników?")
+            if result:
+                self.show_results_window()
+        else:
+            self.status_label.config(text=message)
+            messagebox.showerror("Błąd", message)
+    
+    def on_error(self, error):
+        self.set_running(False)
+        self.status_label.config(text="Błąd symulacji")
+        messagebox.showerror("Błąd", f"Nieoczekiwany błąd: {str(error)}")
         
     def start_comparison(self):
-        if self.simulation_thread and self.simulation_thread.is_alive():
+        if self.worker.is_busy():
             messagebox.showwarning("Uwaga", "Symulacja już trwa!")
             return
         
-        self.comparison = StrategyComparison(self.trading_simulator, self.progress_callback)
-        self.simulation_thread = threading.Thread(target=self.run_comparison_thread, daemon=True)
-        self.simulation_thread.start()
+        self.control.reset()
+        self.comparison = StrategyComparison(self.trading_simulator, self.progress_callback, self.control,
+                                             result_store=self.result_store)
+        self.worker.submit(
+            lambda progress, cancel_event: self.comparison.run_comparison(),
+            on_done=self.on_comparison_done,
+            on_progress=self.on_progress,
+            on_error=self.on_error
+        )
         
-        self.start_button.config(state="disabled")
-        self.compare_button.config(state="disabled")
-        self.stop_button.config(state="normal")
-        self.strategy_combo.config(state="disabled")
+        self.set_running(True)
+        self.progress_var.set(0)
         self.status_label.config(text="Rozpoczynanie porównania strategii...")
     
-    def run_comparison_thread(self):
-        try:
-            results = self.comparison.run_comparison()
-            
-            def update_ui_after_completion():
-                self.start_button.config(state="normal")
-                self.compare_button.config(state="normal")
-                self.stop_button.config(state="disabled")
-                self.strategy_combo.config(state="readonly")
-                
-                result = messagebox.askyesno("Sukces", "Porównanie strategii zakończone!\n\nCzy chcesz zobaczyć wyniki?")
-                if result:
-                    self.show_comparison_window(results)
-            
-            self.window.after(0, update_ui_after_completion)
-            
-        except Exception as e:
-            def show_error():
-                self.start_button.config(state="normal")
-                self.compare_button.config(state="normal")
-                self.stop_button.config(state="disabled")
-                self.strategy_combo.config(state="readonly")
-                messagebox.showerror("Błąd", f"Nieoczekiwany błąd: {str(e)}")
-            self.window.after(0, show_error)
+    def on_comparison_done(self, results):
+        self.set_running(False)
+        
+        if self.control.is_cancelled():
+            self.status_label.config(text=f"Porównanie przerwane ({len(results)} strategii ukończonych)")
+            return
+        
+        self.status_label.config(text="Porównanie strategii zakończone")
+        result = messagebox.askyesno("Sukces", "Porównanie strategii zakończone!\n\nCzy chcesz zobaczyć wyniki?")
+        if result:
+            self.show_comparison_window(results)
     
     def show_results_window(self):
         results_window = AgentResultsWindow(self.window, self.agent_simulation)
         results_window.show()
     
     def show_comparison_window(self, results):
-        comparison_window = StrategyComparisonWindow(self.window, results)
+        comparison_window = StrategyComparisonWindow(self.window, results, self.trading_simulator)
         comparison_window.show()
     
     def stop_simulation(self):
-        messagebox.showinfo("Info", "Symulacja zostanie zatrzymana po zakończeniu bieżącego dnia.")
+        self.control.cancel()
+        self.stop_button.config(state="disabled")
+        self.pause_button.config(state="disabled")
+        self.status_label.config(text="Zatrzymywanie symulacji...")
+    
+    def toggle_pause(self):
+        if self.control.is_paused():
+            self.control.resume()
+            self.pause_button.config(text="Wstrzymaj")
+            self.status_label.config(text="Wznowiono symulację")
+        else:
+            self.control.pause()
+            self.pause_button.config(text="Wznów")
+            self.status_label.config(text="Symulacja wstrzymana")
+    
+    def close(self):
+        self.control.cancel()
+        if self.worker is not None:
+            self.worker.shutdown()
+        self.window.destroy()
     
     def show_agent_logs(self):
         log_info = """Logi agenta zostały zapisane w folderze 'agent_logs':
@@ -204,6 +266,11 @@ Logi są automatycznie aktualizowane podczas symulacji.
 Szczegółowe podsumowanie zostanie zapisane po zakończeniu."""
         messagebox.showinfo("Logi agenta", log_info)
     
-    def update_progress(self):
-        if self.window and self.window.winfo_exists():
-            self.window.after(1000, self.update_progress)
\ No newline at end of file
+    def show_result_history(self):
+        if self.result_store is None:
+            messagebox.showerror("Błąd", "Baza wyników jest niedostępna")
+            return
+        ResultHistoryWindow(self.window, self.result_store).show()
+    
+    def show_performance_report(self):
+        PerformanceReportWindow(self.window, self.trading_simulator.monitor).show()
@@ -0,0 +1,211 @@
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS_PER_YEAR = 252
+DEFAULT_ROLLING_WINDOW = 63
+
+def equity_arrays(daily_portfolio_value):
+    if not daily_portfolio_value:
+        return np.array([], dtype='datetime64[ns]'), np.array([], dtype=float)
+
+    dates = pd.to_datetime([row['date'] for row in daily_portfolio_value]).to_numpy()
+    values = np.array([row['value'] for row in daily_portfolio_value], dtype=float)
+
+    # The agent records its value more than once per day; the last record of a date wins
+    keep = np.append(dates[1:] != dates[:-1], True)
+    return dates[keep], values[keep]
+
+def ledger_arrays(transactions):
+    ledger = pd.DataFrame(transactions)
+    if ledger.empty:
+        return None
+
+    ledger['date'] = pd.to_datetime(ledger['date'])
+    ledger = ledger.sort_values('date', kind='mergesort').reset_index(drop=True)
+
+    is_buy = (ledger['action'] == 'BUY').to_numpy()
+    shares = ledger['shares'].to_numpy(dtype=float)
+    notional = shares * ledger['price'].to_numpy(dtype=float)
+    commission = ledger['commission'].to_numpy(dtype=float) if 'commission' in ledger else np.zeros(len(ledger))
+
+    return {
+        'dates': ledger['date'].to_numpy(),
+        'tickers': ledger['ticker'].to_numpy(),
+        'signed_shares': np.where(is_buy, shares, -shares),
+        'notional': notional,
+        'cash_flow': np.where(is_buy, -(notional + commission), notional - commission)
+    }
+
+def _as_matrix(values):
+    values = np.asarray(values, dtype=float)
+    return values[np.newaxis, :] if values.ndim == 1 else values
+
+def _unwrap(result, single):
+    return {key: value[0] for key, value in result.items()} if single else result
+
+def equity_metrics(values, dates=None, risk_free_rate=0.0, periods_per_year=TRADING_DAYS_PER_YEAR):
+    # values: one equity curve (n_days,) or a batch of equally long curves (n_runs, n_days)
+    single = np.ndim(values) == 1
+    values = _as_matrix(values)
+    n_runs, n_days = values.shape
+
+    if n_days < 2:
+        empty = np.full(n_runs, np.nan)
+        return _unwrap({key: empty for key in ('period_return', 'cagr', 'volatility', 'sharpe_ratio', 'sortino_ratio',
+                                               'max_drawdown', 'max_drawdown_duration')}, single)
+
+    returns = values[:, 1:] / values[:, :-1] - 1
+    excess = returns - risk_free_rate / periods_per_year
+    mean_excess = excess.mean(axis=1)
+    std = returns.std(axis=1, ddof=1)
+    downside = np.sqrt(np.mean(np.minimum(excess, 0) ** 2, axis=1))
+
+    if dates is not None and len(dates) == n_days:
+        years = (pd.Timestamp(dates[-1]) - pd.Timestamp(dates[0])).days / 365.25
+    else:
+        years = (n_days - 1) / periods_per_year
+    growth = values[:, -1] / values[:, 0]
+
+    peaks = np.maximum.accumulate(values, axis=1)
+    drawdowns = values / peaks - 1
+
+    # Days since the last running peak; the longest stretch is the drawdown duration
+    positions = np.broadcast_to(np.arange(n_days), values.shape)
+    last_peak = np.maximum.accumulate(np.where(values >= peaks, positions, 0), axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = {
+            'period_return': (growth - 1) * 100,
+            'cagr': (np.power(growth, 1 / years) - 1) * 100 if years > 0 else np.full(n_runs, np.nan),
+            'volatility': std * np.sqrt(periods_per_year) * 100,
+            'sharpe_ratio': np.where(std > 0, mean_excess / std * np.sqrt(periods_per_year), np.nan),
+            'sortino_ratio': np.where(downside > 0, mean_excess / downside * np.sqrt(periods_per_year), np.nan),
+            'max_drawdown': drawdowns.min(axis=1) * 100,
+            'max_drawdown_duration': (positions - last_peak).max(axis=1)
+        }
+    return _unwrap(result, single)
+
+def rolling_metrics(values, window=DEFAULT_ROLLING_WINDOW, risk_free_rate=0.0, periods_per_year=TRADING_DAYS_PER_YEAR):
+    # Each output column t covers the window of returns ending on day t + window
+    single = np.ndim(values) == 1
+    values = _as_matrix(values)
+    if values.shape[1] <= window:
+        empty = np.empty((values.shape[0], 0))
+        return _unwrap({key: empty for key in ('return', 'volatility', 'sharpe_ratio', 'max_drawdown')}, single)
+
+    returns = values[:, 1:] / values[:, :-1] - 1
+    windows = np.lib.stride_tricks.sliding_window_view(returns, window, axis=1)
+    mean_excess = windows.mean(axis=2) - risk_free_rate / periods_per_year
+    std = windows.std(axis=2, ddof=1)
+
+    equity_windows = np.lib.stride_tricks.sliding_window_view(values, window + 1, axis=1)
+    peaks = np.maximum.accumulate(equity_windows, axis=2)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = {
+            'return': (equity_windows[:, :, -1] / equity_windows[:, :, 0] - 1) * 100,
+            'volatility': std * np.sqrt(periods_per_year) * 100,
+            'sharpe_ratio': np.where(std > 0, mean_excess / std * np.sqrt(periods_per_year), np.nan),
+            'max_drawdown': (equity_windows / peaks - 1).min(axis=2) * 100
+        }
+    return _unwrap(result, single)
+
+def _round_trip_ids(ledger):
+    # A round trip runs from the first buy of a flat ticker until its position is flat again
+    order = np.lexsort((np.arange(len(ledger['tickers'])), ledger['tickers']))
+    tickers = ledger['tickers'][order]
+    held = pd.Series(ledger['signed_shares'][order]).groupby(tickers).cumsum().to_numpy()
+
+    closed = np.isclose(held, 0)
+    new_ticker = np.append(True, tickers[1:] != tickers[:-1])
+    trip_start = new_ticker | np.append(False, closed[:-1])
+    return order, np.cumsum(trip_start) - 1, closed
+
+def round_trip_pnl(ledger):
+    order, trip_ids, closed = _round_trip_ids(ledger)
+    pnl = np.bincount(trip_ids, weights=ledger['cash_flow'][order])
+    is_closed = np.zeros(len(pnl), dtype=bool)
+    is_closed[trip_ids[closed]] = True
+    return pnl[is_closed]
+
+def round_trips(ledger):
+    if ledger is None:
+        return pd.DataFrame(columns=['ticker', 'entry_date', 'exit_date', 'shares', 'entry_price', 'exit_price', 'pnl'])
+
+    order, trip_ids, closed = _round_trip_ids(ledger)
+    signed_shares = ledger['signed_shares'][order]
+    bought = np.maximum(signed_shares, 0)
+    sold = np.maximum(-signed_shares, 0)
+    notional = ledger['notional'][order]
+
+    rows = pd.DataFrame({
+        'trip': trip_ids,
+        'ticker': ledger['tickers'][order],
+        'date': ledger['dates'][order],
+        'bought': bought,
+        'sold': sold,
+        'buy_notional': np.where(signed_shares > 0, notional, 0.0),
+        'sell_notional': np.where(signed_shares < 0, notional, 0.0),
+        'cash_flow': ledger['cash_flow'][order]
+    })
+    trips = rows.groupby('trip', sort=True).agg(
+        ticker=('ticker', 'first'), entry_date=('date', 'first'), exit_date=('date', 'last'),
+        shares=('bought', 'sum'), sold=('sold', 'sum'), buy_notional=('buy_notional', 'sum'),
+        sell_notional=('sell_notional', 'sum'), pnl=('cash_flow', 'sum')
+    )
+    trips = trips.loc[np.unique(trip_ids[closed])]
+
+    trips['entry_price'] = trips['buy_notional'] / trips['shares']
+    trips['exit_price'] = trips['sell_notional'] / trips['sold']
+    trips = trips.sort_values('exit_date', kind='mergesort').reset_index(drop=True)
+    return trips[['ticker', 'entry_date', 'exit_date', 'shares', 'entry_price', 'exit_price', 'pnl']]
+
+def exposure(ledger, equity_dates):
+    order = np.lexsort((np.arange(len(ledger['tickers'])), ledger['tickers']))
+    tickers = ledger['tickers'][order]
+    held = pd.Series(ledger['signed_shares'][order]).groupby(tickers).cumsum().to_numpy()
+
+    is_open = ~np.isclose(held, 0)
+    was_open = np.append(False, is_open[:-1]) & np.append(False, tickers[1:] == tickers[:-1])
+    open_change = np.empty(len(order))
+    open_change[order] = is_open.astype(float) - was_open
+
+    open_positions = np.cumsum(open_change)
+    rows = np.searchsorted(ledger['dates'], equity_dates, side='right') - 1
+    invested = np.where(rows >= 0, open_positions[np.maximum(rows, 0)], 0) > 0
+    return invested.mean() * 100 if len(invested) else 0.0
+
+def trade_metrics(ledger, equity_dates, equity_values, periods_per_year=TRADING_DAYS_PER_YEAR):
+    if ledger is None:
+        return {'trades': 0, 'win_rate': np.nan, 'profit_factor': np.nan, 'turnover': 0.0, 'exposure': 0.0}
+
+    pnl = round_trip_pnl(ledger)
+    gross_profit = pnl[pnl > 0].sum()
+    gross_loss = -pnl[pnl < 0].sum()
+
+    years = max(len(equity_values) - 1, 1) / periods_per_year
+    mean_equity = equity_values.mean() if len(equity_values) else np.nan
+
+    return {
+        'trades': len(pnl),
+        'win_rate': (pnl > 0).mean() * 100 if len(pnl) else np.nan,
+        'profit_factor': gross_profit / gross_loss if gross_loss > 0 else (np.inf if gross_profit > 0 else np.nan),
+        'turnover': ledger['notional'].sum() / mean_equity / years,
+        'exposure': exposure(ledger, equity_dates)
+    }
+
+def compute_performance_metrics(daily_portfolio_value, transactions=None, risk_free_rate=0.0):
+    dates, values = equity_arrays(daily_portfolio_value)
+    metrics = equity_metrics(values, dates, risk_free_rate)
+    metrics = {key: float(value) for key, value in metrics.items()}
+    metrics['max_drawdown_duration'] = int(metrics['max_drawdown_duration']) if len(values) > 1 else 0
+
+    if transactions is not None:
+        trades = trade_metrics(ledger_arrays(transactions), dates, values)
+        metrics.update({key: int(value) if key == 'trades' else float(value) for key, value in trades.items()})
+    return metrics
+
+def compute_rolling_metrics(daily_portfolio_value, window=DEFAULT_ROLLING_WINDOW, risk_free_rate=0.0):
+    dates, values = equity_arrays(daily_portfolio_value)
+    rolling = rolling_metrics(values, window, risk_free_rate)
+    return pd.DataFrame(rolling, index=pd.DatetimeIndex(dates[window:len(dates)], name='date'))
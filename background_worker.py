@@ -0,0 +1,98 @@
+import queue
+import threading
+from metrics import get_metrics_registry
+
+class BackgroundWorker:
+
+    def __init__(self, widget, name="worker", poll_interval=50):
+        self.widget = widget
+        self.name = name
+        self.poll_interval = poll_interval
+        self.results = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.thread = None
+        self.running = False
+        self.callbacks = {}
+        self.poll_job = None
+
+        queue_depth = get_metrics_registry().gauge(
+            'gui_worker_queue_depth', "Messages waiting for the Tk thread", labels={'worker': name}
+        )
+        queue_depth.callback = self.results.qsize
+
+    def is_busy(self):
+        return self.running
+
+    def submit(self, task, on_done=None, on_progress=None, on_error=None):
+        if self.is_busy():
+            raise RuntimeError(f"{self.name} is already running a task")
+
+        self.cancel_event.clear()
+        self.running = True
+        self.callbacks = {'done': on_done, 'progress': on_progress, 'error': on_error}
+        self.thread = threading.Thread(target=self._run, args=(task,), name=self.name, daemon=True)
+        self.thread.start()
+        self._schedule_poll()
+
+    def is_cancelled(self):
+        return self.cancel_event.is_set()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def post_progress(self, current, total):
+        self.results.put(('progress', (current, total)))
+
+    def _run(self, task):
+        try:
+            result = task(self.post_progress, self.cancel_event)
+        except Exception as e:
+            self.results.put(('error', e))
+        else:
+            self.results.put(('done', result))
+
+    def _schedule_poll(self):
+        try:
+            self.poll_job = self.widget.after(self.poll_interval, self._poll)
+        except Exception:
+            self.poll_job = None
+
+    def _poll(self):
+        self.poll_job = None
+        latest_progress = None
+        finished = None
+
+        while True:
+            try:
+                kind, payload = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                latest_progress = payload
+            else:
+                finished = (kind, payload)
+
+        if latest_progress is not None and self.callbacks.get('progress'):
+            self.callbacks['progress'](*latest_progress)
+
+        if finished is None:
+            self._schedule_poll()
+            return
+
+        kind, payload = finished
+        self.running = False
+        callback = self.callbacks.get(kind)
+        self.callbacks = {}
+        if callback is not None:
+            callback(payload)
+        elif kind == 'error':
+            print(f"Error in {self.name}: {str(payload)}")
+
+    def shutdown(self):
+        self.cancel()
+        if self.poll_job is not None:
+            try:
+                self.widget.after_cancel(self.poll_job)
+            except Exception:
+                pass
+            self.poll_job = None
@@ -0,0 +1,249 @@
+import numpy as np
+from analytics import compute_performance_metrics
+from utils import calculate_returns
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        # Without numba the kernel runs as plain Python over the same arrays
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+DAY_NS = 86_400_000_000_000
+INITIAL_TRADE_CAPACITY = 1024
+
+# Trade rows: day, column, side (1 buy / -1 sell), shares, price, commission, entry price, entry prediction
+TRADE_FIELDS = 8
+
+DEFAULT_RULES = {
+    'hold_days': np.inf,
+    'stop_loss': -np.inf,
+    'take_profit': np.inf,
+    'budget_fraction': 1.0,
+    'rank_by_probability': False,
+    'top_k': None,
+    'min_probability': -np.inf
+}
+
+@njit(cache=True)
+def _record_trade(trades, count, day, column, side, shares, price, fee, entry_price, prediction):
+    if count == trades.shape[0]:
+        grown = np.empty((2 * trades.shape[0], TRADE_FIELDS))
+        grown[:count] = trades[:count]
+        trades = grown
+
+    trades[count, 0] = day
+    trades[count, 1] = column
+    trades[count, 2] = side
+    trades[count, 3] = shares
+    trades[count, 4] = price
+    trades[count, 5] = fee
+    trades[count, 6] = entry_price
+    trades[count, 7] = prediction
+    return trades
+
+@njit(cache=True)
+def backtest_kernel(open_prices, close_prices, predictions, probabilities, tradable, day_ns, final_prices,
+                    initial_capital, commission, slots, hold_days, stop_loss, take_profit, budget_fraction,
+                    rank_by_probability, top_k, min_probability):
+    n_days, n_tickers = close_prices.shape
+    cash = initial_capital
+
+    shares = np.zeros(n_tickers, np.int64)
+    avg_prices = np.zeros(n_tickers)
+    buy_ns = np.zeros(n_tickers, np.int64)
+    entry_predictions = np.zeros(n_tickers, np.int64)
+
+    # Open positions in the order they were opened, which is the order AgentSimulation sells and values them in
+    held = np.empty(n_tickers, np.int64)
+    n_held = 0
+
+    candidates = np.empty(n_tickers, np.int64)
+    scores = np.empty(n_tickers)
+    equity = np.empty(max(n_days - 1, 0))
+    trades = np.empty((INITIAL_TRADE_CAPACITY, TRADE_FIELDS))
+    n_trades = 0
+
+    # Like AgentSimulation, the last day only liquidates what is left
+    for day in range(n_days - 1):
+        kept = 0
+        for k in range(n_held):
+            column = held[k]
+            price = close_prices[day, column]
+            sell = False
+            if tradable[day, column]:
+                profit_loss = (price - avg_prices[column]) / avg_prices[column]
+                days_held = (day_ns[day] - buy_ns[column]) // DAY_NS
+                sell = days_held >= hold_days or profit_loss < stop_loss or profit_loss > take_profit
+
+            if sell:
+                revenue = shares[column] * price
+                fee = revenue * commission
+                cash += revenue - fee
+                trades = _record_trade(trades, n_trades, day, column, -1, shares[column], price, fee,
+                                       avg_prices[column], entry_predictions[column])
+                n_trades += 1
+                shares[column] = 0
+            else:
+                held[kept] = column
+                kept += 1
+        n_held = kept
+
+        n_candidates = 0
+        for column in range(n_tickers):
+            if tradable[day, column] and shares[column] <= 0 and predictions[day, column] == 1:
+                candidates[n_candidates] = column
+                probability = probabilities[day, column]
+                scores[n_candidates] = 0.5 if np.isnan(probability) else probability
+                n_candidates += 1
+
+        if rank_by_probability:
+            order = np.argsort(-scores[:n_candidates], kind='mergesort')
+        else:
+            order = np.arange(n_candidates)
+
+        # Positions are sized from the cash left after the sells; a buy that no longer fits at the Open is skipped
+        budget = cash * budget_fraction / slots
+        ranked = 0
+        for k in order:
+            if ranked == top_k:
+                break
+            if rank_by_probability and scores[k] < min_probability:
+                break
+            ranked += 1
+
+            column = candidates[k]
+            size = max(int(budget / close_prices[day, column]), 0)
+            if size <= 0:
+                continue
+
+            price = open_prices[day, column]
+            cost = size * price
+            fee = cost * commission
+            if cost + fee > cash:
+                continue
+
+            cash -= cost + fee
+            shares[column] = size
+            avg_prices[column] = price
+            buy_ns[column] = day_ns[day]
+            entry_predictions[column] = predictions[day, column]
+            held[n_held] = column
+            n_held += 1
+            trades = _record_trade(trades, n_trades, day, column, 1, size, price, fee, price, predictions[day, column])
+            n_trades += 1
+
+        value = cash
+        for k in range(n_held):
+            column = held[k]
+            value += shares[column] * (close_prices[day, column] if tradable[day, column] else avg_prices[column])
+        equity[day] = value
+
+    last_day = n_days - 1
+    kept = 0
+    for k in range(n_held):
+        column = held[k]
+        price = final_prices[column]
+        if np.isnan(price):
+            held[kept] = column
+            kept += 1
+            continue
+
+        revenue = shares[column] * price
+        fee = revenue * commission
+        cash += revenue - fee
+        trades = _record_trade(trades, n_trades, last_day, column, -1, shares[column], price, fee,
+                               avg_prices[column], entry_predictions[column])
+        n_trades += 1
+        shares[column] = 0
+    n_held = kept
+
+    final_value = cash
+    for k in range(n_held):
+        column = held[k]
+        final_value += shares[column] * (close_prices[last_day, column] if tradable[last_day, column] else avg_prices[column])
+
+    return equity, trades[:n_trades], final_value
+
+def _trade_stats(trades):
+    sells = trades[trades[:, 2] < 0]
+    profit_loss = (sells[:, 4] - sells[:, 6]) * sells[:, 3]
+    actual_direction = (sells[:, 4] - sells[:, 6] > 0).astype(int)
+
+    return {
+        'total_transactions': len(trades),
+        'buy_transactions': int(np.count_nonzero(trades[:, 2] > 0)),
+        'sell_transactions': len(sells),
+        'correct_predictions': int(np.count_nonzero(sells[:, 7] == actual_direction)),
+        'total_predictions': int(np.count_nonzero(trades[:, 2] > 0)),
+        'profitable_trades': int(np.count_nonzero(profit_loss > 0)),
+        'losing_trades': int(np.count_nonzero(profit_loss <= 0)),
+        'total_profit_loss': float(profit_loss.sum()),
+        'best_trade': float(max(profit_loss.max(initial=0), 0)),
+        'worst_trade': float(min(profit_loss.min(initial=0), 0))
+    }
+
+def run_backtest(trading_simulator, strategy, arrays=None):
+    rules = strategy.get_kernel_rules(trading_simulator.days_ahead)
+    if rules is None:
+        raise ValueError(f"Strategia {strategy.name} nie ma reguł dla kernela backtestu")
+    rules = {**DEFAULT_RULES, **rules}
+
+    if arrays is None:
+        arrays = trading_simulator.get_backtest_arrays()
+    tickers = arrays['tickers']
+    dates = arrays['dates']
+    initial_capital = float(trading_simulator.initial_capital)
+
+    equity, trades, final_value = backtest_kernel(
+        arrays['open_prices'], arrays['close_prices'], arrays['predictions'], arrays['probabilities'],
+        arrays['tradable'], np.asarray(dates, dtype='datetime64[ns]').view(np.int64), arrays['final_prices'], initial_capital,
+        float(trading_simulator.commission), strategy.get_allocation_slots(len(tickers)),
+        float(rules['hold_days']), float(rules['stop_loss']), float(rules['take_profit']),
+        float(rules['budget_fraction']), bool(rules['rank_by_probability']),
+        len(tickers) if rules['top_k'] is None else int(rules['top_k']), float(rules['min_probability'])
+    )
+
+    transactions = []
+    trade_dates = dates[trades[:, 0].astype(int)]
+    trade_tickers = np.asarray(tickers, dtype=object)[trades[:, 1].astype(int)]
+    for date, ticker, (side, shares, price, fee) in zip(trade_dates, trade_tickers, trades[:, 2:6].tolist()):
+        transaction = {
+            'date': date,
+            'ticker': ticker,
+            'action': 'BUY' if side > 0 else 'SELL',
+            'shares': int(shares),
+            'price': price,
+            'commission': fee
+        }
+        if side > 0:
+            transaction['total_cost'] = shares * price + fee
+        else:
+            transaction['net_revenue'] = shares * price - fee
+        transactions.append(transaction)
+
+    daily_portfolio_value = [
+        {'date': date, 'value': value, 'return': calculate_returns(initial_capital, value)}
+        for date, value in zip(dates[:len(equity)], equity.tolist())
+    ]
+
+    stats = _trade_stats(trades)
+    stats.update({
+        'final_portfolio_value': final_value,
+        'total_return': final_value - initial_capital,
+        'return_percentage': calculate_returns(initial_capital, final_value),
+        'accuracy': stats['correct_predictions'] / stats['total_predictions'] * 100 if stats['total_predictions'] else 0
+    })
+    stats.update(compute_performance_metrics(daily_portfolio_value, transactions))
+
+    return {
+        'daily_portfolio_value': daily_portfolio_value,
+        'transactions': transactions,
+        'stats': stats,
+        'initial_capital': initial_capital
+    }
@@ -0,0 +1,208 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pandas as pd
+from data.data_loader import DataLoader
+from data.data_processor import DataProcessor
+from data.providers import SyntheticProvider
+from trading_simulator import TradingSimulator
+from agent_simulation import AgentSimulation, BasicStrategy
+from backtest_kernel import run_backtest
+from strategy_comparison import StrategyComparison
+from transaction_logger import TransactionLogger
+from analytics import equity_metrics, rolling_metrics
+
+BENCHMARK_CASES = {}
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+STARTUP_MODULES = ['main_window', 'trading_simulator', 'simulation_window', 'agent_window']
+
+DEFAULT_INDICATORS = ['SMA', 'EMA', 'RSI', 'MACD', 'Bollinger Bands', 'ATR']
+DEFAULT_FEATURES = ['Close', 'Volume']
+TEST_WINDOW_DAYS = 252
+LOGGER_WRITES_PER_TICKER = 20
+
+def benchmark_case(name, unit, has_variants=False, scaled=True):
+    def decorator(func):
+        BENCHMARK_CASES[name] = {'func': func, 'unit': unit, 'has_variants': has_variants, 'scaled': scaled}
+        return func
+    return decorator
+
+
+class BenchmarkContext:
+
+    def __init__(self, universe_size, history_length, model_type='Decision Tree', days_ahead=1, seed=42):
+        self.universe_size = universe_size
+        self.history_length = history_length
+        self.model_type = model_type
+        self.days_ahead = days_ahead
+
+        self.provider = SyntheticProvider(n_days=history_length, seed=seed)
+        self.tickers = self.provider.make_tickers(universe_size)
+
+        dates = pd.bdate_range(self.provider.start_date, periods=history_length)
+        test_days = min(TEST_WINDOW_DAYS, history_length // 4)
+        self.start_date = dates[-test_days]
+        self.end_date = dates[-1]
+
+        self.processor = DataProcessor()
+
+    def load_raw(self):
+        return {ticker: DataLoader(ticker, self.provider).load_data() for ticker in self.tickers}
+
+    def load_indicators(self):
+        return {
+            ticker: self.processor.calculate_technical_indicators(data, DEFAULT_INDICATORS, DEFAULT_FEATURES)
+            for ticker, data in self.load_raw().items()
+        }
+
+    def create_simulator(self, model_type=None):
+        return TradingSimulator(
+            tickers=self.tickers,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            model_type=model_type or self.model_type,
+            commission=0.002,
+            days_ahead=self.days_ahead,
+            initial_capital=10000.0 * self.universe_size,
+            indicators=DEFAULT_INDICATORS,
+            selected_features=DEFAULT_FEATURES,
+            data_provider=self.provider
+        )
+
+    def create_trained_simulator(self, model_type=None):
+        simulator = self.create_simulator(model_type)
+        simulator.setup()
+        simulator.train_models()
+        simulator.get_predictions_for_current_date()
+        return simulator
+
+
+@benchmark_case('data_load', unit='tickers')
+def bench_data_load(context):
+    def run():
+        context.load_raw()
+    return run, context.universe_size
+
+
+@benchmark_case('technical_indicators', unit='tickers')
+def bench_technical_indicators(context):
+    raw_data = context.load_raw()
+
+    def run():
+        for data in raw_data.values():
+            context.processor.calculate_technical_indicators(data, DEFAULT_INDICATORS, DEFAULT_FEATURES)
+    return run, context.universe_size
+
+
+@benchmark_case('target_split', unit='tickers')
+def bench_target_split(context):
+    indicator_data = context.load_indicators()
+
+    def run():
+        for data in indicator_data.values():
+            data = context.processor.make_target(data, context.days_ahead)
+            context.processor.split_data(data, context.start_date, context.end_date, context.days_ahead)
+    return run, context.universe_size
+
+
+@benchmark_case('train_models', unit='tickers', has_variants=True)
+def bench_train_models(context, model_type):
+    simulator = context.create_simulator(model_type)
+    simulator.setup()
+
+    def run():
+        simulator.train_models()
+    return run, context.universe_size
+
+
+@benchmark_case('next_day', unit='days')
+def bench_next_day(context):
+    simulator = context.create_trained_simulator()
+
+    def run():
+        while simulator.can_go_next_day():
+            simulator.next_day()
+    return run, len(simulator.trading_dates) - 1
+
+
+@benchmark_case('advance', unit='days')
+def bench_advance(context):
+    simulator = context.create_trained_simulator()
+
+    def run():
+        simulator.advance(len(simulator.trading_dates))
+    return run, len(simulator.trading_dates) - 1
+
+
+@benchmark_case('agent_simulation', unit='days')
+def bench_agent_simulation(context):
+    simulator = context.create_trained_simulator()
+    agent = AgentSimulation(simulator)
+
+    def run():
+        success, message = agent.run_simulation()
+        if not success:
+            raise RuntimeError(message)
+    return run, len(simulator.trading_dates) - 1
+
+
+@benchmark_case('backtest_kernel', unit='days')
+def bench_backtest_kernel(context):
+    simulator = context.create_trained_simulator()
+    arrays = simulator.get_backtest_arrays()
+    strategy = BasicStrategy()
+    # First call compiles the kernel when numba is installed
+    run_backtest(simulator, strategy, arrays)
+
+    def run():
+        run_backtest(simulator, strategy, arrays)
+    return run, len(simulator.trading_dates) - 1
+
+
+@benchmark_case('strategy_comparison', unit='strategy-days')
+def bench_strategy_comparison(context):
+    simulator = context.create_trained_simulator()
+    comparison = StrategyComparison(simulator)
+
+    def run():
+        comparison.run_comparison()
+    return run, (len(simulator.trading_dates) - 1) * len(comparison.strategies)
+
+
+@benchmark_case('logger_write', unit='writes')
+def bench_logger_write(context):
+    logger = TransactionLogger("benchmark_logs")
+    dates = pd.bdate_range(context.start_date, periods=LOGGER_WRITES_PER_TICKER)
+    portfolio_summary = {
+        'cash': 10000.0, 'total_value': 10000.0, 'total_return': 0.0, 'return_percentage': 0.0, 'positions': []
+    }
+
+    def run():
+        for date in dates:
+            for ticker in context.tickers:
+                logger.log_transaction(date, ticker, "BUY", 10, 100.0, 2.0, 1002.0)
+            logger.log_daily_portfolio(date, portfolio_summary, {ticker: 1 for ticker in context.tickers})
+    return run, len(dates) * (context.universe_size + 1)
+
+
+@benchmark_case('analytics', unit='runs')
+def bench_analytics(context):
+    # One equity curve per ticker stands in for a sweep of that many runs
+    equity = pd.DataFrame({ticker: data['Close'] for ticker, data in context.load_raw().items()}).to_numpy().T
+
+    def run():
+        equity_metrics(equity)
+        rolling_metrics(equity)
+    return run, context.universe_size
+
+
+@benchmark_case('startup_import', unit='imports', has_variants=True, scaled=False)
+def bench_startup_import(context, module_name):
+    command = [sys.executable, '-c', f"import {module_name}"]
+    env = dict(os.environ, MPLBACKEND='Agg')
+
+    def run():
+        subprocess.run(command, cwd=PROJECT_ROOT, env=env, check=True, capture_output=True)
+    return run, 1
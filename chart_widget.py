@@ -1,12 +1,84 @@
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import PolyCollection
 from matplotlib.figure import Figure
+import matplotlib.dates as mdates
 import pandas as pd
 import numpy as np
 from config import CHART_COLORS
 
+LINE_POINTS_PER_PIXEL = 1
+BAR_MIN_PIXELS = 2
+BAR_WIDTH = 0.8
+
+def lttb_indices(x, y, threshold):
+    valid = np.flatnonzero(np.isfinite(y))
+    n = len(valid)
+    if threshold < 3 or n <= threshold:
+        return valid
+    
+    x = x[valid]
+    y = y[valid]
+    every = (n - 2) / (threshold - 2)
+    edges = (np.arange(threshold - 1) * every).astype(int) + 1
+    edges[-1] = n - 1
+    
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    
+    return valid[selected]
+
+def bucket_bounds(n, n_buckets):
+    n_buckets = max(1, min(n, n_buckets))
+    starts = (np.arange(n_buckets) * n) // n_buckets
+    ends = np.append(starts[1:], n)
+    return starts, ends
+
+def bucket_centers(x, starts, ends):
+    return (x[starts] + x[ends - 1]) / 2
+
+def bar_vertices(x, values, n_buckets):
+    if len(x) == 0:
+        return np.empty((0, 4, 2))
+    
+    starts, ends = bucket_bounds(len(x), n_buckets)
+    values = np.nan_to_num(values)
+    highs = np.maximum.reduceat(values, starts)
+    lows = np.minimum.reduceat(values, starts)
+    heights = np.where(np.abs(highs) >= np.abs(lows), highs, lows)
+    
+    step = np.median(np.diff(x)) if len(x) > 1 else 1.0
+    centers = bucket_centers(x, starts, ends)
+    half_widths = (x[ends - 1] - x[starts] + step) * BAR_WIDTH / 2
+    left = centers - half_widths
+    right = centers + half_widths
+    zeros = np.zeros_like(heights)
+    
+    return np.stack([
+        np.column_stack([left, zeros]),
+        np.column_stack([left, heights]),
+        np.column_stack([right, heights]),
+        np.column_stack([right, zeros])
+    ], axis=1)
+
+def band_envelope(x, upper, lower, n_buckets):
+    if len(x) <= n_buckets:
+        return x, upper, lower
+    
+    starts, ends = bucket_bounds(len(x), n_buckets)
+    return bucket_centers(x, starts, ends), np.fmax.reduceat(upper, starts), np.fmin.reduceat(lower, starts)
+
 class ChartWidget:
     def __init__(self, parent):
         self.parent = parent
@@ -18,6 +90,17 @@ class ChartWidget:
         self.current_indicators = []
         self.current_date = None  
         
+        self.axes = []
+        self.lines = []
+        self.collections = []
+        self.date_marker = None
+        self.layout_key = None
+        self.data_key = None
+        self.plot_x = None
+        self.plot_values = {}
+        self.rendered_ranges = {}
+        self.updating = False
+        
         self.create_widget()
         
     def create_widget(self):
@@ -127,103 +210,211 @@ class ChartWidget:
         filtered_data = self.filter_data_by_period(data, current_date)
         
         if filtered_data is None or filtered_data.empty:
-            self.figure.clear()
-            self.canvas.draw()
+            self.clear_chart()
+            self.canvas.draw_idle()
             return
         
-        self.figure.clear()
-        
         selected_indicators = [ind for ind, var in self.indicator_vars.items() if var.get()]
+        dates = filtered_data.index if 'Date' not in filtered_data.columns else pd.DatetimeIndex(filtered_data['Date'])
+        
+        current_timestamp = pd.to_datetime(current_date) if current_date is not None else None
+        
+        # Advancing a day slides the window and rescales the axes, so it always needs a full redraw
+        layout_key = (tuple(selected_indicators), tuple(filtered_data.columns))
+        data_key = (ticker, len(filtered_data), dates[0], dates[-1], current_timestamp)
+        layout_changed = layout_key != self.layout_key
+        
+        if layout_changed:
+            self.build_layout(filtered_data, dates, selected_indicators)
+            self.layout_key = layout_key
+        
+        self.axes[0].set_title(f'{ticker} - Price Chart', fontsize=14, fontweight='bold')
+        self.figure.suptitle(f'{ticker} Technical Analysis', fontsize=16, fontweight='bold')
+        
+        marker_visible = current_timestamp is not None and dates.isin([current_timestamp]).any()
+        self.date_marker.set_visible(bool(marker_visible))
+        if marker_visible:
+            self.date_marker.set_xdata([current_timestamp, current_timestamp])
+        
+        if not layout_changed and data_key == self.data_key:
+            return
+        
+        if not layout_changed:
+            self.update_artists(filtered_data, dates)
+        self.data_key = data_key
+        self.canvas.draw_idle()
+    
+    def clear_chart(self):
+        self.figure.clear()
+        self.axes = []
+        self.lines = []
+        self.collections = []
+        self.date_marker = None
+        self.layout_key = None
+        self.data_key = None
+        self.plot_x = None
+        self.plot_values = {}
+        self.rendered_ranges = {}
+    
+    def build_layout(self, data, dates, selected_indicators):
+        self.clear_chart()
         
         has_oscillators = any(ind in selected_indicators for ind in ['RSI', 'MACD'])
+        show_volume = 'Volume' in selected_indicators
         
         if has_oscillators:
             gs = self.figure.add_gridspec(3, 1, height_ratios=[3, 1, 1], hspace=0.3)
             ax1 = self.figure.add_subplot(gs[0])
             ax2 = self.figure.add_subplot(gs[1])
             ax3 = self.figure.add_subplot(gs[2])
-        else:
+        elif show_volume:
             gs = self.figure.add_gridspec(2, 1, height_ratios=[3, 1], hspace=0.3)
             ax1 = self.figure.add_subplot(gs[0])
             ax2 = self.figure.add_subplot(gs[1])
             ax3 = None
+        else:
+            gs = self.figure.add_gridspec(2, 1, height_ratios=[3, 1], hspace=0.3)
+            ax1 = self.figure.add_subplot(gs[0])
+            ax2 = None
+            ax3 = None
         
-        dates = filtered_data.index if 'Date' not in filtered_data.columns else filtered_data['Date']
+        for ax in (ax1, ax2, ax3):
+            if ax is not None:
+                ax.xaxis_date()
+                ax.callbacks.connect('xlim_changed', self.on_xlim_changed)
         
-        ax1.plot(dates, filtered_data['Close'], label='Close Price', 
-                color=CHART_COLORS['price'], linewidth=1.5)
+        self.add_line(ax1, 'Close', label='Close Price', color=CHART_COLORS['price'], linewidth=1.5)
         
         if 'SMA' in selected_indicators:
-            for col in filtered_data.columns:
+            for col in data.columns:
                 if 'SMA' in col:
-                    ax1.plot(dates, filtered_data[col], label=col, 
-                            color=CHART_COLORS['sma'], alpha=0.7)
+                    self.add_line(ax1, col, label=col, color=CHART_COLORS['sma'], alpha=0.7)
         
         if 'EMA' in selected_indicators:
-            for col in filtered_data.columns:
+            for col in data.columns:
                 if 'EMA' in col:
-                    ax1.plot(dates, filtered_data[col], label=col, 
-                            color=CHART_COLORS['ema'], alpha=0.7)
-        
-        if 'Bollinger Bands' in selected_indicators:
-            if 'BB_Upper' in filtered_data.columns:
-                ax1.plot(dates, filtered_data['BB_Upper'], label='BB Upper', 
-                        color=CHART_COLORS['bollinger_upper'], alpha=0.6)
-                ax1.plot(dates, filtered_data['BB_Middle'], label='BB Middle', 
-                        color=CHART_COLORS['bollinger_middle'], alpha=0.6)
-                ax1.plot(dates, filtered_data['BB_Lower'], label='BB Lower', 
-                        color=CHART_COLORS['bollinger_lower'], alpha=0.6)
-                ax1.fill_between(dates, filtered_data['BB_Upper'], filtered_data['BB_Lower'], 
-                               alpha=0.1, color=CHART_COLORS['bollinger_upper'])
-        
-        if current_date and current_date in dates.values if hasattr(dates, 'values') else current_date in dates:
-            ax1.axvline(x=current_date, color='red', linestyle='--', alpha=0.7, label='Current Date')
-        
-        ax1.set_title(f'{ticker} - Price Chart', fontsize=14, fontweight='bold')
+                    self.add_line(ax1, col, label=col, color=CHART_COLORS['ema'], alpha=0.7)
+        
+        if 'Bollinger Bands' in selected_indicators and 'BB_Upper' in data.columns:
+            self.add_line(ax1, 'BB_Upper', label='BB Upper', color=CHART_COLORS['bollinger_upper'], alpha=0.6)
+            self.add_line(ax1, 'BB_Middle', label='BB Middle', color=CHART_COLORS['bollinger_middle'], alpha=0.6)
+            self.add_line(ax1, 'BB_Lower', label='BB Lower', color=CHART_COLORS['bollinger_lower'], alpha=0.6)
+            self.collections.append({'type': 'fill', 'ax': ax1, 'columns': ('BB_Upper', 'BB_Lower'), 'artist': None,
+                                     'kwargs': {'alpha': 0.1, 'color': CHART_COLORS['bollinger_upper']}})
+        
+        self.date_marker = ax1.axvline(x=dates[0], color='red', linestyle='--', alpha=0.7,
+                                       label='Current Date')
+        
         ax1.set_ylabel('Price ($)', fontsize=10)
-        ax1.legend(loc='upper left', fontsize=8)
         ax1.grid(True, alpha=0.3)
         
-        if 'Volume' in selected_indicators and 'Volume' in filtered_data.columns:
-            ax2.bar(dates, filtered_data['Volume'], alpha=0.6, color=CHART_COLORS['volume'])
+        if show_volume and ax2 is not None and 'Volume' in data.columns:
+            self.add_bars(ax2, 'Volume', alpha=0.6, color=CHART_COLORS['volume'])
             ax2.set_ylabel('Volume', fontsize=10)
             ax2.set_title('Volume', fontsize=12)
             ax2.grid(True, alpha=0.3)
         
-        oscillator_ax = ax3 if ax3 is not None else ax2
-        
-        if 'RSI' in selected_indicators and 'RSI_14' in filtered_data.columns:
-            if ax3 is not None:
-                ax2.plot(dates, filtered_data['RSI_14'], label='RSI(14)', 
-                        color=CHART_COLORS['rsi'], linewidth=1.5)
-                ax2.axhline(y=70, color='red', linestyle='--', alpha=0.5)
-                ax2.axhline(y=30, color='green', linestyle='--', alpha=0.5)
-                ax2.set_ylabel('RSI', fontsize=10)
-                ax2.set_title('RSI (14)', fontsize=12)
-                ax2.set_ylim(0, 100)
-                ax2.grid(True, alpha=0.3)
-        
-        if 'MACD' in selected_indicators and 'MACD' in filtered_data.columns:
-            if ax3 is not None:
-                ax3.plot(dates, filtered_data['MACD'], label='MACD', 
-                        color=CHART_COLORS['macd'], linewidth=1.5)
-                if 'MACD_Signal' in filtered_data.columns:
-                    ax3.plot(dates, filtered_data['MACD_Signal'], label='Signal', 
-                            color=CHART_COLORS['macd_signal'], linewidth=1.5)
-                if 'MACD_Hist' in filtered_data.columns:
-                    ax3.bar(dates, filtered_data['MACD_Hist'], alpha=0.3, 
-                           color='gray', label='Histogram')
-                ax3.axhline(y=0, color='black', linestyle='-', alpha=0.5)
-                ax3.set_ylabel('MACD', fontsize=10)
-                ax3.set_title('MACD', fontsize=12)
-                ax3.legend(loc='upper left', fontsize=8)
-                ax3.grid(True, alpha=0.3)
-        
-        if not has_oscillators and 'Volume' not in selected_indicators:
-            ax2.remove()
+        if 'RSI' in selected_indicators and 'RSI_14' in data.columns and ax3 is not None:
+            self.add_line(ax2, 'RSI_14', label='RSI(14)', color=CHART_COLORS['rsi'], linewidth=1.5)
+            ax2.axhline(y=70, color='red', linestyle='--', alpha=0.5)
+            ax2.axhline(y=30, color='green', linestyle='--', alpha=0.5)
+            ax2.set_ylabel('RSI', fontsize=10)
+            ax2.set_title('RSI (14)', fontsize=12)
+            ax2.set_ylim(0, 100)
+            ax2.grid(True, alpha=0.3)
         
-        self.figure.suptitle(f'{ticker} Technical Analysis', fontsize=16, fontweight='bold')
+        if 'MACD' in selected_indicators and 'MACD' in data.columns and ax3 is not None:
+            self.add_line(ax3, 'MACD', label='MACD', color=CHART_COLORS['macd'], linewidth=1.5)
+            if 'MACD_Signal' in data.columns:
+                self.add_line(ax3, 'MACD_Signal', label='Signal', color=CHART_COLORS['macd_signal'], linewidth=1.5)
+            if 'MACD_Hist' in data.columns:
+                self.add_bars(ax3, 'MACD_Hist', alpha=0.3, color='gray', label='Histogram')
+            ax3.axhline(y=0, color='black', linestyle='-', alpha=0.5)
+            ax3.set_ylabel('MACD', fontsize=10)
+            ax3.set_title('MACD', fontsize=12)
+            ax3.grid(True, alpha=0.3)
+        
+        self.axes = [ax for ax in (ax1, ax2, ax3) if ax is not None]
+        self.update_artists(data, dates)
         
-        plt.setp(self.figure.get_axes()[-1].xaxis.get_majorticklabels(), rotation=45)
+        ax1.legend(loc='upper left', fontsize=8)
+        if ax3 is not None and ax3.get_legend_handles_labels()[0]:
+            ax3.legend(loc='upper left', fontsize=8)
+        self.axes[-1].tick_params(axis='x', labelrotation=45)
+    
+    def add_line(self, ax, column, **kwargs):
+        line, = ax.plot([], [], **kwargs)
+        self.lines.append((line, column))
+        return line
+    
+    def add_bars(self, ax, column, **kwargs):
+        bars = PolyCollection([], **kwargs)
+        ax.add_collection(bars, autolim=False)
+        self.collections.append({'type': 'bar', 'ax': ax, 'columns': (column,), 'artist': bars, 'verts': None})
+        return bars
+    
+    def get_point_budget(self, ax):
+        return max(int(ax.bbox.width * LINE_POINTS_PER_PIXEL), 3)
+    
+    def update_artists(self, data, dates):
+        self.plot_x = mdates.date2num(np.asarray(dates.values))
+        columns = {column for _, column in self.lines}
+        columns.update(column for collection in self.collections for column in collection['columns'])
+        self.plot_values = {column: data[column].to_numpy(dtype=float) for column in columns}
+        
+        self.updating = True
+        try:
+            for ax in self.axes:
+                self.render_axis(ax, 0, len(self.plot_x))
+                ax.relim()
+                for collection in self.collections:
+                    if collection['type'] == 'bar' and collection['ax'] is ax and len(collection['verts']):
+                        ax.update_datalim(collection['verts'].reshape(-1, 2))
+                ax.autoscale_view()
+        finally:
+            self.updating = False
+    
+    def render_axis(self, ax, start, end):
+        x = self.plot_x[start:end]
+        n_points = self.get_point_budget(ax)
+        
+        for line, column in self.lines:
+            if line.axes is ax:
+                y = self.plot_values[column][start:end]
+                indices = lttb_indices(x, y, n_points)
+                line.set_data(x[indices], y[indices])
+        
+        for collection in self.collections:
+            if collection['ax'] is not ax:
+                continue
+            
+            columns = collection['columns']
+            if collection['type'] == 'fill':
+                if collection['artist'] is not None:
+                    collection['artist'].remove()
+                band_x, upper, lower = band_envelope(x, self.plot_values[columns[0]][start:end],
+                                                     self.plot_values[columns[1]][start:end], n_points)
+                collection['artist'] = ax.fill_between(band_x, upper, lower, **collection['kwargs'])
+            else:
+                collection['verts'] = bar_vertices(x, self.plot_values[columns[0]][start:end],
+                                                   n_points // BAR_MIN_PIXELS)
+                collection['artist'].set_verts(collection['verts'])
+        
+        self.rendered_ranges[ax] = (start, end)
+    
+    def on_xlim_changed(self, ax):
+        if self.updating or self.plot_x is None or ax not in self.axes:
+            return
+        
+        left, right = ax.get_xlim()
+        start = max(int(np.searchsorted(self.plot_x, left)) - 1, 0)
+        end = min(int(np.searchsorted(self.plot_x, right)) + 1, len(self.plot_x))
+        if end - start < 2 or self.rendered_ranges.get(ax) == (start, end):
+            return
         
-        self.canvas.draw()
\ No newline at end of file
+        self.updating = True
+        try:
+            self.render_axis(ax, start, end)
+        finally:
+            self.updating = False
+        self.canvas.draw_idle()
@@ -0,0 +1,43 @@
+import os
+import pickle
+import zlib
+from datetime import datetime
+from utils import slugify
+
+CHECKPOINT_VERSION = 1
+COMPRESSION_LEVEL = 6
+
+def save_checkpoint(path, state):
+    payload = {
+        'version': CHECKPOINT_VERSION,
+        'created': datetime.now(),
+        'state': state
+    }
+    data = zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL), COMPRESSION_LEVEL)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+    return len(data)
+
+def load_checkpoint(path):
+    # Checkpoints are pickles - only load files written by this application
+    with open(path, 'rb') as f:
+        payload = pickle.loads(zlib.decompress(f.read()))
+
+    if payload.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Nieobsługiwana wersja checkpointu: {payload.get('version')}")
+    return payload['state']
+
+def remove_checkpoint(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def get_checkpoint_path(directory, name):
+    return os.path.join(directory, f"{slugify(name)}.ckpt")
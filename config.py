@@ -1,12 +1,48 @@
 AVAILABLE_MODELS = {
-    'Decision Tree': 'DecisionTreeModel',
-    'Random Forest': 'RandomForestModel', 
-    'SVM': 'SVMModel',
-    'KNN': 'KNNModel',
-    'Logistic Regression': 'LogisticRegressionModel',
-    'Ensemble': 'EnsembleModel'
+    'Decision Tree': {
+        'path': 'ml.models.decision_tree_model:DecisionTreeModel',
+        'config_name': 'DecisionTree',
+        'predict_proba': True, 'partial_fit': False, 'n_jobs': False
+    },
+    'Random Forest': {
+        'path': 'ml.models.random_forest_model:RandomForestModel',
+        'config_name': 'RandomForest',
+        'predict_proba': True, 'partial_fit': False, 'n_jobs': True
+    },
+    'SVM': {
+        'path': 'ml.models.svm_model:SVMModel',
+        'config_name': 'SVM',
+        'predict_proba': False, 'partial_fit': False, 'n_jobs': False
+    },
+    'KNN': {
+        'path': 'ml.models.knn_model:KNNModel',
+        'config_name': 'KNN',
+        'predict_proba': True, 'partial_fit': False, 'n_jobs': True
+    },
+    'Logistic Regression': {
+        'path': 'ml.models.logistic_regression_model:LogisticRegressionModel',
+        'config_name': 'LogisticRegression',
+        'predict_proba': True, 'partial_fit': False, 'n_jobs': False
+    },
+    'Ensemble': {
+        'path': 'ml.models.ensemble_model:EnsembleModel',
+        'config_name': 'Ensemble',
+        'predict_proba': True, 'partial_fit': False, 'n_jobs': True
+    },
+    'Hist Gradient Boosting': {
+        'path': 'ml.models.hist_gradient_boosting_model:HistGradientBoostingModel',
+        'config_name': 'HistGradientBoosting',
+        'predict_proba': True, 'partial_fit': False, 'n_jobs': False
+    },
+    'SGD Online': {
+        'path': 'ml.models.sgd_model:SGDModel',
+        'config_name': 'SGD',
+        'predict_proba': True, 'partial_fit': True, 'n_jobs': True
+    }
 }
 
+MODEL_ENTRY_POINT_GROUP = 'stocksimulator.models'
+
 AVAILABLE_INDICATORS = [
     'SMA',
     'EMA', 
@@ -41,7 +77,38 @@ DEFAULT_SETTINGS = {
     'commission': 0.002,
     'days_ahead': 1,
     'start_date': '2020-01-01',
-    'end_date': '2023-12-31'
+    'end_date': '2023-12-31',
+    'retrain_frequency': 'Brak',
+    'training_window': 'Rozszerzające',
+    'model_mode': 'Osobny model per ticker',
+    'rolling_window_size': 756,
+    'retrain_n_jobs': 4,
+    'warm_start_increment': 10,
+    'profiling': False,
+    'checkpoint_directory': 'checkpoints',
+    'checkpoint_interval_days': 50,
+    'result_store_path': 'results/results.db'
+}
+
+RETRAIN_FREQUENCIES = {
+    'Brak': None,
+    'Co 5 dni': 5,
+    'Co 21 dni': 21,
+    'Co 63 dni': 63,
+    'Miesięcznie': 'monthly'
+}
+
+MODEL_MODES = {
+    'Osobny model per ticker': {'pooled': False, 'encoding': None},
+    'Wspólny model': {'pooled': True, 'encoding': None},
+    'Wspólny + kodowanie tickera': {'pooled': True, 'encoding': 'ticker'},
+    'Wspólny + kodowanie sektora': {'pooled': True, 'encoding': 'sector'},
+    'Wspólny + ticker i sektor': {'pooled': True, 'encoding': 'ticker_sector'}
+}
+
+TRAINING_WINDOWS = {
+    'Rozszerzające': 'expanding',
+    'Kroczące': 'rolling'
 }
 
 CHART_COLORS = {
@@ -81,5 +148,10 @@ AGENT_STRATEGIES_INFO = {
         'description': 'Mniejsze pozycje, take-profit >10%, stop-loss >3%',
         'risk_level': 'Niskie',
         'capital_allocation': '50% kapitału, bezpieczniejsze pozycje'
+    },
+    'Confidence Strategy': {
+        'description': 'Kupuj tylko top-K sygnałów o najwyższym prawdopodobieństwie wzrostu',
+        'risk_level': 'Średnie',
+        'capital_allocation': 'Kapitał dzielony na K najpewniejszych sygnałów'
     }
 }
\ No newline at end of file
@@ -1,19 +1,27 @@
-import yfinance as yf
 import pandas as pd
+from data.providers import YFinanceProvider
 
 class DataLoader:
-    def __init__(self, ticker):
-        self.ticker = ticker 
+    def __init__(self, ticker, provider=None):
+        self.ticker = ticker
+        self.provider = provider or YFinanceProvider()
 
     def load_data(self):
-        data = yf.download(self.ticker, period="max", auto_adjust=True, prepost=True, threads=True)
-        
+        data = self.provider.load_ohlcv(self.ticker)
+
         if isinstance(data.columns, pd.MultiIndex):
             data.columns = [col[0] if isinstance(col, tuple) else col for col in data.columns]
-        
+
         data = data.dropna()
-        
+
         if data.index.name != 'Date':
             data = data.reset_index()
-            
-        return data
\ No newline at end of file
+
+        return data
+
+    def load_sector(self):
+        try:
+            return self.provider.load_sector(self.ticker)
+        except Exception as e:
+            print(f"Warning: Could not load sector for {self.ticker}: {str(e)}")
+            return 'Unknown'
\ No newline at end of file
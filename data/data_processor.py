@@ -1,4 +1,3 @@
-import talib
 import pandas as pd
 import numpy as np
 
@@ -7,6 +6,8 @@ class DataProcessor:
         pass
 
     def calculate_technical_indicators(self, data, indicators, selected_features=None): 
+        import talib
+        
         data_copy = data.copy()
         
         data_copy = data_copy.dropna()
@@ -121,7 +122,7 @@ class DataProcessor:
         data_copy.dropna(inplace=True)
         return data_copy
 
-    def split_data(self, data, date_start, date_end, days_ahead):  
+    def prepare_dataset(self, data):
         data_copy = data.copy()
         
         if 'Date' not in data_copy.columns:
@@ -132,7 +133,10 @@ class DataProcessor:
         else:
             data_copy['Date'] = pd.to_datetime(data_copy['Date'])
         
-        data_copy = data_copy.reset_index(drop=True)
+        return data_copy.reset_index(drop=True)
+
+    def split_data(self, data, date_start, date_end, days_ahead):  
+        data_copy = self.prepare_dataset(data)
         
         date_start = pd.to_datetime(date_start)
         date_end = pd.to_datetime(date_end)
@@ -154,4 +158,21 @@ class DataProcessor:
         test_start_idx_in_data_copy = test_data.index[0] if len(test_data) > 0 else None
         test_end_idx_in_data_copy = test_data.index[-1] if len(test_data) > 0 else None
         
-        return train_data, test_data, test_start_idx_in_data_copy, test_end_idx_in_data_copy
\ No newline at end of file
+        return train_data, test_data, test_start_idx_in_data_copy, test_end_idx_in_data_copy
+
+    def get_training_window(self, position, days_ahead, window_type='expanding', window_size=None):
+        train_end_position = position - days_ahead
+        
+        if train_end_position <= 0:
+            raise ValueError(f"Not enough data before position {position}. Need at least {days_ahead} days.")
+        
+        if window_type == 'rolling':
+            if not window_size or window_size <= 0:
+                raise ValueError("Rolling window requires a positive window size")
+            train_start_position = max(0, train_end_position - window_size)
+        elif window_type == 'expanding':
+            train_start_position = 0
+        else:
+            raise ValueError(f"Unknown training window type: {window_type}")
+        
+        return train_start_position, train_end_position
\ No newline at end of file
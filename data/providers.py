@@ -0,0 +1,133 @@
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ['Close', 'High', 'Low', 'Open', 'Volume']
+
+class DataProvider(ABC):
+
+    @abstractmethod
+    def load_ohlcv(self, ticker):
+        pass
+
+    def load_sector(self, ticker):
+        return 'Unknown'
+
+    def list_tickers(self):
+        return []
+
+class YFinanceProvider(DataProvider):
+
+    def load_ohlcv(self, ticker):
+        import yfinance as yf
+        return yf.download(ticker, period="max", auto_adjust=True, prepost=True, threads=True)
+
+    def load_sector(self, ticker):
+        import yfinance as yf
+        info = yf.Ticker(ticker).info
+        return info.get('sector') or 'Unknown'
+
+class SyntheticProvider(DataProvider):
+    SECTORS = ['Technology', 'Healthcare', 'Financial Services', 'Energy', 'Industrials', 'Consumer Cyclical']
+
+    def __init__(self, n_days=2520, start_date='2010-01-04', seed=42, drift=0.0003, volatility=0.015,
+                 initial_price=100.0):
+        self.n_days = n_days
+        self.start_date = pd.to_datetime(start_date)
+        self.seed = seed
+        self.drift = drift
+        self.volatility = volatility
+        self.initial_price = initial_price
+
+    @staticmethod
+    def make_tickers(count):
+        return [f"SYN{index:04d}" for index in range(count)]
+
+    def _rng(self, ticker):
+        return np.random.default_rng([self.seed, zlib.crc32(ticker.encode('utf-8'))])
+
+    def load_ohlcv(self, ticker):
+        rng = self._rng(ticker)
+        n = self.n_days
+
+        log_returns = rng.normal(self.drift - 0.5 * self.volatility ** 2, self.volatility, n)
+        close = self.initial_price * np.exp(np.cumsum(log_returns))
+        open_ = np.concatenate(([self.initial_price], close[:-1])) * np.exp(rng.normal(0, self.volatility / 4, n))
+        high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, self.volatility / 3, n)))
+        low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, self.volatility / 3, n)))
+        volume = np.round(rng.lognormal(13, 0.4, n) * (1 + 20 * np.abs(log_returns)))
+
+        index = pd.bdate_range(self.start_date, periods=n, name='Date')
+        return pd.DataFrame({'Close': close, 'High': high, 'Low': low, 'Open': open_, 'Volume': volume}, index=index)
+
+    def load_sector(self, ticker):
+        return self.SECTORS[zlib.crc32(ticker.encode('utf-8')) % len(self.SECTORS)]
+
+class LocalDirectoryProvider(DataProvider):
+    EXTENSIONS = ('.parquet', '.csv')
+
+    def __init__(self, directory, sectors=None):
+        self.directory = Path(directory)
+        self.sectors = dict(sectors or {})
+
+        if not self.directory.is_dir():
+            raise ValueError(f"Data directory does not exist: {self.directory}")
+
+    def _find_file(self, ticker):
+        for extension in self.EXTENSIONS:
+            path = self.directory / f"{ticker}{extension}"
+            if path.exists():
+                return path
+        raise FileNotFoundError(f"No CSV/Parquet file for {ticker} in {self.directory}")
+
+    def load_ohlcv(self, ticker):
+        path = self._find_file(ticker)
+
+        if path.suffix == '.parquet':
+            data = pd.read_parquet(path)
+        else:
+            data = pd.read_csv(path)
+
+        if 'Date' in data.columns:
+            data['Date'] = pd.to_datetime(data['Date'])
+            data = data.set_index('Date')
+        data.index = pd.DatetimeIndex(data.index, name='Date')
+
+        missing = [col for col in OHLCV_COLUMNS if col not in data.columns]
+        if missing:
+            raise ValueError(f"{path.name} is missing columns: {missing}")
+
+        return data[OHLCV_COLUMNS].sort_index()
+
+    def load_sector(self, ticker):
+        return self.sectors.get(ticker, 'Unknown')
+
+    def list_tickers(self):
+        return sorted({path.stem for path in self.directory.iterdir() if path.suffix in self.EXTENSIONS})
+
+    @staticmethod
+    def export(provider, tickers, directory, file_format='csv'):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        for ticker in tickers:
+            data = provider.load_ohlcv(ticker)
+            if file_format == 'parquet':
+                data.to_parquet(directory / f"{ticker}.parquet")
+            else:
+                data.to_csv(directory / f"{ticker}.csv")
+
+        return directory
+
+DATA_PROVIDERS = {
+    'yfinance': YFinanceProvider,
+    'synthetic': SyntheticProvider,
+    'local': LocalDirectoryProvider
+}
+
+def create_provider(name, **options):
+    if name not in DATA_PROVIDERS:
+        raise ValueError(f"Unknown data provider '{name}'. Available: {list(DATA_PROVIDERS.keys())}")
+    return DATA_PROVIDERS[name](**options)
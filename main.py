@@ -2,6 +2,7 @@
 
 import sys
 import os
+import importlib.util
 import tkinter as tk
 from tkinter import messagebox
 import warnings
@@ -9,38 +10,20 @@ import warnings
 warnings.filterwarnings('ignore', category=FutureWarning)
 warnings.filterwarnings('ignore', category=UserWarning)
 
+REQUIRED_PACKAGES = {
+    'pandas': 'pandas',
+    'numpy': 'numpy',
+    'yfinance': 'yfinance',
+    'talib': 'TA-Lib',
+    'sklearn': 'scikit-learn',
+    'matplotlib': 'matplotlib'
+}
+
 def check_dependencies():
-    missing_packages = []
-    
-    try:
-        import pandas
-    except ImportError:
-        missing_packages.append('pandas')
-    
-    try:
-        import numpy
-    except ImportError:
-        missing_packages.append('numpy')
-    
-    try:
-        import yfinance
-    except ImportError:
-        missing_packages.append('yfinance')
-    
-    try:
-        import talib
-    except ImportError:
-        missing_packages.append('TA-Lib')
-    
-    try:
-        import sklearn
-    except ImportError:
-        missing_packages.append('scikit-learn')
-    
-    try:
-        import matplotlib
-    except ImportError:
-        missing_packages.append('matplotlib')
+    missing_packages = [
+        package for module, package in REQUIRED_PACKAGES.items()
+        if importlib.util.find_spec(module) is None
+    ]
     
     if missing_packages:
         error_msg = f"Missing required packages: {', '.join(missing_packages)}\n\n"
@@ -53,13 +36,7 @@ def check_dependencies():
         sys.exit(1)
 
 def setup_matplotlib():
-    try:
-        import matplotlib
-        matplotlib.use('TkAgg')
-        import matplotlib.pyplot as plt
-        plt.style.use('default')
-    except Exception as e:
-        print(f"Warning: Could not setup matplotlib properly: {e}")
+    os.environ.setdefault('MPLBACKEND', 'TkAgg')
 
 def main():
     try:
@@ -1,18 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, timedelta
-from config import AVAILABLE_MODELS, AVAILABLE_INDICATORS, DEFAULT_SETTINGS
+from config import AVAILABLE_INDICATORS, DEFAULT_SETTINGS, RETRAIN_FREQUENCIES, TRAINING_WINDOWS, MODEL_MODES
+from ml.models.model_registry import list_models
 from utils import validate_date_format, validate_date_range, validate_tickers, validate_numeric_input
-from simulation_window import SimulationWindow
-from agent_window import AgentWindow
-from trading_simulator import TradingSimulator
 import threading
 
 class MainWindow:
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Trading Simulator - Configuration")
-        self.root.geometry("700x850")  
+        self.root.geometry("700x990")  
         self.root.resizable(False, False)
         
         self.simulator = None          
@@ -43,7 +41,7 @@ class MainWindow:
         self.end_date_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5)
         
         ttk.Label(config_section, text="Model Type:").grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.model_combo = ttk.Combobox(config_section, values=list(AVAILABLE_MODELS.keys()), 
+        self.model_combo = ttk.Combobox(config_section, values=list_models(), 
                                        state="readonly", width=47)
         self.model_combo.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=5)
         
@@ -59,6 +57,25 @@ class MainWindow:
         self.capital_entry = ttk.Entry(config_section, width=50)
         self.capital_entry.grid(row=6, column=1, sticky=(tk.W, tk.E), pady=5)
         
+        ttk.Label(config_section, text="Retrenowanie (walk-forward):").grid(row=7, column=0, sticky=tk.W, pady=5)
+        self.retrain_combo = ttk.Combobox(config_section, values=list(RETRAIN_FREQUENCIES.keys()), 
+                                         state="readonly", width=47)
+        self.retrain_combo.grid(row=7, column=1, sticky=(tk.W, tk.E), pady=5)
+        
+        ttk.Label(config_section, text="Okno treningowe:").grid(row=8, column=0, sticky=tk.W, pady=5)
+        self.training_window_combo = ttk.Combobox(config_section, values=list(TRAINING_WINDOWS.keys()), 
+                                                 state="readonly", width=47)
+        self.training_window_combo.grid(row=8, column=1, sticky=(tk.W, tk.E), pady=5)
+        
+        ttk.Label(config_section, text="Tryb modelu:").grid(row=9, column=0, sticky=tk.W, pady=5)
+        self.model_mode_combo = ttk.Combobox(config_section, values=list(MODEL_MODES.keys()), 
+                                            state="readonly", width=47)
+        self.model_mode_combo.grid(row=9, column=1, sticky=(tk.W, tk.E), pady=5)
+        
+        self.profiling_var = tk.BooleanVar()
+        ttk.Checkbutton(config_section, text="Profilowanie (cProfile + tracemalloc)", 
+                       variable=self.profiling_var).grid(row=10, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
         config_section.columnconfigure(1, weight=1)
         
         features_section = ttk.LabelFrame(main_frame, text="Cechy cenowe (musisz wybrać przynajmniej jedną)", padding=10)
@@ -156,7 +173,7 @@ class MainWindow:
         self.end_date_entry.delete(0, tk.END)
         self.end_date_entry.insert(0, DEFAULT_SETTINGS['end_date'])
         
-        self.model_combo.set(list(AVAILABLE_MODELS.keys())[0])
+        self.model_combo.set(list_models()[0])
         
         self.commission_entry.delete(0, tk.END)
         self.commission_entry.insert(0, str(DEFAULT_SETTINGS['commission']))
@@ -167,6 +184,11 @@ class MainWindow:
         self.capital_entry.delete(0, tk.END)
         self.capital_entry.insert(0, str(DEFAULT_SETTINGS['initial_capital']))
         
+        self.retrain_combo.set(DEFAULT_SETTINGS['retrain_frequency'])
+        self.training_window_combo.set(DEFAULT_SETTINGS['training_window'])
+        self.model_mode_combo.set(DEFAULT_SETTINGS['model_mode'])
+        self.profiling_var.set(DEFAULT_SETTINGS['profiling'])
+        
         for var in self.indicator_vars.values():
             var.set(False)
         
@@ -244,10 +266,18 @@ class MainWindow:
             'days_ahead': int(self.days_ahead_entry.get()),
             'initial_capital': float(self.capital_entry.get()),
             'indicators': selected_indicators,
-            'selected_features': selected_features
+            'selected_features': selected_features,
+            'retrain_frequency': RETRAIN_FREQUENCIES[self.retrain_combo.get()],
+            'training_window': TRAINING_WINDOWS[self.training_window_combo.get()],
+            'pooled': MODEL_MODES[self.model_mode_combo.get()]['pooled'],
+            'pooled_encoding': MODEL_MODES[self.model_mode_combo.get()]['encoding'],
+            'profiling': self.profiling_var.get()
         }
     
     def setup_simulator(self, config, progress_callback):
+        from trading_simulator import TradingSimulator
+        from profiling import PerformanceMonitor
+        
         progress_callback(0, "Initializing simulator")
         
         simulator = TradingSimulator(
@@ -259,7 +289,12 @@ class MainWindow:
             days_ahead=config['days_ahead'],
             initial_capital=config['initial_capital'],
             indicators=config['indicators'],
-            selected_features=config['selected_features']  
+            selected_features=config['selected_features'],
+            retrain_frequency=config['retrain_frequency'],
+            training_window=config['training_window'],
+            pooled=config['pooled'],
+            pooled_encoding=config['pooled_encoding'],
+            monitor=PerformanceMonitor(profile=config['profiling'], trace_memory=config['profiling'])
         )
         
         progress_callback(10, "Loading data")
@@ -300,6 +335,7 @@ class MainWindow:
                     self.manual_button.config(state='normal')
                     self.agent_button.config(state='normal')
                     
+                    from simulation_window import SimulationWindow
                     simulation_window = SimulationWindow(self.root, simulator)
                     simulation_window.show()
                 
@@ -322,6 +358,8 @@ class MainWindow:
         if not self.validate_inputs():
             return
         
+        from agent_window import AgentWindow
+        
         if self.simulator and self.simulator.is_trained:
             agent_window = AgentWindow(self.root, self.simulator)
             agent_window.show()
@@ -360,5 +398,15 @@ class MainWindow:
         
         threading.Thread(target=setup_agent_simulation, daemon=True).start()
         
+    def preload_modules(self):
+        def preload():
+            try:
+                import trading_simulator
+            except Exception as e:
+                print(f"Warning: Could not preload simulator modules: {e}")
+        
+        threading.Thread(target=preload, daemon=True).start()
+    
     def run(self):
+        self.root.after(200, self.preload_modules)
         self.root.mainloop()
\ No newline at end of file
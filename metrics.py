@@ -0,0 +1,264 @@
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+def _escape_label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    pairs = ','.join(
+        f'{key}="{_escape_label_value(value)}"' for key, value in sorted(labels.items())
+    )
+    return '{' + pairs + '}'
+
+
+class Counter:
+
+    def __init__(self, name, description, labels=None):
+        self.name = name
+        self.description = description
+        self.labels = dict(labels or {})
+        self._shards = {}
+        self._base = 0
+        self._shards_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _fold_dead_shards(self):
+        # Worker threads come and go; a finished thread's count moves into the base total
+        for thread in [thread for thread in self._shards if not thread.is_alive()]:
+            self._base += self._shards.pop(thread)[0]
+
+    def _get_shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = [0]
+            with self._shards_lock:
+                self._fold_dead_shards()
+                self._shards[threading.current_thread()] = shard
+            self._local.shard = shard
+        return shard
+
+    def inc(self, value=1):
+        self._get_shard()[0] += value
+
+    def get(self):
+        with self._shards_lock:
+            self._fold_dead_shards()
+            return self._base + sum(shard[0] for shard in self._shards.values())
+
+
+class Gauge:
+
+    def __init__(self, name, description, labels=None, callback=None):
+        self.name = name
+        self.description = description
+        self.labels = dict(labels or {})
+        self.callback = callback
+        self._value = 0
+
+    def set(self, value):
+        self._value = value
+
+    def inc(self, value=1):
+        self._value += value
+
+    def dec(self, value=1):
+        self._value -= value
+
+    def get(self):
+        if self.callback is not None:
+            try:
+                return self.callback()
+            except Exception:
+                return float('nan')
+        return self._value
+
+
+class MetricsRegistry:
+
+    def __init__(self, namespace='stocksim'):
+        self.namespace = namespace
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._rate_snapshot = {}
+        self._rate_lock = threading.Lock()
+        self._http_server = None
+        self._textfile_thread = None
+        self._textfile_stop = threading.Event()
+
+    def _full_name(self, name):
+        return f"{self.namespace}_{name}" if self.namespace else name
+
+    def _get_or_create(self, metric_type, name, description, labels, **kwargs):
+        full_name = self._full_name(name)
+        key = (full_name, tuple(sorted((labels or {}).items())))
+
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = metric_type(full_name, description, labels, **kwargs)
+                self._metrics[key] = metric
+            elif not isinstance(metric, metric_type):
+                raise ValueError(f"Metric {full_name} already registered as {type(metric).__name__}")
+            return metric
+
+    def counter(self, name, description, labels=None):
+        return self._get_or_create(Counter, name, description, labels)
+
+    def gauge(self, name, description, labels=None, callback=None):
+        return self._get_or_create(Gauge, name, description, labels, callback=callback)
+
+    def collect(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return [(metric, metric.get()) for metric in metrics]
+
+    def _collect_rates(self, samples):
+        now = time.monotonic()
+        rates = []
+
+        with self._rate_lock:
+            for metric, value in samples:
+                if not isinstance(metric, Counter):
+                    continue
+                key = (metric.name, tuple(sorted(metric.labels.items())))
+                previous = self._rate_snapshot.get(key)
+                self._rate_snapshot[key] = (now, value)
+                if previous is not None and now > previous[0]:
+                    rates.append((metric, (value - previous[1]) / (now - previous[0])))
+
+        return rates
+
+    def to_prometheus_text(self):
+        samples = self.collect()
+        lines = []
+        described = set()
+
+        for metric, value in sorted(samples, key=lambda sample: sample[0].name):
+            if metric.name not in described:
+                metric_type = 'counter' if isinstance(metric, Counter) else 'gauge'
+                lines.append(f"# HELP {metric.name} {metric.description}")
+                lines.append(f"# TYPE {metric.name} {metric_type}")
+                described.add(metric.name)
+            lines.append(f"{metric.name}{_format_labels(metric.labels)} {value}")
+
+        for metric, rate in sorted(self._collect_rates(samples), key=lambda sample: sample[0].name):
+            rate_name = metric.name[:-len('_total')] if metric.name.endswith('_total') else metric.name
+            rate_name = f"{rate_name}_per_second"
+            if rate_name not in described:
+                lines.append(f"# HELP {rate_name} Rate of {metric.name} since the previous export")
+                lines.append(f"# TYPE {rate_name} gauge")
+                described.add(rate_name)
+            lines.append(f"{rate_name}{_format_labels(metric.labels)} {rate:.6f}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus_text())
+        os.replace(temp_path, path)
+
+    def start_textfile_writer(self, path, interval=5.0):
+        if self._textfile_thread is not None:
+            return self._textfile_thread
+
+        def write_periodically():
+            while not self._textfile_stop.wait(interval):
+                try:
+                    self.write_textfile(path)
+                except Exception as e:
+                    print(f"Warning: Could not write metrics file {path}: {str(e)}")
+            self.write_textfile(path)
+
+        self._textfile_stop.clear()
+        self._textfile_thread = threading.Thread(target=write_periodically, name="metrics-textfile", daemon=True)
+        self._textfile_thread.start()
+        return self._textfile_thread
+
+    def start_http_server(self, port, host='127.0.0.1'):
+        if self._http_server is not None:
+            return self._http_server
+
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.to_prometheus_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', PROMETHEUS_CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._http_server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self._http_server.daemon_threads = True
+        threading.Thread(target=self._http_server.serve_forever, name="metrics-http", daemon=True).start()
+        print(f"Metrics endpoint: http://{host}:{self._http_server.server_port}/metrics")
+        return self._http_server
+
+    def stop(self):
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+
+        if self._textfile_thread is not None:
+            self._textfile_stop.set()
+            self._textfile_thread.join()
+            self._textfile_thread = None
+
+
+def get_memory_rss():
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return float('nan')
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+_registry_instance = None
+_registry_lock = threading.Lock()
+
+def get_metrics_registry():
+    global _registry_instance
+    if _registry_instance is None:
+        with _registry_lock:
+            if _registry_instance is None:
+                _registry_instance = MetricsRegistry()
+                _registry_instance.gauge('process_resident_memory_bytes', "Resident set size of the process",
+                                         callback=get_memory_rss)
+                _registry_instance.gauge('active_threads', "Number of live Python threads",
+                                         callback=threading.active_count)
+    return _registry_instance
+
+def start_metrics_export(port=None, textfile=None, interval=5.0, host='127.0.0.1'):
+    registry = get_metrics_registry()
+    if port is not None:
+        registry.start_http_server(port, host)
+    if textfile:
+        registry.start_textfile_writer(textfile, interval)
+    return registry
@@ -0,0 +1,50 @@
+import numpy as np
+from ml.models.feature_preprocessor import FeaturePreprocessor
+
+
+class BaseModel:
+    SCALE_FEATURES = False
+
+    @classmethod
+    def build_preprocessor(cls):
+        return FeaturePreprocessor(scale=cls.SCALE_FEATURES)
+
+    @classmethod
+    def transform_features(cls, model, X):
+        preprocessor = getattr(model, 'preprocessor_', None)
+        if preprocessor is None:
+            return X
+        return preprocessor.transform(X)
+
+    @classmethod
+    def train_model(cls, model, X_train, y_train):
+        preprocessor = cls.build_preprocessor().fit(X_train)
+        model.fit(preprocessor.transform(X_train), y_train)
+        model.preprocessor_ = preprocessor
+        return model
+
+    @classmethod
+    def partial_fit(cls, model, X_train, y_train):
+        model.partial_fit(cls.transform_features(model, X_train), y_train)
+        return model
+
+    @classmethod
+    def predict(cls, model, X_test):
+        prediction = model.predict(cls.transform_features(model, X_test))
+        return prediction
+
+    @classmethod
+    def predict_proba(cls, model, X_test):
+        X_test = cls.transform_features(model, X_test)
+
+        if hasattr(model, 'predict_proba'):
+            probabilities = model.predict_proba(X_test)
+            classes = list(model.classes_)
+            if 1 not in classes:
+                return np.zeros(len(probabilities))
+            return probabilities[:, classes.index(1)]
+
+        if hasattr(model, 'decision_function'):
+            return 1.0 / (1.0 + np.exp(-model.decision_function(X_test)))
+
+        return np.asarray(model.predict(X_test), dtype=float)
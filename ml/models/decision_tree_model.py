@@ -6,6 +6,8 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+from ml.models.base_model import BaseModel
+
 try:
     from model_config_loader import load_model_params
 except ImportError:
@@ -13,19 +15,12 @@ except ImportError:
         print(f"⚠️  WARNING: model_config_loader not found, using sklearn defaults for {model_name}")
         return {}
 
-class DecisionTreeModel:
-    @staticmethod
-    def build_model():
-        params = load_model_params('DecisionTree')
-        model = SKLearnDecisionTreeClassifier(**params)
-        return model
+class DecisionTreeModel(BaseModel):
+    SCALE_FEATURES = False
     
     @staticmethod
-    def train_model(model, X_train, y_train):
-        model.fit(X_train, y_train)
-        return model
-    
-    @staticmethod
-    def predict(model, X_test):
-        prediction = model.predict(X_test)
-        return prediction
\ No newline at end of file
+    def build_model(params=None):
+        if params is None:
+            params = load_model_params('DecisionTree')
+        model = SKLearnDecisionTreeClassifier(**params)
+        return model
\ No newline at end of file
@@ -8,6 +8,8 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+from ml.models.base_model import BaseModel
+
 try:
     from model_config_loader import load_model_params
 except ImportError:
@@ -15,10 +17,12 @@ except ImportError:
         print(f"⚠️  WARNING: model_config_loader not found, using sklearn defaults for {model_name}")
         return {}
 
-class EnsembleModel:
+class EnsembleModel(BaseModel):
+    SCALE_FEATURES = True
+    
     @staticmethod
-    def build_model():
-        ensemble_params = load_model_params('Ensemble')
+    def build_model(params=None):
+        ensemble_params = load_model_params('Ensemble') if params is None else dict(params)
         
         try:
             rf_params = load_model_params('RandomForest')
@@ -39,14 +43,4 @@ class EnsembleModel:
         ]
         
         model = VotingClassifier(estimators=base_models, **ensemble_params)
-        return model
-    
-    @staticmethod
-    def train_model(model, X_train, y_train):
-        model.fit(X_train, y_train)
-        return model
-    
-    @staticmethod
-    def predict(model, X_test):
-        prediction = model.predict(X_test)
-        return prediction
\ No newline at end of file
+        return model
\ No newline at end of file
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+
+class FeaturePreprocessor:
+
+    def __init__(self, scale=True):
+        self.scale = scale
+        self.columns = None
+        self.offset_ = None
+        self.inverse_scale_ = None
+        self.fill_values_ = None
+
+    def fit(self, X):
+        if not isinstance(X, pd.DataFrame):
+            raise ValueError("FeaturePreprocessor must be fitted on a DataFrame to fix the column order")
+
+        self.columns = list(X.columns)
+        values = X.to_numpy(dtype=np.float64)
+
+        with np.errstate(invalid='ignore'):
+            means = np.nanmean(values, axis=0) if len(values) else np.zeros(len(self.columns))
+        means = np.where(np.isnan(means), 0.0, means)
+
+        if self.scale:
+            stds = np.nanstd(values, axis=0) if len(values) else np.ones(len(self.columns))
+            stds = np.where(np.isnan(stds) | (stds == 0), 1.0, stds)
+            self.offset_ = means
+            self.inverse_scale_ = 1.0 / stds
+            self.fill_values_ = np.zeros(len(self.columns))
+        else:
+            self.offset_ = np.zeros(len(self.columns))
+            self.inverse_scale_ = np.ones(len(self.columns))
+            self.fill_values_ = means
+
+        return self
+
+    def transform(self, X):
+        if self.columns is None:
+            raise ValueError("FeaturePreprocessor has not been fitted")
+
+        if isinstance(X, pd.DataFrame):
+            values = X.reindex(columns=self.columns).to_numpy(dtype=np.float64)
+        else:
+            values = np.asarray(X, dtype=np.float64)
+            if values.ndim == 1:
+                values = values.reshape(1, -1)
+
+        if values.shape[1] != len(self.columns):
+            raise ValueError(f"Expected {len(self.columns)} features, got {values.shape[1]}")
+
+        values = (values - self.offset_) * self.inverse_scale_
+        missing = np.isnan(values)
+        if missing.any():
+            values[missing] = np.broadcast_to(self.fill_values_, values.shape)[missing]
+
+        return values
+
+    def fit_transform(self, X):
+        return self.fit(X).transform(X)
@@ -123,6 +123,21 @@ class ModelConfigLoader:
         
         return validated_params
     
+    def save_model_params(self, model_name, params):
+        config = dict(self._load_config_file())
+        config[model_name] = params
+        
+        try:
+            with open(self.config_path, 'w', encoding='utf-8') as f:
+                json.dump(config, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"❌ ERROR: Failed to save config file: {e}")
+            return False
+        
+        self.config_cache = config
+        print(f"✓ Saved {len(params)} parameters for {model_name} to: {self.config_path}")
+        return True
+    
     def get_all_models(self):
         config = self._load_config_file()
         return list(config.keys())
@@ -142,4 +157,8 @@ def get_loader():
 
 def load_model_params(model_name):
     loader = get_loader()
-    return loader.load_model_params(model_name)
\ No newline at end of file
+    return loader.load_model_params(model_name)
+
+def save_model_params(model_name, params):
+    loader = get_loader()
+    return loader.save_model_params(model_name, params)
\ No newline at end of file
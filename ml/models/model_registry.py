@@ -0,0 +1,135 @@
+import importlib
+import sys
+from importlib import metadata
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config import AVAILABLE_MODELS, MODEL_ENTRY_POINT_GROUP
+
+CAPABILITY_FLAGS = ('predict_proba', 'partial_fit', 'n_jobs')
+
+
+class ModelSpec:
+
+    def __init__(self, name, path, config_name=None, capabilities=None):
+        if ':' not in path:
+            raise ValueError(f"Model path must have the form 'module:Class', got '{path}'")
+
+        self.name = name
+        self.path = path
+        self.config_name = config_name or name.replace(' ', '')
+        self.capabilities = {flag: False for flag in CAPABILITY_FLAGS}
+        self.capabilities.update(capabilities or {})
+        self.capabilities_from_class = False
+        self._model_class = None
+
+    def load(self):
+        if self._model_class is None:
+            module_name, class_name = self.path.split(':', 1)
+            try:
+                module = importlib.import_module(module_name)
+                self._model_class = getattr(module, class_name)
+            except (ImportError, AttributeError) as e:
+                raise ImportError(f"Could not import {class_name}: {str(e)}")
+
+        return self._model_class
+
+    def is_loaded(self):
+        return self._model_class is not None
+
+
+class ModelRegistry:
+
+    def __init__(self, entry_point_group=MODEL_ENTRY_POINT_GROUP):
+        self.entry_point_group = entry_point_group
+        self._specs = {}
+        self._entry_points_loaded = False
+
+    def register(self, name, path, config_name=None, **capabilities):
+        unknown = set(capabilities) - set(CAPABILITY_FLAGS)
+        if unknown:
+            raise ValueError(f"Unknown capability flags for {name}: {sorted(unknown)}")
+
+        self._specs[name] = ModelSpec(name, path, config_name, capabilities)
+        return self._specs[name]
+
+    def unregister(self, name):
+        self._specs.pop(name, None)
+
+    def _load_entry_points(self):
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+
+        try:
+            entry_points = metadata.entry_points(group=self.entry_point_group)
+        except Exception as e:
+            print(f"Warning: Could not read model entry points: {str(e)}")
+            return
+
+        for entry_point in entry_points:
+            if entry_point.name not in self._specs:
+                spec = self.register(entry_point.name, entry_point.value)
+                spec.capabilities_from_class = True
+
+    def get_spec(self, name):
+        if name not in self._specs:
+            self._load_entry_points()
+
+        if name not in self._specs:
+            raise ValueError(f"Model {name} not available")
+
+        return self._specs[name]
+
+    def get_model_class(self, name):
+        return self.get_spec(name).load()
+
+    def get_capabilities(self, name):
+        spec = self.get_spec(name)
+
+        if spec.is_loaded() or spec.capabilities_from_class:
+            declared = getattr(spec.load(), 'CAPABILITIES', {})
+            return {**spec.capabilities, **declared}
+
+        return dict(spec.capabilities)
+
+    def get_config_name(self, name):
+        return self.get_spec(name).config_name
+
+    def list_models(self):
+        self._load_entry_points()
+        return list(self._specs.keys())
+
+
+def _create_default_registry():
+    registry = ModelRegistry()
+
+    for name, definition in AVAILABLE_MODELS.items():
+        capabilities = {flag: definition.get(flag, False) for flag in CAPABILITY_FLAGS}
+        registry.register(name, definition['path'], definition.get('config_name'), **capabilities)
+
+    return registry
+
+
+_registry_instance = None
+
+def get_registry():
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = _create_default_registry()
+    return _registry_instance
+
+def register_model(name, path, config_name=None, **capabilities):
+    return get_registry().register(name, path, config_name, **capabilities)
+
+def get_model_class(name):
+    return get_registry().get_model_class(name)
+
+def get_model_capabilities(name):
+    return get_registry().get_capabilities(name)
+
+def list_models():
+    return get_registry().list_models()
@@ -0,0 +1,223 @@
+import json
+import math
+import itertools
+import sys
+import os
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from model_config_loader import get_loader
+
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils import get_model_class, get_feature_drop_columns, prepare_features_for_prediction
+from ml.models.model_registry import get_registry
+
+
+def get_config_name(model_type):
+    return get_registry().get_config_name(model_type)
+
+
+class PurgedWalkForwardSplit:
+
+    def __init__(self, n_splits=5, purge=1, embargo=0, min_train_size=50, max_train_size=None):
+        if n_splits < 1:
+            raise ValueError("n_splits must be >= 1")
+
+        self.n_splits = n_splits
+        self.purge = purge
+        self.embargo = embargo
+        self.min_train_size = min_train_size
+        self.max_train_size = max_train_size
+
+    def split(self, X):
+        n_samples = len(X)
+        test_size = n_samples // (self.n_splits + 1)
+
+        if test_size <= 0:
+            raise ValueError(f"Not enough samples ({n_samples}) for {self.n_splits} splits")
+
+        for fold in range(self.n_splits):
+            test_start = n_samples - (self.n_splits - fold) * test_size
+            test_end = test_start + test_size
+
+            train_end = test_start - self.purge - self.embargo
+            train_start = 0
+            if self.max_train_size is not None:
+                train_start = max(0, train_end - self.max_train_size)
+
+            if train_end - train_start < self.min_train_size:
+                continue
+
+            yield np.arange(train_start, train_end), np.arange(test_start, test_end)
+
+    def get_n_splits(self, X):
+        return sum(1 for _ in self.split(X))
+
+
+def _evaluate_fold(model_type, params, X, y, train_index, test_index):
+    model_class = get_model_class(model_type)
+    model = model_class.build_model(dict(params))
+    model = model_class.train_model(model, X.iloc[train_index], y[train_index])
+    predictions = model_class.predict(model, X.iloc[test_index])
+    return float(np.mean(np.asarray(predictions) == y[test_index]))
+
+
+class ModelTuner:
+
+    def __init__(self, days_ahead=1, n_splits=5, embargo=0, n_candidates=20, eta=3, min_folds=1,
+                 n_jobs=-1, random_state=42, max_train_size=None, search_space_path=None):
+        self.days_ahead = days_ahead
+        self.n_candidates = n_candidates
+        self.eta = eta
+        self.min_folds = min_folds
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+        self.splitter = PurgedWalkForwardSplit(
+            n_splits=n_splits, purge=days_ahead, embargo=embargo, max_train_size=max_train_size
+        )
+
+        if search_space_path is None:
+            search_space_path = Path(__file__).parent / "param_search_space.json"
+        self.search_space_path = Path(search_space_path)
+        self.config_loader = get_loader()
+
+    def load_search_space(self, config_name):
+        with open(self.search_space_path, 'r', encoding='utf-8') as f:
+            search_spaces = json.load(f)
+
+        if config_name not in search_spaces:
+            raise ValueError(f"No search space defined for model '{config_name}'")
+
+        return search_spaces[config_name]
+
+    def sample_candidates(self, config_name):
+        base_params = self.config_loader.load_model_params(config_name)
+        search_space = self.load_search_space(config_name)
+
+        names = list(search_space.keys())
+        grid_size = math.prod(len(values) for values in search_space.values())
+
+        if grid_size <= self.n_candidates:
+            combinations = list(itertools.product(*(search_space[name] for name in names)))
+        else:
+            rng = np.random.default_rng(self.random_state)
+            combinations = set()
+            while len(combinations) < self.n_candidates:
+                combinations.add(tuple(
+                    search_space[name][rng.integers(len(search_space[name]))] for name in names
+                ))
+            combinations = sorted(combinations, key=str)
+
+        candidates = []
+        for combination in combinations:
+            params = dict(base_params)
+            params.update(self.config_loader._validate_params(config_name, dict(zip(names, combination))))
+            candidates.append(params)
+
+        return candidates
+
+    def tune(self, model_type, X, y):
+        config_name = get_config_name(model_type)
+        y = np.asarray(y)
+
+        splits = list(self.splitter.split(X))
+        if not splits:
+            raise ValueError("Not enough training data for purged cross-validation")
+
+        splits = splits[::-1]
+        candidates = self.sample_candidates(config_name)
+
+        print(f"Tuning {model_type}: {len(candidates)} candidates, {len(splits)} folds")
+
+        fold_scores = {index: [] for index in range(len(candidates))}
+        survivors = list(range(len(candidates)))
+        budget = min(max(self.min_folds, 1), len(splits))
+        history = []
+
+        while True:
+            tasks = [
+                (index, fold) for index in survivors
+                for fold in range(len(fold_scores[index]), budget)
+            ]
+
+            scores = Parallel(n_jobs=self.n_jobs)(
+                delayed(_evaluate_fold)(model_type, candidates[index], X, y, *splits[fold])
+                for index, fold in tasks
+            )
+
+            for (index, fold), score in zip(tasks, scores):
+                fold_scores[index].append(score)
+
+            ranking = sorted(survivors, key=lambda index: np.mean(fold_scores[index]), reverse=True)
+            history.append({
+                'folds': budget,
+                'candidates': len(survivors),
+                'best_score': float(np.mean(fold_scores[ranking[0]]))
+            })
+            print(f"  Rung {len(history)}: {len(survivors)} candidates on {budget} folds, "
+                  f"best accuracy {history[-1]['best_score']:.4f}")
+
+            if budget == len(splits):
+                survivors = ranking[:1]
+                break
+
+            survivors = ranking[:max(1, math.ceil(len(ranking) / self.eta))]
+            budget = min(len(splits), budget * self.eta)
+
+        best_index = survivors[0]
+
+        return {
+            'model_type': model_type,
+            'config_name': config_name,
+            'best_params': candidates[best_index],
+            'best_score': float(np.mean(fold_scores[best_index])),
+            'fold_scores': fold_scores[best_index],
+            'history': history
+        }
+
+    def tune_models(self, model_types, X, y, write=False):
+        results = {}
+
+        for model_type in model_types:
+            try:
+                results[model_type] = self.tune(model_type, X, y)
+                if write:
+                    self.write_best_params(results[model_type])
+            except Exception as e:
+                print(f"❌ ERROR: Tuning {model_type} failed: {e}")
+                results[model_type] = None
+
+        return results
+
+    def write_best_params(self, result):
+        return self.config_loader.save_model_params(result['config_name'], result['best_params'])
+
+
+def load_training_data(ticker, test_start_date, days_ahead, indicators, selected_features, provider=None):
+    from data.data_loader import DataLoader
+    from data.data_processor import DataProcessor
+
+    processor = DataProcessor()
+    data = DataLoader(ticker, provider).load_data()
+    data = processor.calculate_technical_indicators(data, indicators, selected_features)
+    data = processor.make_target(data, days_ahead)
+    dataset = processor.prepare_dataset(data)
+
+    position = dataset['Date'].searchsorted(pd.to_datetime(test_start_date))
+    train_start, train_end = processor.get_training_window(position, days_ahead)
+    train_data = dataset.iloc[train_start:train_end]
+
+    X = prepare_features_for_prediction(train_data, get_feature_drop_columns(selected_features))
+    y = train_data['Target'].values
+
+    return X, y
@@ -0,0 +1,26 @@
+from sklearn.linear_model import SGDClassifier
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from ml.models.base_model import BaseModel
+
+try:
+    from model_config_loader import load_model_params
+except ImportError:
+    def load_model_params(model_name):
+        print(f"⚠️  WARNING: model_config_loader not found, using sklearn defaults for {model_name}")
+        return {}
+
+class SGDModel(BaseModel):
+    SCALE_FEATURES = True
+    
+    @staticmethod
+    def build_model(params=None):
+        if params is None:
+            params = load_model_params('SGD')
+        model = SGDClassifier(**params)
+        return model
\ No newline at end of file
@@ -0,0 +1,98 @@
+import os
+import shutil
+from datetime import datetime
+from agent_simulation import AgentSimulation, AGENT_LOG_DIRECTORY, AGENT_DAYS, RUNNING_AGENTS
+from utils import slugify
+from simulation_control import SimulationControl
+
+class MultiStrategySimulation:
+    def __init__(self, trading_simulator, strategies, progress_callback=None, control=None, result_store=None,
+                 log_directory=AGENT_LOG_DIRECTORY):
+        self.trading_simulator = trading_simulator
+        self.progress_callback = progress_callback
+        self.control = control or SimulationControl()
+        self.monitor = trading_simulator.monitor
+        self.log_directory = log_directory
+
+        # One book per strategy; each writes its logs to its own subfolder of the shared agent log directory
+        shutil.rmtree(self.log_directory, ignore_errors=True)
+        self.agents = {
+            name: AgentSimulation(
+                trading_simulator, strategy, control=self.control, result_store=result_store,
+                log_directory=self.get_book_directory(name)
+            )
+            for name, strategy in strategies.items()
+        }
+
+        self.is_running = False
+        self.is_cancelled = False
+
+    def get_book_directory(self, name):
+        return os.path.join(self.log_directory, slugify(name))
+
+    def run_simulation(self):
+        if self.is_running:
+            return {name: (False, "Symulacja już trwa") for name in self.agents}
+
+        if not self.trading_simulator.is_trained:
+            return {name: (False, "Model nie został wytrenowany") for name in self.agents}
+
+        self.is_running = True
+        started = datetime.now()
+        for agent in self.agents.values():
+            agent.is_running = True
+            agent.stats['start_time'] = started
+        RUNNING_AGENTS.inc(len(self.agents))
+
+        print(f"Rozpoczynam symulację {len(self.agents)} strategii w jednym przebiegu")
+
+        try:
+            self.trading_simulator.reset_simulation()
+
+            simulation_day = self.trading_simulator.current_date_index
+            total_days = len(self.trading_simulator.trading_dates)
+
+            with self.monitor.capture():
+                while self.trading_simulator.can_go_next_day():
+                    if not self.control.checkpoint():
+                        self.is_cancelled = True
+                        break
+
+                    current_date = self.trading_simulator.get_current_date()
+                    for agent in self.agents.values():
+                        agent.process_day(current_date)
+
+                    self.trading_simulator.next_day()
+                    simulation_day += 1
+                    AGENT_DAYS.inc(len(self.agents))
+
+                    last_day = not self.trading_simulator.can_go_next_day()
+                    if self.progress_callback and self.control.should_report(force=last_day):
+                        progress = (simulation_day / total_days) * 100
+                        self.progress_callback(simulation_day, total_days, progress)
+
+            if self.is_cancelled:
+                message = f"Symulacja przerwana po {simulation_day} z {total_days} dni"
+                for agent in self.agents.values():
+                    agent.is_cancelled = True
+                    agent.is_running = False
+                print(f"Symulacja strategii przerwana po {simulation_day} dniach")
+                return {name: (False, message) for name in self.agents}
+
+            results = {}
+            for name, agent in self.agents.items():
+                try:
+                    results[name] = agent.complete_simulation()
+                except Exception as e:
+                    agent.is_running = False
+                    results[name] = (False, f"Błąd podczas symulacji: {str(e)}")
+            return results
+
+        except Exception as e:
+            for agent in self.agents.values():
+                agent.is_running = False
+            return {name: (False, f"Błąd podczas symulacji: {str(e)}") for name in self.agents}
+
+        finally:
+            self.is_running = False
+            RUNNING_AGENTS.dec(len(self.agents))
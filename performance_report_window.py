@@ -0,0 +1,51 @@
+import tkinter as tk
+from tkinter import ttk
+
+class PerformanceReportWindow:
+    def __init__(self, parent, monitor):
+        self.parent = parent
+        self.monitor = monitor
+        self.window = None
+        self.report_text = None
+
+    def show(self):
+        self.window = tk.Toplevel(self.parent)
+        self.window.title("Raport wydajności")
+        self.window.geometry("900x600")
+        self.create_widgets()
+        self.refresh()
+
+    def create_widgets(self):
+        main_frame = ttk.Frame(self.window, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(main_frame, text="Raport wydajności", font=("Arial", 16, "bold")).pack(pady=(0, 10))
+
+        text_frame = ttk.Frame(main_frame)
+        text_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.report_text = tk.Text(text_frame, font=("Courier", 9), wrap=tk.NONE, state=tk.DISABLED)
+        scrollbar_y = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.report_text.yview)
+        scrollbar_x = ttk.Scrollbar(text_frame, orient=tk.HORIZONTAL, command=self.report_text.xview)
+        self.report_text.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+
+        scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+        scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
+        self.report_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        buttons_frame = ttk.Frame(main_frame)
+        buttons_frame.pack(fill=tk.X, pady=(10, 0))
+
+        ttk.Button(buttons_frame, text="Odśwież", command=self.refresh).pack(side=tk.LEFT)
+        ttk.Button(buttons_frame, text="Zamknij", command=self.window.destroy).pack(side=tk.RIGHT)
+
+    def refresh(self):
+        if not self.monitor.durations:
+            report = "Brak pomiarów - uruchom symulację."
+        else:
+            report = self.monitor.format_report()
+
+        self.report_text.config(state=tk.NORMAL)
+        self.report_text.delete(1.0, tk.END)
+        self.report_text.insert(tk.END, report)
+        self.report_text.config(state=tk.DISABLED)
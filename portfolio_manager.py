@@ -1,6 +1,14 @@
 import pandas as pd
 from datetime import datetime
 from utils import format_currency, format_percentage, calculate_returns
+from metrics import get_metrics_registry
+
+METRICS = get_metrics_registry()
+BUY_FILLS = METRICS.counter('fills_total', "Executed orders", {'side': 'buy'})
+SELL_FILLS = METRICS.counter('fills_total', "Executed orders", {'side': 'sell'})
+BUY_REJECTS = METRICS.counter('rejected_orders_total', "Orders rejected by PortfolioManager", {'side': 'buy'})
+SELL_REJECTS = METRICS.counter('rejected_orders_total', "Orders rejected by PortfolioManager", {'side': 'sell'})
+TRADED_VALUE = METRICS.counter('traded_value_total', "Gross value of executed orders")
 
 class PortfolioManager:
     def __init__(self, initial_capital, commission_rate):
@@ -32,6 +40,7 @@ class PortfolioManager:
         total_with_commission = total_cost + commission
         
         if not self.can_buy(ticker, shares, price):
+            BUY_REJECTS.inc()
             return False, "Insufficient funds"
         
         self.current_capital -= total_with_commission
@@ -66,10 +75,13 @@ class PortfolioManager:
             'total_cost': total_with_commission
         })
         
+        BUY_FILLS.inc()
+        TRADED_VALUE.inc(total_cost)
         return True, f"Bought {shares} shares of {ticker} at {format_currency(price)}"
     
     def sell_stock(self, ticker, shares, price, date):
         if not self.can_sell(ticker, shares):
+            SELL_REJECTS.inc()
             return False, "Insufficient shares"
         
         total_revenue = shares * price
@@ -103,6 +115,8 @@ class PortfolioManager:
             'net_revenue': net_revenue
         })
         
+        SELL_FILLS.inc()
+        TRADED_VALUE.inc(total_revenue)
         return True, f"Sold {shares} shares of {ticker} at {format_currency(price)}"
     
     def get_portfolio_value(self, current_prices):
@@ -144,20 +158,35 @@ class PortfolioManager:
             'positions': positions_summary
         }
     
-    def record_daily_value(self, date, current_prices):
+    def record_daily_value(self, date, current_prices, verbose=True):
         portfolio_value = self.get_portfolio_value(current_prices)
         self.daily_portfolio_value.append({
             'date': date,
             'value': portfolio_value,
             'return': calculate_returns(self.initial_capital, portfolio_value)
         })
-        print(f"DEBUG: Zapisano wartość portfolio na {date}: ${portfolio_value:.2f}")
+        if verbose:
+            print(f"DEBUG: Zapisano wartość portfolio na {date}: ${portfolio_value:.2f}")
     def get_transaction_history(self):
         return pd.DataFrame(self.transaction_history)
     
     def get_performance_history(self):
         return pd.DataFrame(self.daily_portfolio_value)
     
+    def get_state(self):
+        return {
+            'current_capital': self.current_capital,
+            'positions': self.positions,
+            'transaction_history': self.transaction_history,
+            'daily_portfolio_value': self.daily_portfolio_value
+        }
+    
+    def restore_state(self, state):
+        self.current_capital = state['current_capital']
+        self.positions = state['positions']
+        self.transaction_history = state['transaction_history']
+        self.daily_portfolio_value = state['daily_portfolio_value']
+    
     def reset_portfolio(self):
         self.current_capital = self.initial_capital
         self.positions = {}
@@ -2,9 +2,17 @@ import tkinter as tk
 from tkinter import ttk
 from utils import format_currency, format_percentage
 
+POSITIONS_PAGE_SIZE = 100
+EMPTY_ROW_ID = '__empty__'
+
 class PortfolioWidget:
     def __init__(self, parent):
         self.parent = parent
+        self.pending_summary = None
+        self.update_job = None
+        self.positions = []
+        self.rows = {}
+        self.page = 0
         self.create_widget()
         
     def create_widget(self):
@@ -50,6 +58,16 @@ class PortfolioWidget:
                                            command=self.positions_tree.yview)
         self.positions_tree.configure(yscrollcommand=scrollbar_positions.set)
         
+        paging_frame = ttk.Frame(positions_frame)
+        paging_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(5, 0))
+        
+        self.prev_page_button = ttk.Button(paging_frame, text="<", width=3, command=lambda: self.change_page(-1))
+        self.prev_page_button.pack(side=tk.LEFT)
+        self.page_label = ttk.Label(paging_frame, text="Page 1 / 1")
+        self.page_label.pack(side=tk.LEFT, padx=5)
+        self.next_page_button = ttk.Button(paging_frame, text=">", width=3, command=lambda: self.change_page(1))
+        self.next_page_button.pack(side=tk.LEFT)
+        
         self.positions_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar_positions.pack(side=tk.RIGHT, fill=tk.Y)
         
@@ -58,6 +76,17 @@ class PortfolioWidget:
         self.positions_tree.tag_configure('neutral', foreground='black')
         
     def update_display(self, portfolio_summary):
+        self.pending_summary = portfolio_summary
+        if self.update_job is None:
+            self.update_job = self.positions_tree.after_idle(self.apply_pending_update)
+    
+    def apply_pending_update(self):
+        self.update_job = None
+        portfolio_summary = self.pending_summary
+        self.pending_summary = None
+        if portfolio_summary is None:
+            return
+        
         self.cash_label.config(text=f"Cash: {format_currency(portfolio_summary['cash'])}")
         self.total_value_label.config(text=f"Total Value: {format_currency(portfolio_summary['total_value'])}")
         
@@ -70,33 +99,72 @@ class PortfolioWidget:
         else:
             self.total_return_label.config(text=return_text, foreground='black')
         
-        for item in self.positions_tree.get_children():
-            self.positions_tree.delete(item)
-        
-        for position in portfolio_summary['positions']:
-            pnl = position['unrealized_pnl']
-            pnl_pct = position['unrealized_pnl_pct']
-            
-            if pnl > 0:
-                tag = 'profit'
-            elif pnl < 0:
-                tag = 'loss'
-            else:
-                tag = 'neutral'
-            
-            self.positions_tree.insert('', tk.END, 
-                                      values=(
-                                          position['ticker'],
-                                          int(position['shares']),
-                                          format_currency(position['avg_price']),
-                                          format_currency(position['current_price']),
-                                          format_currency(position['market_value']),
-                                          format_currency(pnl),
-                                          format_percentage(pnl_pct)
-                                      ),
-                                      tags=(tag,))
-        
-        if not portfolio_summary['positions']:
-            self.positions_tree.insert('', tk.END, 
-                                      values=('No positions', '', '', '', '', '', ''),
-                                      tags=('neutral',))
\ No newline at end of file
+        self.positions = portfolio_summary['positions']
+        self.render_page()
+    
+    def get_page_count(self):
+        return max(1, (len(self.positions) + POSITIONS_PAGE_SIZE - 1) // POSITIONS_PAGE_SIZE)
+    
+    def change_page(self, step):
+        self.page = min(max(self.page + step, 0), self.get_page_count() - 1)
+        self.render_page()
+    
+    def render_page(self):
+        page_count = self.get_page_count()
+        self.page = min(self.page, page_count - 1)
+        
+        start = self.page * POSITIONS_PAGE_SIZE
+        page_positions = self.positions[start:start + POSITIONS_PAGE_SIZE]
+        
+        rows = {}
+        for position in page_positions:
+            rows[position['ticker']] = self.format_row(position)
+        
+        if not self.positions:
+            rows[EMPTY_ROW_ID] = (('No positions', '', '', '', '', '', ''), 'neutral')
+        
+        self.reconcile_rows(rows)
+        
+        self.page_label.config(text=f"Page {self.page + 1} / {page_count}")
+        self.prev_page_button.config(state='normal' if self.page > 0 else 'disabled')
+        self.next_page_button.config(state='normal' if self.page < page_count - 1 else 'disabled')
+    
+    def format_row(self, position):
+        pnl = position['unrealized_pnl']
+        pnl_pct = position['unrealized_pnl_pct']
+        
+        if pnl > 0:
+            tag = 'profit'
+        elif pnl < 0:
+            tag = 'loss'
+        else:
+            tag = 'neutral'
+        
+        values = (
+            position['ticker'],
+            int(position['shares']),
+            format_currency(position['avg_price']),
+            format_currency(position['current_price']),
+            format_currency(position['market_value']),
+            format_currency(pnl),
+            format_percentage(pnl_pct)
+        )
+        return values, tag
+    
+    def reconcile_rows(self, rows):
+        for item_id in [item_id for item_id in self.rows if item_id not in rows]:
+            self.positions_tree.delete(item_id)
+            del self.rows[item_id]
+        
+        for index, (item_id, row) in enumerate(rows.items()):
+            values, tag = row
+            if item_id not in self.rows:
+                self.positions_tree.insert('', index, iid=item_id, values=values, tags=(tag,))
+            elif self.rows[item_id] != row:
+                self.positions_tree.item(item_id, values=values, tags=(tag,))
+            self.rows[item_id] = row
+        
+        order = tuple(rows)
+        if self.positions_tree.get_children() != order:
+            for index, item_id in enumerate(order):
+                self.positions_tree.move(item_id, '', index)
@@ -0,0 +1,176 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+import numpy as np
+
+class PerformanceMonitor:
+    def __init__(self, enabled=True, profile=False, trace_memory=False):
+        self.enabled = enabled
+        self.profile = profile
+        self.trace_memory = trace_memory
+
+        self.durations = defaultdict(list)
+        self.peak_memory = defaultdict(int)
+        self.counters = defaultdict(int)
+
+        self.profiler = None
+        self._capture_depth = 0
+        self._memory_stack = []
+
+    def reset(self, keep_prefixes=()):
+        keep_prefixes = tuple(keep_prefixes)
+        self.durations = defaultdict(list, {
+            name: values for name, values in self.durations.items() if keep_prefixes and name.startswith(keep_prefixes)
+        })
+        self.peak_memory = defaultdict(int, {
+            name: value for name, value in self.peak_memory.items() if keep_prefixes and name.startswith(keep_prefixes)
+        })
+        self.counters = defaultdict(int)
+        if not keep_prefixes:
+            self.profiler = None
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            self._enter_memory_phase()
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name].append(time.perf_counter() - start)
+            if tracing and tracemalloc.is_tracing():
+                self._exit_memory_phase(name)
+
+    def _enter_memory_phase(self):
+        current, peak = tracemalloc.get_traced_memory()
+        if self._memory_stack:
+            self._memory_stack[-1][1] = max(self._memory_stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        self._memory_stack.append([current, current])
+
+    def _exit_memory_phase(self, name):
+        if not self._memory_stack:
+            return
+
+        start_memory, seen_peak = self._memory_stack.pop()
+        peak = max(seen_peak, tracemalloc.get_traced_memory()[1])
+        self.peak_memory[name] = max(self.peak_memory[name], peak - start_memory)
+
+        if self._memory_stack:
+            self._memory_stack[-1][1] = max(self._memory_stack[-1][1], peak)
+
+    def count(self, name, value=1):
+        if self.enabled:
+            self.counters[name] += value
+
+    @contextmanager
+    def capture(self):
+        if not self.enabled or not (self.profile or self.trace_memory) or self._capture_depth > 0:
+            yield
+            return
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        profiling = False
+        if self.profile:
+            if self.profiler is None:
+                self.profiler = cProfile.Profile()
+            try:
+                self.profiler.enable()
+                profiling = True
+            except ValueError as e:
+                print(f"Warning: cProfile capture unavailable: {str(e)}")
+
+        self._capture_depth += 1
+        try:
+            yield
+        finally:
+            self._capture_depth -= 1
+            if profiling:
+                self.profiler.disable()
+
+    def get_report(self):
+        phases = {}
+
+        for name, durations in self.durations.items():
+            values = np.asarray(durations)
+            phases[name] = {
+                'calls': len(values),
+                'total': float(values.sum()),
+                'mean': float(values.mean()),
+                'p50': float(np.percentile(values, 50)),
+                'p99': float(np.percentile(values, 99)),
+                'max': float(values.max()),
+                'peak_memory': self.peak_memory.get(name)
+            }
+
+        return {
+            'phases': dict(sorted(phases.items(), key=lambda item: item[1]['total'], reverse=True)),
+            'counters': dict(self.counters)
+        }
+
+    def format_report(self, profile_lines=30):
+        report = self.get_report()
+        lines = [
+            f"{'Faza':<32} {'Wywołania':>10} {'Suma [s]':>10} {'p50 [ms]':>10} {'p99 [ms]':>10} {'Szczyt pamięci':>15}",
+            "-" * 92
+        ]
+
+        for name, stats in report['phases'].items():
+            peak = f"{stats['peak_memory'] / 1024 ** 2:.1f} MB" if stats['peak_memory'] is not None else "-"
+            lines.append(
+                f"{name:<32} {stats['calls']:>10} {stats['total']:>10.3f} "
+                f"{stats['p50'] * 1000:>10.2f} {stats['p99'] * 1000:>10.2f} {peak:>15}"
+            )
+
+        if report['counters']:
+            lines.append("")
+            lines.append("Liczniki:")
+            for name, value in sorted(report['counters'].items()):
+                lines.append(f"  {name}: {value}")
+
+        if self.profiler is not None and profile_lines:
+            stream = io.StringIO()
+            pstats.Stats(self.profiler, stream=stream).sort_stats('cumulative').print_stats(profile_lines)
+            lines.append("")
+            lines.append("cProfile (sortowanie: cumulative):")
+            lines.append(stream.getvalue())
+
+        return "\n".join(lines)
+
+    def write_report(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_file = os.path.join(directory, f"performance_report_{timestamp}.txt")
+
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write("=" * 92 + "\n")
+            f.write("TRADING SIMULATOR - RAPORT WYDAJNOŚCI\n")
+            f.write(f"Utworzony: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write("=" * 92 + "\n\n")
+            f.write(self.format_report())
+            f.write("\n")
+
+        with open(os.path.join(directory, f"performance_report_{timestamp}.json"), 'w', encoding='utf-8') as f:
+            json.dump(self.get_report(), f, indent=2)
+
+        if self.profiler is not None:
+            self.profiler.dump_stats(os.path.join(directory, f"profile_{timestamp}.prof"))
+
+        return report_file
+
+NULL_MONITOR = PerformanceMonitor(enabled=False)
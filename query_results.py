@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+import argparse
+from config import DEFAULT_SETTINGS
+from result_store import ResultStore, ORDER_BY
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Query agent runs recorded in the result store")
+    parser.add_argument('--db', default=DEFAULT_SETTINGS['result_store_path'], help="Result store path")
+    parser.add_argument('--ticker', help="Only runs trading this ticker")
+    parser.add_argument('--model', help="Model name as shown in the GUI")
+    parser.add_argument('--strategy', help="Strategy name, e.g. 'Basic Strategy'")
+    parser.add_argument('--start-date', help="Only runs starting on or after this date")
+    parser.add_argument('--end-date', help="Only runs ending on or before this date")
+    parser.add_argument('--limit', type=int, default=50)
+    parser.add_argument('--sort', choices=list(ORDER_BY.keys()), default='id')
+    parser.add_argument('--show', type=int, metavar='RUN_ID', help="Print stats and trades of a single run")
+    parser.add_argument('--delete', type=int, metavar='RUN_ID', help="Remove a run from the store")
+    return parser.parse_args()
+
+def print_runs(runs):
+    if not runs:
+        print("No runs found")
+        return
+
+    print(f"{'ID':>5}  {'Created':<19}  {'Strategy':<22}  {'Model':<20}  {'Period':<23}  {'Return':>9}  {'Acc':>6}  {'Trades':>6}  Tickers")
+    for run in runs:
+        tickers = ', '.join(run['tickers'][:5]) + (f" (+{len(run['tickers']) - 5})" if len(run['tickers']) > 5 else "")
+        print(f"{run['id']:>5}  {run['created']:<19}  {run['strategy']:<22}  {run['model_type']:<20}  "
+              f"{run['start_date']} - {run['end_date']}  {run['return_percentage'] or 0:>8.2f}%  "
+              f"{run['accuracy'] or 0:>5.1f}%  {run['total_transactions'] or 0:>6}  {tickers}")
+
+def print_run(run):
+    print(f"Run {run['id']} - {run['strategy']}")
+    for key, value in sorted(run['config'].items()):
+        print(f"  {key}: {value}")
+    print("Stats:")
+    for key, value in sorted(run['stats'].items()):
+        print(f"  {key}: {value}")
+    print(f"Equity points: {len(run['daily_portfolio_value'])}")
+    print(f"Trades: {len(run['transactions'])}")
+    for trade in run['transactions']:
+        print(f"  {trade['date']:%Y-%m-%d}  {trade['action']:<4}  {trade['ticker']:<8}  {trade['shares']:>6} @ {trade['price']:.2f}")
+
+def main():
+    args = parse_args()
+    store = ResultStore(args.db)
+
+    if args.delete is not None:
+        store.delete_run(args.delete)
+        print(f"Deleted run {args.delete}")
+        return
+
+    if args.show is not None:
+        run = store.load_run(args.show)
+        if run is None:
+            print(f"Run {args.show} not found")
+        else:
+            print_run(run)
+        return
+
+    runs = store.query_runs(args.ticker, args.model, args.strategy, args.start_date, args.end_date, args.limit,
+                            order_by=args.sort)
+    print_runs(runs)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from strategy_comparison_window import StrategyComparisonWindow
+from ml.models.model_registry import list_models
+from utils import format_currency, format_percentage
+
+STRATEGY_NAMES = ["Basic Strategy", "Aggressive Strategy", "Conservative Strategy", "Confidence Strategy"]
+HISTORY_LIMIT = 500
+
+class ResultHistoryWindow:
+    def __init__(self, parent, result_store):
+        self.parent = parent
+        self.result_store = result_store
+        self.window = None
+        self.runs = {}
+
+    def show(self):
+        self.window = tk.Toplevel(self.parent)
+        self.window.title("Historia wyników")
+        self.window.geometry("1200x600")
+        self.create_widgets()
+        self.refresh()
+
+    def create_widgets(self):
+        main_frame = ttk.Frame(self.window, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        filter_frame = ttk.LabelFrame(main_frame, text="Filtry", padding=10)
+        filter_frame.pack(fill=tk.X, pady=(0, 10))
+
+        ttk.Label(filter_frame, text="Ticker:").grid(row=0, column=0, sticky=tk.W)
+        self.ticker_entry = ttk.Entry(filter_frame, width=10)
+        self.ticker_entry.grid(row=0, column=1, padx=(5, 15))
+
+        ttk.Label(filter_frame, text="Model:").grid(row=0, column=2, sticky=tk.W)
+        self.model_combo = ttk.Combobox(filter_frame, values=[""] + list_models(), state="readonly", width=20)
+        self.model_combo.grid(row=0, column=3, padx=(5, 15))
+
+        ttk.Label(filter_frame, text="Strategia:").grid(row=0, column=4, sticky=tk.W)
+        self.strategy_combo = ttk.Combobox(filter_frame, values=[""] + STRATEGY_NAMES, state="readonly", width=20)
+        self.strategy_combo.grid(row=0, column=5, padx=(5, 15))
+
+        ttk.Label(filter_frame, text="Od:").grid(row=0, column=6, sticky=tk.W)
+        self.start_entry = ttk.Entry(filter_frame, width=12)
+        self.start_entry.grid(row=0, column=7, padx=(5, 15))
+
+        ttk.Label(filter_frame, text="Do:").grid(row=0, column=8, sticky=tk.W)
+        self.end_entry = ttk.Entry(filter_frame, width=12)
+        self.end_entry.grid(row=0, column=9, padx=(5, 15))
+
+        ttk.Button(filter_frame, text="Szukaj", command=self.refresh).grid(row=0, column=10)
+
+        columns = ('ID', 'Data', 'Strategia', 'Model', 'Okres', 'Tickery', 'Wartość końcowa', 'Zwrot (%)',
+                   'Dokładność (%)', 'Transakcje')
+        tree_frame = ttk.Frame(main_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings', selectmode='extended')
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=60 if col == 'ID' else 110, anchor=tk.CENTER)
+        self.tree.column('Tickery', width=200, anchor=tk.W)
+
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        buttons_frame = ttk.Frame(main_frame)
+        buttons_frame.pack(fill=tk.X, pady=(10, 0))
+
+        ttk.Button(buttons_frame, text="Porównaj zaznaczone", command=self.compare_selected).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(buttons_frame, text="Usuń zaznaczone", command=self.delete_selected).pack(side=tk.LEFT, padx=(0, 10))
+        self.count_label = ttk.Label(buttons_frame, text="")
+        self.count_label.pack(side=tk.LEFT)
+        ttk.Button(buttons_frame, text="Zamknij", command=self.window.destroy).pack(side=tk.RIGHT)
+
+    def refresh(self):
+        try:
+            runs = self.result_store.query_runs(
+                ticker=self.ticker_entry.get().strip().upper() or None,
+                model_type=self.model_combo.get() or None,
+                strategy=self.strategy_combo.get() or None,
+                start_date=self.start_entry.get().strip() or None,
+                end_date=self.end_entry.get().strip() or None,
+                limit=HISTORY_LIMIT
+            )
+        except Exception as e:
+            messagebox.showerror("Błąd", f"Nie udało się odczytać historii: {str(e)}")
+            return
+
+        self.tree.delete(*self.tree.get_children())
+        self.runs = {}
+        for run in runs:
+            self.runs[str(run['id'])] = run
+            tickers = ', '.join(run['tickers'][:5]) + ("..." if len(run['tickers']) > 5 else "")
+            self.tree.insert('', tk.END, iid=str(run['id']), values=(
+                run['id'],
+                run['created'][:16].replace('T', ' '),
+                run['strategy'],
+                run['model_type'],
+                f"{run['start_date']} - {run['end_date']}",
+                tickers,
+                format_currency(run['final_value'] or 0),
+                format_percentage(run['return_percentage'] or 0),
+                f"{run['accuracy'] or 0:.2f}%",
+                run['total_transactions'] or 0
+            ))
+        self.count_label.config(text=f"Wyniki: {len(runs)}")
+
+    def compare_selected(self):
+        selected = self.tree.selection()
+        if not selected:
+            messagebox.showinfo("Historia wyników", "Zaznacz co najmniej jeden wynik.")
+            return
+
+        results = {}
+        for run_id in selected:
+            run = self.runs[run_id]
+            results[f"#{run_id} {run['strategy']} ({run['model_type']})"] = self.result_store.load_comparison_result(int(run_id))
+        StrategyComparisonWindow(self.window, results).show()
+
+    def delete_selected(self):
+        selected = self.tree.selection()
+        if not selected or not messagebox.askyesno("Historia wyników", f"Usunąć zaznaczone wyniki ({len(selected)})?"):
+            return
+
+        for run_id in selected:
+            self.result_store.delete_run(int(run_id))
+        self.refresh()
@@ -0,0 +1,245 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from config import DEFAULT_SETTINGS
+from ml.models.model_registry import get_model_class
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fingerprint TEXT NOT NULL,
+    created TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    model_type TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    days_ahead INTEGER,
+    commission REAL,
+    initial_capital REAL,
+    final_value REAL,
+    return_percentage REAL,
+    accuracy REAL,
+    total_transactions INTEGER,
+    config TEXT NOT NULL,
+    stats TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_tickers (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    ticker TEXT NOT NULL,
+    PRIMARY KEY (run_id, ticker)
+);
+CREATE TABLE IF NOT EXISTS equity (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    date TEXT NOT NULL,
+    value REAL NOT NULL,
+    return REAL
+);
+CREATE TABLE IF NOT EXISTS trades (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    date TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    action TEXT NOT NULL,
+    shares INTEGER NOT NULL,
+    price REAL NOT NULL,
+    commission REAL,
+    amount REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_fingerprint ON runs(fingerprint);
+CREATE INDEX IF NOT EXISTS idx_runs_model ON runs(model_type);
+CREATE INDEX IF NOT EXISTS idx_runs_strategy ON runs(strategy);
+CREATE INDEX IF NOT EXISTS idx_runs_dates ON runs(start_date, end_date);
+CREATE INDEX IF NOT EXISTS idx_run_tickers_ticker ON run_tickers(ticker);
+CREATE INDEX IF NOT EXISTS idx_equity_run ON equity(run_id);
+CREATE INDEX IF NOT EXISTS idx_trades_run ON trades(run_id);
+"""
+
+ORDER_BY = {
+    'id': 'id DESC',
+    'return': 'return_percentage DESC',
+    'accuracy': 'accuracy DESC'
+}
+
+SUMMARY_COLUMNS = ['id', 'created', 'strategy', 'model_type', 'start_date', 'end_date', 'days_ahead',
+                   'initial_capital', 'final_value', 'return_percentage', 'accuracy', 'total_transactions']
+
+STATS_DATETIME_KEYS = ('start_time', 'end_time')
+CONFIG_DATE_KEYS = ('start_date', 'end_date')
+JSON_TYPES = (str, int, float, bool, type(None), list, tuple, dict)
+
+def encode_json_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Nieobsługiwany typ w zapisie wyniku: {type(value).__name__}")
+
+def to_json(value):
+    return json.dumps(value, sort_keys=True, default=encode_json_value)
+
+def decode_dates(values, keys, parse):
+    return {key: parse(value) if key in keys and value is not None else value for key, value in values.items()}
+
+def format_date(value):
+    return pd.Timestamp(value).strftime('%Y-%m-%d')
+
+def describe_strategy(strategy):
+    return {'class': type(strategy).__name__, **vars(strategy)}
+
+def describe_model(trading_simulator):
+    # Params a freshly built model gets from model_params.json; tuning rewrites them without touching get_config()
+    params = get_model_class(trading_simulator.model_type).build_model().get_params()
+    return {key: value if isinstance(value, JSON_TYPES) else repr(value) for key, value in params.items()}
+
+def compute_fingerprint(trading_simulator, strategy):
+    # Hashing the predictions also catches anything else that changes them, e.g. dropped tickers or new data
+    trading_simulator.compute_all_predictions()
+
+    digest = hashlib.sha256()
+    digest.update(to_json(trading_simulator.get_config()).encode('utf-8'))
+    digest.update(to_json(describe_strategy(strategy)).encode('utf-8'))
+    digest.update(to_json(describe_model(trading_simulator)).encode('utf-8'))
+    digest.update(to_json(sorted(trading_simulator.ticker_models)).encode('utf-8'))
+    if trading_simulator.pooled:
+        digest.update(to_json(trading_simulator.ticker_sectors).encode('utf-8'))
+    for matrix in (trading_simulator.price_matrix, trading_simulator.prediction_matrix,
+                   trading_simulator.probability_matrix):
+        digest.update(np.ascontiguousarray(matrix).tobytes())
+    return digest.hexdigest()
+
+class ResultStore:
+    def __init__(self, path=None):
+        self.path = path or DEFAULT_SETTINGS['result_store_path']
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with closing(self.connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def connect(self):
+        # One short-lived connection per call keeps the store usable from the GUI thread and workers alike
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def save_run(self, fingerprint, config, strategy_name, stats, daily_portfolio_value, transactions):
+        equity_rows = [(format_date(row['date']), float(row['value']), float(row.get('return', 0.0)))
+                       for row in daily_portfolio_value]
+        trade_rows = [(format_date(row['date']), row['ticker'], row['action'], int(row['shares']), float(row['price']),
+                       float(row.get('commission', 0.0)), float(row.get('total_cost', row.get('net_revenue', 0.0))))
+                      for row in transactions]
+
+        with self.lock, closing(self.connect()) as conn, conn:
+            cursor = conn.execute(
+                """INSERT INTO runs (fingerprint, created, strategy, model_type, start_date, end_date, days_ahead,
+                                     commission, initial_capital, final_value, return_percentage, accuracy,
+                                     total_transactions, config, stats)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (fingerprint, datetime.now().isoformat(timespec='seconds'), strategy_name, config['model_type'],
+                 format_date(config['start_date']), format_date(config['end_date']), config['days_ahead'],
+                 config['commission'], config['initial_capital'], stats.get('final_portfolio_value'),
+                 stats.get('return_percentage'), stats.get('accuracy'), stats.get('total_transactions'),
+                 to_json(config), to_json(stats))
+            )
+            run_id = cursor.lastrowid
+
+            conn.executemany("INSERT INTO run_tickers (run_id, ticker) VALUES (?, ?)",
+                             [(run_id, ticker) for ticker in config['tickers']])
+            conn.executemany("INSERT INTO equity (run_id, date, value, return) VALUES (?, ?, ?, ?)",
+                             [(run_id, *row) for row in equity_rows])
+            conn.executemany("""INSERT INTO trades (run_id, date, ticker, action, shares, price, commission, amount)
+                                VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                             [(run_id, *row) for row in trade_rows])
+
+        return run_id
+
+    def find_run(self, fingerprint):
+        with closing(self.connect()) as conn:
+            row = conn.execute("SELECT id FROM runs WHERE fingerprint = ? ORDER BY id DESC LIMIT 1",
+                               (fingerprint,)).fetchone()
+        return row['id'] if row else None
+
+    def query_runs(self, ticker=None, model_type=None, strategy=None, start_date=None, end_date=None, limit=500,
+                   order_by='id'):
+        conditions = []
+        params = []
+
+        if ticker:
+            conditions.append("id IN (SELECT run_id FROM run_tickers WHERE ticker = ?)")
+            params.append(ticker)
+        if model_type:
+            conditions.append("model_type = ?")
+            params.append(model_type)
+        if strategy:
+            conditions.append("strategy = ?")
+            params.append(strategy)
+        if start_date:
+            conditions.append("start_date >= ?")
+            params.append(format_date(start_date))
+        if end_date:
+            conditions.append("end_date <= ?")
+            params.append(format_date(end_date))
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM runs {where} ORDER BY {ORDER_BY[order_by]} LIMIT ?"
+
+        with closing(self.connect()) as conn:
+            rows = conn.execute(query, (*params, limit)).fetchall()
+            tickers = self._load_tickers(conn, [row['id'] for row in rows])
+
+        return [{**dict(row), 'tickers': tickers.get(row['id'], [])} for row in rows]
+
+    def _load_tickers(self, conn, run_ids):
+        tickers = {}
+        if not run_ids:
+            return tickers
+
+        placeholders = ', '.join('?' * len(run_ids))
+        for row in conn.execute(f"SELECT run_id, ticker FROM run_tickers WHERE run_id IN ({placeholders}) ORDER BY ticker",
+                                run_ids):
+            tickers.setdefault(row['run_id'], []).append(row['ticker'])
+        return tickers
+
+    def load_run(self, run_id):
+        with closing(self.connect()) as conn:
+            run = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+            if run is None:
+                return None
+            equity = conn.execute("SELECT date, value, return FROM equity WHERE run_id = ? ORDER BY rowid",
+                                  (run_id,)).fetchall()
+            trades = conn.execute("""SELECT date, ticker, action, shares, price, commission, amount
+                                     FROM trades WHERE run_id = ? ORDER BY rowid""", (run_id,)).fetchall()
+
+        return {
+            'id': run['id'],
+            'strategy': run['strategy'],
+            'config': decode_dates(json.loads(run['config']), CONFIG_DATE_KEYS, pd.Timestamp),
+            'stats': decode_dates(json.loads(run['stats']), STATS_DATETIME_KEYS, datetime.fromisoformat),
+            'initial_capital': run['initial_capital'],
+            'daily_portfolio_value': [
+                {'date': pd.Timestamp(row['date']), 'value': row['value'], 'return': row['return']} for row in equity
+            ],
+            'transactions': [{**dict(row), 'date': pd.Timestamp(row['date'])} for row in trades]
+        }
+
+    def load_comparison_result(self, run_id):
+        run = self.load_run(run_id)
+        if run is None:
+            return None
+        return {
+            'daily_portfolio_value': run['daily_portfolio_value'],
+            'transactions': run['transactions'],
+            'stats': run['stats'],
+            'initial_capital': run['initial_capital']
+        }
+
+    def delete_run(self, run_id):
+        with self.lock, closing(self.connect()) as conn, conn:
+            conn.execute("DELETE FROM runs WHERE id = ?", (run_id,))
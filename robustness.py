@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from analytics import equity_arrays, ledger_arrays, round_trips
+
+DEFAULT_SAMPLES = 2000
+DEFAULT_BLOCK_LENGTH = 10
+SAMPLES_PER_TASK = 250
+BAND_POINTS = 200
+PERCENTILES = (5, 50, 95)
+MAX_ENTRY_DELAY = 3
+COMMISSION_RANGE = (0.5, 2.0)
+PARALLEL_MIN_CELLS = 10_000_000
+
+def stationary_bootstrap_indices(rng, n_samples, n_days, mean_block_length):
+    # Politis-Romano: each day starts a new block with probability 1/L, otherwise continues the previous one
+    new_block = rng.random((n_samples, n_days)) < 1.0 / mean_block_length
+    new_block[:, 0] = True
+    starts = rng.integers(0, n_days, (n_samples, n_days))
+
+    positions = np.arange(n_days)
+    block_start = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+    offsets = positions - block_start
+    return (np.take_along_axis(starts, block_start, axis=1) + offsets) % n_days
+
+def max_drawdowns(paths):
+    return (paths / np.maximum.accumulate(paths, axis=1) - 1).min(axis=1) * 100
+
+def bootstrap_task(n_samples, seed, returns, initial_value, block_length, band_positions):
+    rng = np.random.default_rng(seed)
+    indices = stationary_bootstrap_indices(rng, n_samples, len(returns), block_length)
+
+    paths = initial_value * np.cumprod(1 + returns[indices], axis=1)
+    paths = np.hstack([np.full((n_samples, 1), initial_value), paths])
+    return {
+        'final_value': paths[:, -1],
+        'max_drawdown': max_drawdowns(paths),
+        'band_paths': paths[:, band_positions].astype(np.float32)
+    }
+
+def shuffle_task(n_samples, seed, pnl, initial_value):
+    rng = np.random.default_rng(seed)
+    permutations = rng.random((n_samples, len(pnl))).argsort(axis=1)
+
+    paths = initial_value + np.cumsum(pnl[permutations], axis=1)
+    paths = np.hstack([np.full((n_samples, 1), initial_value), paths])
+    return {'final_value': paths[:, -1], 'max_drawdown': max_drawdowns(paths)}
+
+def friction_task(n_samples, seed, trips, prices, initial_value, commission, max_delay=MAX_ENTRY_DELAY,
+                  commission_range=COMMISSION_RANGE):
+    # Re-prices each round trip with a random entry delay (capped at the exit day) and a scaled commission rate
+    rng = np.random.default_rng(seed)
+    n_trips = len(trips['shares'])
+
+    delays = rng.integers(0, max_delay + 1, (n_samples, n_trips))
+    entry_rows = np.minimum(trips['entry_row'] + delays, trips['exit_row'])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        moves = prices[entry_rows, trips['column']] / prices[trips['entry_row'], trips['column']]
+    entry_prices = trips['entry_price'] * np.where(np.isfinite(moves), moves, 1.0)
+
+    rates = commission * rng.uniform(*commission_range, (n_samples, 1))
+    shares = trips['shares']
+    pnl = shares * (trips['exit_price'] - entry_prices) - rates * shares * (entry_prices + trips['exit_price'])
+
+    paths = initial_value + np.cumsum(pnl, axis=1)
+    paths = np.hstack([np.full((n_samples, 1), initial_value), paths])
+    return {'final_value': paths[:, -1], 'max_drawdown': max_drawdowns(paths)}
+
+def run_tasks(task, n_samples, n_jobs, seed, *args):
+    chunks = [SAMPLES_PER_TASK] * (n_samples // SAMPLES_PER_TASK)
+    if n_samples % SAMPLES_PER_TASK:
+        chunks.append(n_samples % SAMPLES_PER_TASK)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+
+    if n_jobs == 1 or len(chunks) == 1:
+        parts = [task(size, child, *args) for size, child in zip(chunks, seeds)]
+    else:
+        parts = Parallel(n_jobs=n_jobs)(delayed(task)(size, child, *args) for size, child in zip(chunks, seeds))
+
+    return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+def summarize(samples):
+    summary = {f"p{percentile}": float(value) for percentile, value in zip(PERCENTILES, np.percentile(samples, PERCENTILES))}
+    summary['mean'] = float(np.mean(samples))
+    return summary
+
+def summarize_samples(samples):
+    return {
+        'samples': len(samples['final_value']),
+        'final_value': summarize(samples['final_value']),
+        'max_drawdown': summarize(samples['max_drawdown'])
+    }
+
+def build_trip_arrays(trips, price_data):
+    dates, tickers, prices = price_data
+    date_rows = pd.DatetimeIndex(dates)
+    columns = {ticker: column for column, ticker in enumerate(tickers)}
+
+    entry_rows = date_rows.get_indexer(pd.DatetimeIndex(trips['entry_date']))
+    exit_rows = date_rows.get_indexer(pd.DatetimeIndex(trips['exit_date']))
+    ticker_columns = trips['ticker'].map(columns).fillna(-1).to_numpy(dtype=int)
+    valid = (entry_rows >= 0) & (exit_rows >= 0) & (ticker_columns >= 0)
+
+    # Trips outside the price grid get entry == exit row, so their delay is always zero
+    return {
+        'entry_row': np.where(valid, entry_rows, 0),
+        'exit_row': np.where(valid, exit_rows, 0),
+        'column': np.maximum(ticker_columns, 0),
+        'shares': trips['shares'].to_numpy(dtype=float),
+        'entry_price': trips['entry_price'].to_numpy(dtype=float),
+        'exit_price': trips['exit_price'].to_numpy(dtype=float)
+    }
+
+def run_robustness(daily_portfolio_value, transactions, initial_capital, commission=None, price_data=None,
+                   n_samples=DEFAULT_SAMPLES, block_length=DEFAULT_BLOCK_LENGTH, n_jobs=-1, seed=42):
+    dates, values = equity_arrays(daily_portfolio_value)
+    if len(values) < 2:
+        raise ValueError("Za mało danych do analizy odporności")
+
+    results = {}
+    returns = values[1:] / values[:-1] - 1
+    if n_samples * len(returns) < PARALLEL_MIN_CELLS:
+        # Worker start-up outweighs the resampling itself for short runs
+        n_jobs = 1
+    band_positions = np.unique(np.linspace(0, len(returns), min(BAND_POINTS, len(returns) + 1)).round().astype(int))
+
+    bootstrap = run_tasks(bootstrap_task, n_samples, n_jobs, seed, returns, values[0], block_length, band_positions)
+    bands = np.percentile(bootstrap['band_paths'], PERCENTILES, axis=0)
+    results['bootstrap'] = summarize_samples(bootstrap)
+    results['bands'] = {
+        'dates': dates[band_positions],
+        **{f"p{percentile}": band for percentile, band in zip(PERCENTILES, bands)}
+    }
+
+    trips = round_trips(ledger_arrays(transactions or []))
+    if len(trips) > 1:
+        pnl = trips['pnl'].to_numpy(dtype=float)
+        results['trade_shuffle'] = summarize_samples(
+            run_tasks(shuffle_task, n_samples, n_jobs, seed + 1, pnl, initial_capital)
+        )
+
+    if len(trips) > 0 and price_data is not None and commission is not None:
+        prices = np.asarray(price_data[2], dtype=float)
+        results['friction'] = summarize_samples(run_tasks(
+            friction_task, n_samples, n_jobs, seed + 2, build_trip_arrays(trips, price_data), prices,
+            initial_capital, commission
+        ))
+
+    return results
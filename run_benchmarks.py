@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.resolve()
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.cases import BENCHMARK_CASES, STARTUP_MODULES, BenchmarkContext
+from ml.models.model_registry import list_models
+from metrics import start_metrics_export
+
+warnings.filterwarnings('ignore', category=FutureWarning)
+warnings.filterwarnings('ignore', category=UserWarning)
+
+DEFAULT_RESULTS_DIR = PROJECT_ROOT / "benchmarks" / "results"
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="End-to-end simulation benchmarks on synthetic offline data")
+    parser.add_argument('--cases', nargs='+', default=list(BENCHMARK_CASES.keys()), choices=list(BENCHMARK_CASES.keys()))
+    parser.add_argument('--universe', nargs='+', type=int, default=[10, 100], help="Universe sizes (number of tickers)")
+    parser.add_argument('--history', nargs='+', type=int, default=[1260, 2520], help="History lengths (trading days)")
+    parser.add_argument('--models', nargs='+', default=list_models(), help="Models for the train_models case")
+    parser.add_argument('--startup-modules', nargs='+', default=STARTUP_MODULES,
+                        help="Modules timed by the startup_import case (fresh interpreter each run)")
+    parser.add_argument('--model', default='Decision Tree', help="Model used by the simulation cases")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="Result JSON path (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument('--compare', help="Earlier result JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=1.2, help="Slowdown ratio reported as a regression")
+    parser.add_argument('--verbose', action='store_true', help="Show simulator output instead of discarding it")
+    parser.add_argument('--metrics-port', type=int, help="Serve live Prometheus metrics on this port")
+    parser.add_argument('--metrics-file', help="Periodically write Prometheus text-format metrics to this file")
+    return parser.parse_args()
+
+def get_git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+def get_environment():
+    import numpy
+    import pandas
+    import sklearn
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': get_git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': numpy.__version__,
+        'pandas': pandas.__version__,
+        'sklearn': sklearn.__version__
+    }
+
+def time_case(case, context, repeat, variant=None, verbose=False):
+    timings = []
+    items = 0
+
+    for _ in range(repeat):
+        output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        with output:
+            args = (context, variant) if case['has_variants'] else (context,)
+            run, items = case['func'](*args)
+
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    return {
+        'timings': timings,
+        'min': best,
+        'median': statistics.median(timings),
+        'mean': statistics.fmean(timings),
+        'items': items,
+        'unit': case['unit'],
+        'items_per_second': items / best if best > 0 else None
+    }
+
+def run_suite(args):
+    results = []
+    first_combination = (args.universe[0], args.history[0])
+    variants = {'train_models': args.models, 'startup_import': args.startup_modules}
+
+    for universe_size in args.universe:
+        for history_length in args.history:
+            context = BenchmarkContext(universe_size, history_length, model_type=args.model)
+
+            for case_name in args.cases:
+                case = BENCHMARK_CASES[case_name]
+                if not case['scaled'] and (universe_size, history_length) != first_combination:
+                    continue
+                case_variants = variants[case_name] if case['has_variants'] else [None]
+
+                for variant in case_variants:
+                    name = f"{case_name}[{variant}]" if variant else case_name
+                    print(f"{name} universe={universe_size} history={history_length} ... ", end='', flush=True)
+
+                    try:
+                        result = time_case(case, context, args.repeat, variant, args.verbose)
+                    except Exception as e:
+                        print(f"FAILED: {e}")
+                        result = {'error': str(e)}
+                    else:
+                        print(f"{result['min']:.3f}s ({result['items_per_second']:.1f} {result['unit']}/s)")
+
+                    results.append({
+                        'case': name,
+                        'universe_size': universe_size,
+                        'history_length': history_length,
+                        **result
+                    })
+
+    return results
+
+def result_key(result):
+    return result['case'], result['universe_size'], result['history_length']
+
+def compare_results(results, baseline_path, threshold):
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {result_key(result): result for result in json.load(f)['results']}
+
+    print("\n" + "=" * 80)
+    print(f"Comparison with {baseline_path}")
+    print("=" * 80)
+
+    regressions = 0
+    for result in results:
+        previous = baseline.get(result_key(result))
+        if previous is None or 'min' not in previous or 'min' not in result:
+            continue
+
+        ratio = result['min'] / previous['min'] if previous['min'] > 0 else float('inf')
+        flag = "REGRESSION" if ratio > threshold else ""
+        regressions += bool(flag)
+        print(f"{result['case']:<40} {result['universe_size']:>5} {result['history_length']:>5} "
+              f"{previous['min']:>9.3f}s -> {result['min']:>9.3f}s  x{ratio:.2f} {flag}")
+
+    return regressions
+
+def main():
+    args = parse_args()
+
+    output_path = Path(args.output) if args.output else DEFAULT_RESULTS_DIR / f"{datetime.now():%Y%m%d_%H%M%S}.json"
+    output_path = output_path.resolve()
+    baseline_path = Path(args.compare).resolve() if args.compare else None
+
+    environment = get_environment()
+
+    metrics_registry = None
+    if args.metrics_port is not None or args.metrics_file:
+        metrics_file = str(Path(args.metrics_file).resolve()) if args.metrics_file else None
+        metrics_registry = start_metrics_export(port=args.metrics_port, textfile=metrics_file)
+
+    # Simulations write logs/ and wipe agent_logs/ relative to the cwd
+    working_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            results = run_suite(args)
+        finally:
+            os.chdir(working_directory)
+            if metrics_registry is not None:
+                metrics_registry.stop()
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment, 'results': results}, f, indent=2)
+    print(f"\nResults saved to {output_path}")
+
+    if baseline_path:
+        regressions = compare_results(results, baseline_path, args.threshold)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import threading
+import time
+
+DEFAULT_UPDATES_PER_SECOND = 10
+
+class SimulationControl:
+
+    def __init__(self, max_updates_per_second=DEFAULT_UPDATES_PER_SECOND):
+        self.min_interval = 1.0 / max_updates_per_second if max_updates_per_second else 0.0
+        self.cancel_event = threading.Event()
+        self.resume_event = threading.Event()
+        self.resume_event.set()
+        self.last_report = None
+
+    def reset(self):
+        self.cancel_event.clear()
+        self.resume_event.set()
+        self.last_report = None
+
+    def cancel(self):
+        self.cancel_event.set()
+        self.resume_event.set()
+
+    def pause(self):
+        if not self.cancel_event.is_set():
+            self.resume_event.clear()
+
+    def resume(self):
+        self.resume_event.set()
+
+    def is_cancelled(self):
+        return self.cancel_event.is_set()
+
+    def is_paused(self):
+        return not self.resume_event.is_set()
+
+    def checkpoint(self):
+        self.resume_event.wait()
+        return not self.cancel_event.is_set()
+
+    def should_report(self, force=False):
+        now = time.monotonic()
+        if force or self.last_report is None or now - self.last_report >= self.min_interval:
+            self.last_report = now
+            return True
+        return False
@@ -3,7 +3,12 @@ from tkinter import ttk, messagebox
 from chart_widget import ChartWidget
 from portfolio_widget import PortfolioWidget
 from manual_results_window import ManualResultsWindow
-from utils import format_currency, format_percentage
+from performance_report_window import PerformanceReportWindow
+from background_worker import BackgroundWorker
+import numpy as np
+from utils import format_currency, format_percentage, format_prediction_confidence
+
+SKIP_CHUNK_DAYS = 10
 
 class SimulationWindow:
     def __init__(self, parent, simulator):
@@ -14,6 +19,7 @@ class SimulationWindow:
         self.chart_widget = None
         self.portfolio_widget = None
         self.daily_actions = {}
+        self.worker = None
         
     def show(self):
         self.window = tk.Toplevel(self.parent)
@@ -21,6 +27,8 @@ class SimulationWindow:
         self.window.geometry("1400x900")
         self.window.state('zoomed')
         self.create_widgets()
+        self.worker = BackgroundWorker(self.window, name="simulation_window")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
         self.update_display()
         if self.simulator.tickers:
             self.current_ticker = self.simulator.tickers[0]
@@ -69,14 +77,19 @@ class SimulationWindow:
         self.skip_days_button = ttk.Button(bottom_frame, text="Przeskocz dni", command=self.skip_days)
         self.skip_days_button.pack(side=tk.LEFT, padx=(0, 10))
         
+        self.cancel_button = ttk.Button(bottom_frame, text="Anuluj", command=self.cancel_skip, state='disabled')
+        self.cancel_button.pack(side=tk.LEFT, padx=(0, 10))
+        
         self.next_day_button = ttk.Button(bottom_frame, text="NastÄ™pny dzieÅ„", command=self.next_day, style="Accent.TButton")
         self.next_day_button.pack(side=tk.LEFT, padx=(0, 10))
         
-        ttk.Button(bottom_frame, text="Resetuj", command=self.reset_simulation).pack(side=tk.LEFT, padx=(0, 10))
+        self.reset_button = ttk.Button(bottom_frame, text="Resetuj", command=self.reset_simulation)
+        self.reset_button.pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(bottom_frame, text="WyÅ›wietl historiÄ™", command=self.show_history).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(bottom_frame, text="PokaÅ¼ wykresy", command=self.show_results).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(bottom_frame, text="PokaÅ¼ logi", command=self.show_logs_info).pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Button(bottom_frame, text="Zamknij", command=self.window.destroy).pack(side=tk.RIGHT)
+        ttk.Button(bottom_frame, text="Raport wydajności", command=self.show_performance_report).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(bottom_frame, text="Zamknij", command=self.close).pack(side=tk.RIGHT)
     
     def create_left_panel(self, parent):
         notebook = ttk.Notebook(parent)
@@ -196,6 +209,7 @@ class SimulationWindow:
     def update_predictions(self):
         predictions = self.simulator.current_predictions
         prices = self.simulator.current_prices
+        probabilities = self.simulator.get_current_probabilities()
         self.predictions_text.config(state=tk.NORMAL)
         self.predictions_text.delete(1.0, tk.END)
         for ticker in self.simulator.tickers:
@@ -205,7 +219,12 @@ class SimulationWindow:
             self.predictions_text.insert(tk.END, f"{ticker}:\n")
             self.predictions_text.insert(tk.END, f"  Signal: {signal}\n")
             self.predictions_text.insert(tk.END, f"  Price: {format_currency(price)}\n")
-            self.predictions_text.insert(tk.END, f"  Prediction: {prediction}\n\n")
+            self.predictions_text.insert(tk.END, f"  Prediction: {prediction}\n")
+            if ticker in probabilities:
+                probability = probabilities[ticker]
+                confidence = format_prediction_confidence(np.array([[1 - probability, probability]]))[0]
+                self.predictions_text.insert(tk.END, f"  P(wzrost): {probability:.1%}, Confidence: {confidence}\n")
+            self.predictions_text.insert(tk.END, "\n")
         self.predictions_text.config(state=tk.DISABLED)
     
     def update_current_price(self):
@@ -271,33 +290,88 @@ class SimulationWindow:
         except ValueError:
             messagebox.showerror("Error", "Please enter a valid number of shares")
     
+    def set_busy(self, busy):
+        state = 'disabled' if busy else 'normal'
+        for button in (self.next_day_button, self.skip_days_button, self.buy_button, self.sell_button, self.reset_button):
+            button.config(state=state)
+        self.ticker_combo.config(state='disabled' if busy else 'readonly')
+        self.cancel_button.config(state='normal' if busy else 'disabled')
+    
+    def advance_days(self, days, progress, cancel_event):
+        advanced = 0
+        while advanced < days and not cancel_event.is_set():
+            chunk = min(SKIP_CHUNK_DAYS, days - advanced)
+            step = self.simulator.advance(chunk)
+            advanced += step
+            progress(advanced, days)
+            if step < chunk:
+                break
+        return advanced
+    
     def skip_days(self):
         try:
             days_to_skip = int(self.days_forward_entry.get())
             if days_to_skip <= 0:
                 raise ValueError("Number must be positive")
-            skipped = 0
-            for i in range(days_to_skip):
-                if self.simulator.next_day():
-                    skipped += 1
-                else:
-                    break
-            self.update_display()
-            self.update_chart()
-            if skipped < days_to_skip:
-                messagebox.showinfo("Info", f"Przeskoczono {skipped} dni. OsiÄ…gniÄ™to koniec symulacji.")
-            else:
-                messagebox.showinfo("Success", f"Przeskoczono {skipped} dni")
         except ValueError:
             messagebox.showerror("Error", "WprowadÅº poprawnÄ… liczbÄ™ dni")
+            return
+        
+        self.set_busy(True)
+        self.worker.submit(
+            lambda progress, cancel_event: self.advance_days(days_to_skip, progress, cancel_event),
+            on_done=lambda skipped: self.on_skip_done(days_to_skip, skipped),
+            on_progress=self.on_skip_progress,
+            on_error=self.on_worker_error
+        )
+    
+    def on_skip_progress(self, current, total):
+        self.progress_label.config(text=f"Przeskakiwanie: {current} / {total} dni")
+    
+    def on_skip_done(self, days_to_skip, skipped):
+        self.set_busy(False)
+        self.update_display()
+        self.update_chart()
+        if self.worker.is_cancelled():
+            messagebox.showinfo("Info", f"Przerwano po {skipped} dniach")
+        elif skipped < days_to_skip:
+            messagebox.showinfo("Info", f"Przeskoczono {skipped} dni. OsiÄ…gniÄ™to koniec symulacji.")
+        else:
+            messagebox.showinfo("Success", f"Przeskoczono {skipped} dni")
+    
+    def cancel_skip(self):
+        if self.worker.is_busy():
+            self.worker.cancel()
+            self.cancel_button.config(state='disabled')
     
     def next_day(self):
-        if self.simulator.next_day():
+        self.set_busy(True)
+        self.worker.submit(
+            lambda progress, cancel_event: self.simulator.next_day(),
+            on_done=self.on_next_day_done,
+            on_error=self.on_worker_error
+        )
+    
+    def on_next_day_done(self, advanced):
+        self.set_busy(False)
+        if advanced:
             self.update_display()
             self.update_chart()
         else:
+            self.update_display()
             messagebox.showinfo("Simulation Complete", "The simulation has reached the end date.")
     
+    def on_worker_error(self, error):
+        self.set_busy(False)
+        self.update_display()
+        self.update_chart()
+        messagebox.showerror("Error", f"Błąd symulacji: {str(error)}")
+    
+    def close(self):
+        if self.worker is not None:
+            self.worker.shutdown()
+        self.window.destroy()
+    
     def reset_simulation(self):
         result = messagebox.askyesno("Reset Simulation", "Are you sure you want to reset the simulation?")
         if result:
@@ -315,6 +389,9 @@ class SimulationWindow:
     def show_logs_info(self):
         messagebox.showinfo("Informacje o logach", "Logi w folderze 'logs'")
     
+    def show_performance_report(self):
+        PerformanceReportWindow(self.window, self.simulator.monitor).show()
+    
     def show_history(self):
         history_window = tk.Toplevel(self.window)
         history_window.title("Transaction History")
@@ -1,47 +1,62 @@
 import pandas as pd
 from datetime import datetime
-from agent_simulation import AgentSimulation, BasicStrategy, AggressiveStrategy, ConservativeStrategy
+from agent_simulation import BasicStrategy, AggressiveStrategy, ConservativeStrategy, ConfidenceStrategy
+from simulation_control import SimulationControl
+from multi_strategy_simulation import MultiStrategySimulation
+from result_store import compute_fingerprint
 
 class StrategyComparison:
-    def __init__(self, trading_simulator, progress_callback=None):
+    def __init__(self, trading_simulator, progress_callback=None, control=None, result_store=None):
         self.trading_simulator = trading_simulator
         self.progress_callback = progress_callback
+        self.control = control or SimulationControl()
+        self.result_store = result_store
         
         self.strategies = {
             "Basic Strategy": BasicStrategy(),
             "Aggressive Strategy": AggressiveStrategy(),
-            "Conservative Strategy": ConservativeStrategy()
+            "Conservative Strategy": ConservativeStrategy(),
+            "Confidence Strategy": ConfidenceStrategy()
         }
         
         self.results = {}
         
     def run_comparison(self):
-        total_strategies = len(self.strategies)
-        strategy_index = 0
+        pending = {}
         
         for strategy_name, strategy in self.strategies.items():
-            print(f"Running simulation for {strategy_name}...")
-            
-            def adjusted_progress_callback(current_day, total_days, progress):
-                overall_progress = (strategy_index * 100 + progress) / total_strategies
-                if self.progress_callback:
-                    self.progress_callback(
-                        current_day + strategy_index * total_days,
-                        total_days * total_strategies,
-                        overall_progress
-                    )
-            
-            agent_sim = AgentSimulation(
-                self.trading_simulator,
-                strategy,
-                adjusted_progress_callback
-            )
-            
-            success, message = agent_sim.run_simulation()
-            
+            if self.result_store is not None:
+                stored = self.load_stored_result(strategy)
+                if stored is not None:
+                    print(f"{strategy_name} loaded from result store")
+                    self.results[strategy_name] = stored
+                    continue
+            pending[strategy_name] = strategy
+        
+        if not pending or self.control.is_cancelled():
+            return self.results
+        
+        print(f"Running simulation for {', '.join(pending)}...")
+        
+        simulation = MultiStrategySimulation(
+            self.trading_simulator,
+            pending,
+            self.progress_callback,
+            self.control,
+            result_store=self.result_store
+        )
+        outcomes = simulation.run_simulation()
+        
+        if simulation.is_cancelled:
+            print("Comparison cancelled")
+            return self.results
+        
+        for strategy_name, (success, message) in outcomes.items():
+            agent_sim = simulation.agents[strategy_name]
             if success:
                 self.results[strategy_name] = {
                     'daily_portfolio_value': agent_sim.agent_portfolio.daily_portfolio_value.copy(),
+                    'transactions': agent_sim.agent_portfolio.transaction_history.copy(),
                     'stats': agent_sim.stats.copy(),
                     'initial_capital': self.trading_simulator.initial_capital
                 }
@@ -49,10 +64,11 @@ class StrategyComparison:
             else:
                 print(f"{strategy_name} failed: {message}")
                 self.results[strategy_name] = None
-            
-            strategy_index += 1
-            
-            if strategy_index < total_strategies:
-                self.trading_simulator.reset_simulation()
         
-        return self.results
\ No newline at end of file
+        return {name: self.results[name] for name in self.strategies if name in self.results}
+    
+    def load_stored_result(self, strategy):
+        run_id = self.result_store.find_run(compute_fingerprint(self.trading_simulator, strategy))
+        if run_id is None:
+            return None
+        return self.result_store.load_comparison_result(run_id)
\ No newline at end of file
@@ -5,12 +5,20 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolb
 from matplotlib.figure import Figure
 import pandas as pd
 from utils import format_currency, format_percentage
+from analytics import compute_performance_metrics
+from robustness import run_robustness
+from background_worker import BackgroundWorker
 
 class StrategyComparisonWindow:
-    def __init__(self, parent, comparison_results):
+    def __init__(self, parent, comparison_results, trading_simulator=None):
         self.parent = parent
         self.comparison_results = comparison_results
+        self.trading_simulator = trading_simulator
         self.window = None
+        self.ax = None
+        self.canvas = None
+        self.strategy_colors = {}
+        self.worker = None
         
     def show(self):
         self.window = tk.Toplevel(self.parent)
@@ -18,6 +26,7 @@ class StrategyComparisonWindow:
         self.window.geometry("1400x900")
         self.window.state('zoomed')
         self.create_widgets()
+        self.worker = BackgroundWorker(self.window, name="robustness")
         
     def create_widgets(self):
         main_frame = ttk.Frame(self.window, padding=10)
@@ -36,6 +45,11 @@ class StrategyComparisonWindow:
         
         self.create_summary_table(summary_frame)
         
+        robustness_frame = ttk.LabelFrame(main_frame, text="Odporność (Monte Carlo)", padding=15)
+        robustness_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        self.create_robustness_section(robustness_frame)
+        
     def create_comparison_chart(self, parent):
         figure = Figure(figsize=(14, 8))
         ax = figure.add_subplot(111)
@@ -43,7 +57,8 @@ class StrategyComparisonWindow:
         colors = {
             'Basic Strategy': '#1f77b4',
             'Aggressive Strategy': '#d62728',
-            'Conservative Strategy': '#2ca02c'
+            'Conservative Strategy': '#2ca02c',
+            'Confidence Strategy': '#9467bd'
         }
         
         initial_capital = None
@@ -63,9 +78,10 @@ class StrategyComparisonWindow:
             if initial_capital is None:
                 initial_capital = result['initial_capital']
             
-            ax.plot(dates, values, linewidth=2, 
-                   color=colors.get(strategy_name, '#000000'), 
-                   label=strategy_name)
+            line, = ax.plot(dates, values, linewidth=2, 
+                            color=colors.get(strategy_name), 
+                            label=strategy_name)
+            self.strategy_colors[strategy_name] = line.get_color()
         
         if initial_capital is not None:
             ax.axhline(y=initial_capital, color='black', linestyle='--', 
@@ -85,9 +101,13 @@ class StrategyComparisonWindow:
         toolbar = NavigationToolbar2Tk(canvas, parent)
         toolbar.update()
         
+        self.ax = ax
+        self.canvas = canvas
+        
     def create_summary_table(self, parent):
         columns = ('Strategia', 'Kapitał początkowy', 'Wartość końcowa', 
-                  'Zwrot ($)', 'Zwrot (%)', 'Transakcje', 'Dokładność (%)')
+                  'Zwrot ($)', 'Zwrot (%)', 'CAGR (%)', 'Sharpe', 'Sortino', 'Max DD (%)',
+                  'Transakcje', 'Win rate (%)', 'Dokładność (%)')
         
         tree = ttk.Treeview(parent, columns=columns, show='headings', height=4)
         
@@ -96,16 +116,16 @@ class StrategyComparisonWindow:
             if col == 'Strategia':
                 tree.column(col, width=180, anchor=tk.W)
             else:
-                tree.column(col, width=140, anchor=tk.CENTER)
+                tree.column(col, width=100, anchor=tk.CENTER)
         
         for strategy_name, result in self.comparison_results.items():
             if result is None:
-                tree.insert('', tk.END, values=(
-                    strategy_name, 'BŁĄD', 'BŁĄD', 'BŁĄD', 'BŁĄD', 'BŁĄD', 'BŁĄD'
-                ))
+                tree.insert('', tk.END, values=(strategy_name,) + ('BŁĄD',) * (len(columns) - 1))
                 continue
             
             stats = result['stats']
+            if 'sharpe_ratio' not in stats:
+                stats = {**compute_performance_metrics(result['daily_portfolio_value']), **stats}
             initial_capital = result['initial_capital']
             final_value = stats.get('final_portfolio_value', initial_capital)
             total_return = stats.get('total_return', 0)
@@ -119,8 +139,98 @@ class StrategyComparisonWindow:
                 format_currency(final_value),
                 format_currency(total_return),
                 format_percentage(return_pct),
+                format_percentage(stats['cagr']),
+                f"{stats['sharpe_ratio']:.2f}",
+                f"{stats['sortino_ratio']:.2f}",
+                format_percentage(stats['max_drawdown']),
                 transactions,
+                format_percentage(stats.get('win_rate', float('nan'))),
                 f"{accuracy:.2f}%"
             ))
         
-        tree.pack(fill=tk.X, expand=True)
\ No newline at end of file
+        tree.pack(fill=tk.X, expand=True)
+    
+    def create_robustness_section(self, parent):
+        controls = ttk.Frame(parent)
+        controls.pack(fill=tk.X)
+        
+        self.robustness_button = ttk.Button(controls, text="Analiza odporności", command=self.start_robustness)
+        self.robustness_button.pack(side=tk.LEFT)
+        self.robustness_status = ttk.Label(controls, text="Bootstrap blokowy zwrotów, tasowanie transakcji, "
+                                                          "losowe opóźnienia wejścia i prowizje (pasma 5-95%)",
+                                           foreground="gray")
+        self.robustness_status.pack(side=tk.LEFT, padx=(10, 0))
+        
+        columns = ('Strategia', 'Metoda', 'Wartość końcowa p5', 'Wartość końcowa p50', 'Wartość końcowa p95',
+                   'Max DD p5 (%)', 'Max DD p50 (%)', 'Max DD p95 (%)')
+        self.robustness_tree = ttk.Treeview(parent, columns=columns, show='headings', height=6)
+        for col in columns:
+            self.robustness_tree.heading(col, text=col)
+            self.robustness_tree.column(col, width=180 if col == 'Strategia' else 120,
+                                        anchor=tk.W if col == 'Strategia' else tk.CENTER)
+        self.robustness_tree.pack(fill=tk.X, expand=True, pady=(10, 0))
+    
+    def get_price_data(self):
+        simulator = self.trading_simulator
+        if simulator is None or simulator.price_matrix is None:
+            return None, None
+        return (simulator.trading_dates, simulator.matrix_tickers, simulator.price_matrix), simulator.commission
+    
+    def start_robustness(self):
+        if self.worker.is_busy():
+            return
+        
+        price_data, commission = self.get_price_data()
+        results = {name: result for name, result in self.comparison_results.items() if result is not None}
+        
+        def task(progress, cancel_event):
+            robustness = {}
+            for index, (name, result) in enumerate(results.items()):
+                if cancel_event.is_set():
+                    break
+                robustness[name] = run_robustness(
+                    result['daily_portfolio_value'], result.get('transactions'), result['initial_capital'],
+                    commission, price_data
+                )
+                progress(index + 1, len(results))
+            return robustness
+        
+        self.robustness_button.config(state="disabled")
+        self.robustness_status.config(text="Trwa losowanie...")
+        self.worker.submit(task, on_done=self.on_robustness_done, on_progress=self.on_robustness_progress,
+                           on_error=self.on_robustness_error)
+    
+    def on_robustness_progress(self, current, total):
+        self.robustness_status.config(text=f"Strategie: {current} z {total}")
+    
+    def on_robustness_error(self, error):
+        self.robustness_button.config(state="normal")
+        self.robustness_status.config(text=f"Błąd analizy odporności: {str(error)}")
+    
+    def on_robustness_done(self, robustness):
+        self.robustness_button.config(state="normal")
+        self.robustness_status.config(text="Analiza odporności zakończona")
+        
+        method_names = {'bootstrap': 'Bootstrap blokowy', 'trade_shuffle': 'Tasowanie transakcji',
+                        'friction': 'Opóźnienia i prowizje'}
+        self.robustness_tree.delete(*self.robustness_tree.get_children())
+        
+        for strategy_name, result in robustness.items():
+            for method, label in method_names.items():
+                if method not in result:
+                    continue
+                final_value = result[method]['final_value']
+                drawdown = result[method]['max_drawdown']
+                self.robustness_tree.insert('', tk.END, values=(
+                    strategy_name, label,
+                    format_currency(final_value['p5']), format_currency(final_value['p50']),
+                    format_currency(final_value['p95']),
+                    f"{drawdown['p5']:.2f}", f"{drawdown['p50']:.2f}", f"{drawdown['p95']:.2f}"
+                ))
+            
+            bands = result['bands']
+            self.ax.fill_between(pd.to_datetime(bands['dates']), bands['p5'], bands['p95'],
+                                 color=self.strategy_colors.get(strategy_name), alpha=0.12, linewidth=0)
+        
+        self.canvas.draw_idle()
+
@@ -0,0 +1,170 @@
+import tkinter as tk
+from tkinter import ttk
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+import pandas as pd
+import numpy as np
+
+CHART_HEIGHT = 580
+
+def compute_position_values(transactions):
+    ledger = pd.DataFrame(transactions)
+    if ledger.empty:
+        return {}
+
+    ledger['date'] = pd.to_datetime(ledger['date'])
+    tickers = ledger['ticker'].unique()
+    ledger = ledger.sort_values('date', kind='mergesort').reset_index(drop=True)
+
+    signed_shares = np.select(
+        [ledger['action'] == 'BUY', ledger['action'] == 'SELL'],
+        [ledger['shares'], -ledger['shares']],
+        0
+    )
+    shares_held = pd.Series(signed_shares).groupby(ledger['ticker'], sort=False).cumsum()
+
+    dates = ledger['date'].to_numpy()
+    values = (shares_held * ledger['price']).to_numpy(dtype=float)
+    rows = ledger.groupby('ticker', sort=False).indices
+
+    return {ticker: (dates[rows[ticker]], values[rows[ticker]]) for ticker in tickers}
+
+
+class TickerChartsPanel:
+    def __init__(self, parent, position_values):
+        self.position_values = position_values
+        self.tickers = list(position_values)
+        self.placeholders = {}
+        self.slots = []
+        self.assigned = {}
+        self.refresh_job = None
+
+        self.create_widgets(parent)
+
+    def create_widgets(self, parent):
+        select_frame = ttk.Frame(parent)
+        select_frame.pack(fill=tk.X, padx=10, pady=(5, 0))
+
+        ttk.Label(select_frame, text="Ticker:").pack(side=tk.LEFT)
+        self.ticker_combo = ttk.Combobox(select_frame, values=self.tickers, state="readonly", width=15)
+        self.ticker_combo.pack(side=tk.LEFT, padx=(5, 0))
+        self.ticker_combo.bind('<<ComboboxSelected>>', lambda event: self.scroll_to(self.ticker_combo.get()))
+
+        canvas_frame = ttk.Frame(parent)
+        canvas_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.canvas = tk.Canvas(canvas_frame, yscrollcommand=self.on_scroll)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.config(command=self.canvas.yview)
+
+        self.inner_frame = ttk.Frame(self.canvas)
+        self.window_id = self.canvas.create_window((0, 0), window=self.inner_frame, anchor='nw')
+        self.canvas.bind('<Configure>', self.on_canvas_configure)
+
+        for ticker in self.tickers:
+            placeholder = ttk.LabelFrame(self.inner_frame, text=f"{ticker} - Wartość Portfolio",
+                                         padding=10, height=CHART_HEIGHT)
+            placeholder.pack(fill=tk.X, padx=10, pady=10)
+            placeholder.pack_propagate(False)
+
+            body = ttk.Frame(placeholder)
+            body.pack(fill=tk.BOTH, expand=True)
+            self.placeholders[ticker] = body
+
+        self.inner_frame.update_idletasks()
+        self.canvas.config(scrollregion=self.canvas.bbox("all"))
+        self.schedule_refresh()
+
+    def on_canvas_configure(self, event):
+        self.canvas.itemconfig(self.window_id, width=event.width)
+        self.schedule_refresh()
+
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.schedule_refresh()
+
+    def scroll_to(self, ticker):
+        if ticker not in self.placeholders:
+            return
+        total_height = self.inner_frame.winfo_height()
+        if total_height > 0:
+            self.canvas.yview_moveto(self.placeholders[ticker].master.winfo_y() / total_height)
+
+    def schedule_refresh(self):
+        if self.refresh_job is None:
+            self.refresh_job = self.canvas.after_idle(self.refresh_visible)
+
+    def get_visible_tickers(self):
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+
+        visible = []
+        for ticker, body in self.placeholders.items():
+            frame = body.master
+            if frame.winfo_y() < bottom and frame.winfo_y() + frame.winfo_height() > top:
+                visible.append(ticker)
+        return visible
+
+    def refresh_visible(self):
+        self.refresh_job = None
+        visible = self.get_visible_tickers()
+
+        for ticker in [ticker for ticker in self.assigned if ticker not in visible]:
+            self.release_slot(ticker)
+
+        for ticker in visible:
+            if ticker not in self.assigned:
+                self.render(ticker)
+
+    def acquire_slot(self):
+        for slot in self.slots:
+            if slot['ticker'] is None:
+                return slot
+
+        frame = ttk.Frame(self.inner_frame)
+        figure = Figure(figsize=(12, 5))
+        canvas = FigureCanvasTkAgg(figure, frame)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        toolbar = NavigationToolbar2Tk(canvas, frame)
+        toolbar.update()
+
+        slot = {'frame': frame, 'figure': figure, 'canvas': canvas, 'toolbar': toolbar, 'ticker': None}
+        self.slots.append(slot)
+        return slot
+
+    def release_slot(self, ticker):
+        slot = self.assigned.pop(ticker)
+        slot['frame'].place_forget()
+        slot['ticker'] = None
+
+    def render(self, ticker):
+        slot = self.acquire_slot()
+        slot['ticker'] = ticker
+        self.assigned[ticker] = slot
+
+        dates, values = self.position_values[ticker]
+        draw_position_chart(slot['figure'], ticker, dates, values)
+        slot['toolbar'].update()
+        slot['canvas'].draw_idle()
+
+        body = self.placeholders[ticker]
+        slot['frame'].place(in_=body, x=0, y=0, relwidth=1, relheight=1)
+        slot['frame'].lift()
+
+
+def draw_position_chart(figure, ticker, dates, portfolio_values):
+    figure.clear()
+    ax = figure.add_subplot(111)
+
+    ax.plot(dates, portfolio_values, linewidth=2, color='#2ca02c', marker='o', markersize=4)
+    ax.fill_between(dates, portfolio_values, 0, alpha=0.3, color='#2ca02c')
+    ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
+
+    ax.set_title(f'{ticker} - Wartość Pozycji w Portfolio', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Data', fontsize=11)
+    ax.set_ylabel('Wartość Portfolio ($)', fontsize=11)
+    ax.grid(True, alpha=0.3)
+    figure.autofmt_xdate()
@@ -1,14 +1,27 @@
 import pandas as pd
 import numpy as np
+import bisect
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from data.data_loader import DataLoader
 from data.data_processor import DataProcessor
 from portfolio_manager import PortfolioManager
 from transaction_logger import TransactionLogger
-from utils import get_model_class, prepare_features_for_prediction, validate_data_completeness
+from utils import get_model_class, get_model_capabilities, get_feature_drop_columns, prepare_features_for_prediction, validate_data_completeness
+from config import DEFAULT_SETTINGS
+from profiling import PerformanceMonitor
+from metrics import get_metrics_registry
+
+METRICS = get_metrics_registry()
+SIMULATED_DAYS = METRICS.counter('simulated_days_total', "Trading days advanced by TradingSimulator.next_day")
+PREDICTIONS = METRICS.counter('predictions_total', "Per-ticker predictions served to the simulation")
+BATCH_PREDICTIONS = METRICS.counter('batch_predictions_total', "Rows predicted by batch segment computations")
+RETRAINS = METRICS.counter('retrains_total', "Walk-forward retraining rounds")
 
 class TradingSimulator:
-    def __init__(self, tickers, start_date, end_date, model_type, commission, days_ahead, initial_capital, indicators, selected_features):
+    def __init__(self, tickers, start_date, end_date, model_type, commission, days_ahead, initial_capital, indicators, selected_features,
+                 retrain_frequency=None, training_window='expanding', rolling_window_size=None, n_jobs=None,
+                 pooled=False, pooled_encoding=None, ticker_sectors=None, data_provider=None, monitor=None):
         self.tickers = tickers
         self.start_date = pd.to_datetime(start_date)
         self.end_date = pd.to_datetime(end_date)
@@ -18,10 +31,27 @@ class TradingSimulator:
         self.initial_capital = initial_capital
         self.indicators = indicators
         self.selected_features = selected_features 
+        self.feature_drop_columns = get_feature_drop_columns(selected_features)
+        self.data_provider = data_provider
+        self.monitor = monitor or PerformanceMonitor()
+        
+        self.retrain_frequency = retrain_frequency
+        self.training_window = training_window
+        self.rolling_window_size = rolling_window_size or DEFAULT_SETTINGS['rolling_window_size']
+        self.n_jobs = n_jobs or DEFAULT_SETTINGS['retrain_n_jobs']
+        
+        self.pooled = pooled
+        self.pooled_encoding = pooled_encoding
+        self.ticker_sectors = dict(ticker_sectors or {})
+        self.pooled_model = None
+        self.model_capabilities = get_model_capabilities(model_type)
+        self.pooled_columns = []
+        self.encoding_columns = []
+        self.ticker_encodings = {}
         
         self.data_processor = DataProcessor()
         self.portfolio_manager = PortfolioManager(initial_capital, commission)
-        self.logger = TransactionLogger()  
+        self.logger = TransactionLogger(monitor=self.monitor)
         
         self.ticker_data = {}
         self.ticker_models = {}
@@ -32,10 +62,28 @@ class TradingSimulator:
         self.current_prices = {}
         self.previous_prices = {}  
         
+        self.current_probabilities = {}
+        
+        self.feature_cache = {}
+        self.retrain_dates = set()
+        self.train_end_positions = {}
+        
+        self.matrix_tickers = []
+        self.cache_rows = None
+        self.price_matrix = None
+        self.prediction_matrix = None
+        self.probability_matrix = None
+        self.segment_starts = [0]
+        self.computed_segments = set()
+        
         self.is_setup = False
         self.is_trained = False
     
     def setup(self):
+        with self.monitor.capture(), self.monitor.phase('setup'):
+            self._setup()
+    
+    def _setup(self):
         print("Rozpoczynam konfigurację symulatora...")
         
         successful_tickers = []
@@ -44,26 +92,31 @@ class TradingSimulator:
             print(f"Przetwarzam dane dla {ticker}...")
             
             try:
-                data_loader = DataLoader(ticker)
-                ticker_data = data_loader.load_data()
+                data_loader = DataLoader(ticker, self.data_provider)
+                with self.monitor.phase('setup.load_data'):
+                    ticker_data = data_loader.load_data()
                 
                 is_valid, message = validate_data_completeness(ticker_data)  
                 if not is_valid:
                     print(f"Błąd danych dla {ticker}: {message}")
                     continue
                 
-                ticker_data = self.data_processor.calculate_technical_indicators(ticker_data, self.indicators, self.selected_features)
-                ticker_data = self.data_processor.make_target(ticker_data, self.days_ahead)
+                with self.monitor.phase('setup.indicators'):
+                    ticker_data = self.data_processor.calculate_technical_indicators(ticker_data, self.indicators, self.selected_features)
                 
-                train_data, test_data, test_start_idx, test_end_idx = self.data_processor.split_data(
-                    ticker_data, self.start_date, self.end_date, self.days_ahead
-                )
+                with self.monitor.phase('setup.target_split'):
+                    ticker_data = self.data_processor.make_target(ticker_data, self.days_ahead)
+                    train_data, test_data, test_start_idx, test_end_idx = self.data_processor.split_data(
+                        ticker_data, self.start_date, self.end_date, self.days_ahead
+                    )
                 
                 if test_data.empty:
                     print(f"Brak danych testowych dla {ticker}")
                     continue
                 
                 self.ticker_data[ticker] = ticker_data
+                with self.monitor.phase('setup.feature_cache'):
+                    self.feature_cache[ticker] = self._build_feature_cache(ticker_data)
                 self.train_test_data[ticker] = {
                     'train': train_data,
                     'test': test_data,
@@ -71,9 +124,12 @@ class TradingSimulator:
                     'test_end_idx': test_end_idx
                 }
                 
-                model_class = get_model_class(self.model_type)
-                model = model_class.build_model()
-                self.ticker_models[ticker] = model
+                if self.pooled:
+                    if self.pooled_encoding in ('sector', 'ticker_sector') and ticker not in self.ticker_sectors:
+                        self.ticker_sectors[ticker] = data_loader.load_sector()
+                else:
+                    model_class = get_model_class(self.model_type)
+                    self.ticker_models[ticker] = model_class.build_model()
                 
                 successful_tickers.append(ticker)
                 print(f"Zakończono przetwarzanie {ticker}")
@@ -86,6 +142,10 @@ class TradingSimulator:
             raise ValueError("Nie udało się załadować danych dla żadnego tickera")
         
         self.tickers = successful_tickers
+        
+        if self.pooled:
+            self._setup_pooled_model()
+        
         self._setup_trading_dates()
         self.is_setup = True
         print("Konfiguracja symulatora zakończona!")
@@ -103,41 +163,308 @@ class TradingSimulator:
         self.trading_dates = sorted(list(all_dates))
         if isinstance(self.trading_dates[0], str):
             self.trading_dates = [pd.to_datetime(date) for date in self.trading_dates]
+        
+        self.retrain_dates = self._get_retrain_dates()
+        self._setup_prediction_matrices()
     
-    def train_models(self):
-        if not self.is_setup:
-            raise ValueError("Symulator nie został skonfigurowany. Uruchom setup() najpierw.")
+    def _setup_prediction_matrices(self):
+        self.matrix_tickers = list(self.ticker_data.keys())
+        dates = pd.DatetimeIndex(self.trading_dates)
+        shape = (len(dates), len(self.matrix_tickers))
+        
+        self.cache_rows = np.full(shape, -1, dtype=np.int64)
+        self.price_matrix = np.full(shape, np.nan)
+        
+        for column, ticker in enumerate(self.matrix_tickers):
+            cache = self.feature_cache[ticker]
+            rows = cache['dates'].get_indexer(dates)
+            self.cache_rows[:, column] = rows
+            self.price_matrix[rows >= 0, column] = cache['close'][rows[rows >= 0]]
+        
+        self.prediction_matrix = np.zeros(shape, dtype=np.int8)
+        self.probability_matrix = np.full(shape, np.nan, dtype=np.float32)
+        
+        date_positions = {date: index for index, date in enumerate(self.trading_dates)}
+        self.segment_starts = sorted({0} | {date_positions[date] for date in self.retrain_dates})
+        self.computed_segments = set()
+    
+    def _build_feature_cache(self, ticker_data):
+        dataset = self.data_processor.prepare_dataset(ticker_data)
         
-        print("Rozpoczynam trenowanie modeli...")
+        return {
+            'dates': pd.DatetimeIndex(dataset['Date']),
+            'X': prepare_features_for_prediction(dataset, self.feature_drop_columns),
+            'y': dataset['Target'].values,
+            'close': dataset['Close'].values
+        }
+    
+    def _setup_pooled_model(self):
+        columns = None
+        for ticker in self.tickers:
+            ticker_columns = self.feature_cache[ticker]['X'].columns
+            columns = list(ticker_columns) if columns is None else [col for col in columns if col in ticker_columns]
+        self.pooled_columns = columns
+        
+        encoding_values = {}
+        if self.pooled_encoding in ('ticker', 'ticker_sector'):
+            for ticker in self.tickers:
+                encoding_values.setdefault(ticker, []).append(f"Ticker_{ticker}")
+        if self.pooled_encoding in ('sector', 'ticker_sector'):
+            for ticker in self.tickers:
+                sector = self.ticker_sectors.get(ticker) or 'Unknown'
+                encoding_values.setdefault(ticker, []).append(f"Sector_{sector}")
+        
+        self.encoding_columns = sorted({col for values in encoding_values.values() for col in values})
+        self.ticker_encodings = {
+            ticker: {col: float(col in encoding_values.get(ticker, [])) for col in self.encoding_columns}
+            for ticker in self.tickers
+        }
         
-        for ticker, model in self.ticker_models.items():
-            print(f"Trenowanie modelu dla {ticker}...")
-            
+        model_class = get_model_class(self.model_type)
+        self.pooled_model = model_class.build_model()
+        self.ticker_models = {ticker: self.pooled_model for ticker in self.tickers}
+    
+    def _get_pooled_features(self, ticker, X):
+        X = X[self.pooled_columns]
+        if self.encoding_columns:
+            X = X.assign(**self.ticker_encodings[ticker])
+        return X
+    
+    def _get_pooled_training_set(self, date=None):
+        features = []
+        targets = []
+        
+        for ticker in list(self.ticker_models):
             try:
-                train_data = self.train_test_data[ticker]['train']
-                
-                X_train = prepare_features_for_prediction(train_data, self.selected_features)
-                y_train = train_data['Target']
-                
-                model_class = get_model_class(self.model_type)
-                trained_model = model_class.train_model(model, X_train, y_train)
-                self.ticker_models[ticker] = trained_model
-                
-                print(f"Model dla {ticker} został wytrenowany!")
+                train_start, train_end = self._get_training_slice(ticker, date)
+                cache = self.feature_cache[ticker]
+                features.append(self._get_pooled_features(ticker, cache['X'].iloc[train_start:train_end]))
+                targets.append(cache['y'][train_start:train_end])
+                self.train_end_positions[ticker] = train_end
                 
             except Exception as e:
-                print(f"Błąd podczas trenowania modelu dla {ticker}: {str(e)}")
+                print(f"Błąd podczas przygotowania danych treningowych dla {ticker}: {str(e)}")
                 del self.ticker_models[ticker]
         
+        if not features:
+            raise ValueError("Żaden ticker nie ma danych do trenowania wspólnego modelu")
+        
+        return pd.concat(features, ignore_index=True), np.concatenate(targets)
+    
+    def _train_pooled_model(self, date=None):
+        X_train, y_train = self._get_pooled_training_set(date)
+        print(f"Trenowanie wspólnego modelu na {len(X_train)} wierszach ({len(self.ticker_models)} tickerów)...")
+        
+        model = self.pooled_model
+        params = model.get_params()
+        if date is not None and params.get('warm_start') and 'n_estimators' in params:
+            model.set_params(n_estimators=params['n_estimators'] + DEFAULT_SETTINGS['warm_start_increment'])
+        
+        model_class = get_model_class(self.model_type)
+        self.pooled_model = model_class.train_model(model, X_train, y_train)
+        self.ticker_models = {ticker: self.pooled_model for ticker in self.ticker_models}
+    
+    def _get_segment_rows(self, column, start, end):
+        rows = self.cache_rows[start:end, column]
+        valid = np.flatnonzero(rows >= 0)
+        return valid + start, rows[valid]
+    
+    def _predict_pooled_segment(self, start, end):
+        model_class = get_model_class(self.model_type)
+        columns = []
+        positions = []
+        features = []
+        
+        for column, ticker in enumerate(self.matrix_tickers):
+            if ticker not in self.ticker_models:
+                continue
+            
+            matrix_rows, cache_rows = self._get_segment_rows(column, start, end)
+            if len(matrix_rows) == 0:
+                continue
+            
+            columns.append(np.full(len(matrix_rows), column))
+            positions.append(matrix_rows)
+            features.append(self._get_pooled_features(ticker, self.feature_cache[ticker]['X'].iloc[cache_rows]))
+        
+        if not features:
+            return
+        
+        X = pd.concat(features, ignore_index=True)
+        columns = np.concatenate(columns)
+        positions = np.concatenate(positions)
+        
+        try:
+            self.prediction_matrix[positions, columns] = model_class.predict(self.pooled_model, X)
+            self.probability_matrix[positions, columns] = model_class.predict_proba(self.pooled_model, X)
+        except Exception as e:
+            print(f"Błąd predykcji wspólnego modelu: {str(e)}")
+    
+    def is_walk_forward(self):
+        return self.retrain_frequency is not None
+    
+    def _get_retrain_dates(self):
+        if not self.is_walk_forward() or len(self.trading_dates) < 2:
+            return set()
+        
+        if self.retrain_frequency == 'monthly':
+            return {
+                date for previous, date in zip(self.trading_dates, self.trading_dates[1:])
+                if (date.year, date.month) != (previous.year, previous.month)
+            }
+        
+        step = int(self.retrain_frequency)
+        if step <= 0:
+            raise ValueError("Częstotliwość retrenowania musi być dodatnia")
+        
+        return set(self.trading_dates[step::step])
+    
+    def _get_training_slice(self, ticker, date=None):
+        cache = self.feature_cache[ticker]
+        
+        if date is None:
+            position = self.train_test_data[ticker]['test_start_idx']
+        else:
+            position = cache['dates'].searchsorted(pd.to_datetime(date))
+        
+        return self.data_processor.get_training_window(
+            position, self.days_ahead, self.training_window, self.rolling_window_size
+        )
+    
+    def train_models(self):
+        if not self.is_setup:
+            raise ValueError("Symulator nie został skonfigurowany. Uruchom setup() najpierw.")
+        
+        print("Rozpoczynam trenowanie modeli...")
+        
+        with self.monitor.capture(), self.monitor.phase('train_models'):
+            if self.pooled:
+                self._train_pooled_model()
+            else:
+                for ticker, model in list(self.ticker_models.items()):
+                    print(f"Trenowanie modelu dla {ticker}...")
+                    
+                    try:
+                        train_start, train_end = self._get_training_slice(ticker)
+                        with self.monitor.phase('train_models.fit'):
+                            self.ticker_models[ticker] = self._fit_model(ticker, model, train_start, train_end)
+                        self.train_end_positions[ticker] = train_end
+                        
+                        print(f"Model dla {ticker} został wytrenowany!")
+                        
+                    except Exception as e:
+                        print(f"Błąd podczas trenowania modelu dla {ticker}: {str(e)}")
+                        del self.ticker_models[ticker]
+        
+        self.computed_segments = set()
         self.is_trained = True
         print("Trenowanie modeli zakończone!")
     
+    def _fit_model(self, ticker, model, train_start, train_end):
+        cache = self.feature_cache[ticker]
+        X_train = cache['X'].iloc[train_start:train_end]
+        y_train = cache['y'][train_start:train_end]
+        
+        model_class = get_model_class(self.model_type)
+        return model_class.train_model(model, X_train, y_train)
+    
+    def _update_model(self, ticker, model, train_start, train_end):
+        cache = self.feature_cache[ticker]
+        previous_end = self.train_end_positions.get(ticker, train_start)
+        
+        if self.model_capabilities['partial_fit'] and previous_end < train_end:
+            new_start = max(previous_end, train_start)
+            model_class = get_model_class(self.model_type)
+            return model_class.partial_fit(model, cache['X'].iloc[new_start:train_end], cache['y'][new_start:train_end])
+        
+        params = model.get_params()
+        if params.get('warm_start') and 'n_estimators' in params:
+            model.set_params(n_estimators=params['n_estimators'] + DEFAULT_SETTINGS['warm_start_increment'])
+        
+        return self._fit_model(ticker, model, train_start, train_end)
+    
+    def _retrain_ticker(self, ticker, date):
+        train_start, train_end = self._get_training_slice(ticker, date)
+        
+        if train_end <= self.train_end_positions.get(ticker, 0) and self.training_window == 'expanding':
+            return ticker, self.ticker_models[ticker], self.train_end_positions[ticker]
+        
+        model = self._update_model(ticker, self.ticker_models[ticker], train_start, train_end)
+        return ticker, model, train_end
+    
+    def retrain_models(self, date):
+        print(f"Retrenowanie modeli (walk-forward) na dzień {date}...")
+        
+        if self.pooled:
+            self._train_pooled_model(date)
+            return
+        
+        tickers = list(self.ticker_models.keys())
+        if self.model_capabilities['n_jobs']:
+            max_workers = 1
+        else:
+            max_workers = max(1, min(self.n_jobs, len(tickers)))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._retrain_ticker, ticker, date) for ticker in tickers]
+            
+            for future in futures:
+                try:
+                    ticker, model, train_end = future.result()
+                    self.ticker_models[ticker] = model
+                    self.train_end_positions[ticker] = train_end
+                except Exception as e:
+                    print(f"Błąd podczas retrenowania modelu: {str(e)}")
+    
     def get_current_date(self):
         if self.current_date_index < len(self.trading_dates):
             return self.trading_dates[self.current_date_index]
         return None
     
+    def _predict_ticker_segment(self, start, end):
+        model_class = get_model_class(self.model_type)
+        
+        for column, ticker in enumerate(self.matrix_tickers):
+            if ticker not in self.ticker_models:
+                continue
+            
+            matrix_rows, cache_rows = self._get_segment_rows(column, start, end)
+            if len(matrix_rows) == 0:
+                continue
+            
+            try:
+                model = self.ticker_models[ticker]
+                X = self.feature_cache[ticker]['X'].iloc[cache_rows]
+                self.prediction_matrix[matrix_rows, column] = model_class.predict(model, X)
+                self.probability_matrix[matrix_rows, column] = model_class.predict_proba(model, X)
+            except Exception as e:
+                print(f"Błąd predykcji dla {ticker}: {str(e)}")
+    
+    def _compute_segment(self, segment):
+        position = self.segment_starts.index(segment)
+        end = self.segment_starts[position + 1] if position + 1 < len(self.segment_starts) else len(self.trading_dates)
+        
+        if segment > 0:
+            RETRAINS.inc()
+            with self.monitor.phase('retrain'):
+                self.retrain_models(self.trading_dates[segment])
+        
+        self.prediction_matrix[segment:end] = 0
+        self.probability_matrix[segment:end] = np.nan
+        
+        with self.monitor.phase('predict.batch'):
+            if self.pooled:
+                self._predict_pooled_segment(segment, end)
+            else:
+                self._predict_ticker_segment(segment, end)
+        
+        self.computed_segments.add(segment)
+        BATCH_PREDICTIONS.inc(int(np.count_nonzero(self.cache_rows[segment:end] >= 0)))
+    
     def get_predictions_for_current_date(self):
+        return self._load_predictions(verbose=True)
+    
+    def _load_predictions(self, verbose):
         if not self.is_trained:
             raise ValueError("Modele nie zostały wytrenowane")
         
@@ -145,55 +472,136 @@ class TradingSimulator:
         if current_date is None:
             return {}
         
-        print(f"Getting predictions for date: {current_date}")
+        index = self.current_date_index
+        segment = self.segment_starts[bisect.bisect_right(self.segment_starts, index) - 1]
+        if segment not in self.computed_segments:
+            self._compute_segment(segment)
+        
+        if verbose:
+            print(f"Getting predictions for date: {current_date}")
         
         predictions = {}
+        probabilities = {}
         prices = {}
         
-        for ticker in self.ticker_models:
-            try:
-                test_data = self.train_test_data[ticker]['test']
-                
-                if 'Date' in test_data.columns:
-                    current_row = test_data[test_data['Date'] == current_date]
-                else:
-                    current_row = test_data[test_data.index == current_date]
-                
-                if not current_row.empty:
-                    X_current = prepare_features_for_prediction(current_row, self.selected_features)
-                    
-                    model_class = get_model_class(self.model_type)
-                    prediction = model_class.predict(self.ticker_models[ticker], X_current)
-                    
-                    predictions[ticker] = prediction[0] if len(prediction) > 0 else 0
-                    
-                    prices[ticker] = current_row['Close'].iloc[0]  
-                    
-                    self.logger.log_prediction(current_date, ticker, predictions[ticker])
-                    
-                    print(f"{ticker}: prediction={predictions[ticker]}, price={prices[ticker]}")
-                else:
+        for column, ticker in enumerate(self.matrix_tickers):
+            if ticker not in self.ticker_models:
+                continue
+            
+            if self.cache_rows[index, column] < 0:
+                if verbose:
                     print(f"No data for {ticker} on {current_date}")
-                
-            except Exception as e:
-                print(f"Błąd predykcji dla {ticker}: {str(e)}")
-                predictions[ticker] = 0
-                prices[ticker] = 0
+                continue
+            
+            predictions[ticker] = int(self.prediction_matrix[index, column])
+            prices[ticker] = self.price_matrix[index, column]
+            
+            probability = self.probability_matrix[index, column]
+            if not np.isnan(probability):
+                probabilities[ticker] = float(probability)
+            
+            self.logger.log_prediction(current_date, ticker, predictions[ticker])
+            if verbose:
+                print(f"{ticker}: prediction={predictions[ticker]}, probability={probabilities.get(ticker, float('nan')):.3f}, price={prices[ticker]}")
         
         self.current_predictions = predictions
+        self.current_probabilities = probabilities
         self.current_prices = prices
+        self.monitor.count('predictions', len(predictions))
+        PREDICTIONS.inc(len(predictions))
         
         portfolio_summary = self.get_portfolio_summary()
         self.logger.log_daily_portfolio(current_date, portfolio_summary, predictions)
         
-        print(f"Final predictions: {predictions}")
-        print(f"Final prices: {prices}")
+        if verbose:
+            print(f"Final predictions: {predictions}")
+            print(f"Final prices: {prices}")
         
         return predictions
     
+    def write_performance_report(self, directory):
+        try:
+            report_file = self.monitor.write_report(directory)
+            print(f"Raport wydajności zapisany: {report_file}")
+            return report_file
+        except Exception as e:
+            print(f"Błąd zapisu raportu wydajności: {str(e)}")
+            return None
+    
     def get_current_prices(self):
         return self.current_prices
     
+    def get_current_probabilities(self):
+        return self.current_probabilities
+    
+    def get_market_arrays(self):
+        # Current-day rows of the prediction matrices, reordered to self.tickers
+        index = self.current_date_index
+        positions = {ticker: column for column, ticker in enumerate(self.matrix_tickers)}
+        columns = np.array([positions.get(ticker, -1) for ticker in self.tickers], dtype=int)
+        known = columns >= 0
+        columns = np.where(known, columns, 0)
+        
+        in_models = np.array([ticker in self.ticker_models for ticker in self.tickers], dtype=bool)
+        tradable = known & in_models & (self.cache_rows[index, columns] >= 0)
+        
+        return {
+            'tickers': list(self.tickers),
+            'predictions': np.where(tradable, self.prediction_matrix[index, columns], 0).astype(int),
+            'prices': np.where(tradable, self.price_matrix[index, columns], np.nan),
+            'probabilities': np.where(tradable, self.probability_matrix[index, columns].astype(float), np.nan),
+            'tradable': tradable
+        }
+    
+    def compute_all_predictions(self):
+        # Segments are computed in order, so walk-forward retrains match a day-by-day run
+        for segment in self.segment_starts:
+            if segment not in self.computed_segments:
+                self._compute_segment(segment)
+    
+    def get_backtest_arrays(self):
+        # Whole-period matrices in self.tickers order
+        self.compute_all_predictions()
+        
+        positions = {ticker: column for column, ticker in enumerate(self.matrix_tickers)}
+        columns = np.array([positions.get(ticker, -1) for ticker in self.tickers], dtype=int)
+        known = columns >= 0
+        columns = np.where(known, columns, 0)
+        
+        in_models = np.array([ticker in self.ticker_models for ticker in self.tickers], dtype=bool)
+        tradable = known & in_models & (self.cache_rows[:, columns] >= 0)
+        close_prices = np.where(tradable, self.price_matrix[:, columns], np.nan)
+        
+        # Buys fill at the day's Open and the final liquidation at the last known Close, as in AgentSimulation
+        dates = pd.DatetimeIndex(self.trading_dates)
+        open_prices = np.full(close_prices.shape, np.nan)
+        final_prices = np.full(len(self.tickers), np.nan)
+        for position, ticker in enumerate(self.tickers):
+            data = self.ticker_data.get(ticker)
+            if data is None or data.empty:
+                continue
+            
+            data = data.set_index('Date') if 'Date' in data.columns else data
+            data = data[~data.index.duplicated()]
+            data.index = pd.to_datetime(data.index)
+            if 'Open' in data.columns:
+                open_prices[:, position] = data['Open'].reindex(dates).to_numpy(dtype=float)
+            
+            closes = data['Close'][data.index <= dates[-1]]
+            if len(closes) > 0:
+                final_prices[position] = closes.iloc[-1]
+        
+        return {
+            'tickers': list(self.tickers),
+            'dates': dates,
+            'open_prices': np.where(np.isnan(open_prices), close_prices, open_prices),
+            'close_prices': close_prices,
+            'predictions': self.prediction_matrix[:, columns].astype(np.int64),
+            'probabilities': self.probability_matrix[:, columns].astype(float),
+            'tradable': tradable,
+            'final_prices': np.where(np.isnan(final_prices), close_prices[-1], final_prices)
+        }
+    
     def get_ticker_data_for_date(self, ticker, date):
         if ticker not in self.ticker_data:
             return None
@@ -252,9 +660,28 @@ class TradingSimulator:
         return success, message
     
     def next_day(self):
+        with self.monitor.phase('next_day'):
+            return self._next_day()
+    
+    def advance(self, days):
+        with self.monitor.phase('advance'):
+            advanced = 0
+            self.logger.begin_batch()
+            try:
+                for _ in range(days):
+                    if not self._next_day(verbose=False):
+                        break
+                    advanced += 1
+            finally:
+                self.logger.flush_batch()
+            return advanced
+    
+    def _next_day(self, verbose=True):
+        self.monitor.count('days')
+        SIMULATED_DAYS.inc()
         current_date = self.get_current_date()
         if current_date:
-            self.portfolio_manager.record_daily_value(current_date, self.current_prices)
+            self.portfolio_manager.record_daily_value(current_date, self.current_prices, verbose)
             
             if self.previous_prices:
                 for ticker in self.current_prices:
@@ -269,11 +696,12 @@ class TradingSimulator:
         self.current_date_index += 1
         
         if self.current_date_index < len(self.trading_dates):
-            self.get_predictions_for_current_date()
+            self._load_predictions(verbose)
             return True
         else:
             final_portfolio = self.get_portfolio_summary()
             self.logger.finalize_logs(final_portfolio)
+            self.write_performance_report(self.logger.log_directory)
         
         return False
     
@@ -292,15 +720,83 @@ class TradingSimulator:
     def reset_simulation(self):
         self.current_date_index = 0
         self.current_predictions = {}
+        self.current_probabilities = {}
         self.current_prices = {}
         self.previous_prices = {}
         self.portfolio_manager.reset_portfolio()
+        self.monitor.reset(keep_prefixes=('setup', 'train_models', 'retrain', 'predict.batch'))
         
-        self.logger = TransactionLogger()
+        self.logger = TransactionLogger(monitor=self.monitor)
         
         if self.is_trained:
             self.get_predictions_for_current_date()
     
+    def get_config(self):
+        return {
+            'tickers': list(self.matrix_tickers),
+            'start_date': self.start_date,
+            'end_date': self.end_date,
+            'model_type': self.model_type,
+            'commission': self.commission,
+            'days_ahead': self.days_ahead,
+            'initial_capital': self.initial_capital,
+            'indicators': list(self.indicators),
+            'selected_features': list(self.selected_features),
+            'pooled': self.pooled,
+            'pooled_encoding': self.pooled_encoding,
+            'retrain_frequency': self.retrain_frequency,
+            'training_window': self.training_window,
+            'rolling_window_size': self.rolling_window_size,
+            'data_provider': type(self.data_provider).__name__ if self.data_provider else None,
+            'trading_days': len(self.trading_dates)
+        }
+    
+    def get_state(self):
+        if not self.is_trained:
+            raise ValueError("Modele nie zostały wytrenowane")
+    
+        return {
+            'config': self.get_config(),
+            'current_date_index': self.current_date_index,
+            'current_predictions': self.current_predictions,
+            'current_probabilities': self.current_probabilities,
+            'current_prices': self.current_prices,
+            'previous_prices': self.previous_prices,
+            'portfolio': self.portfolio_manager.get_state(),
+            'logger': self.logger.get_state(),
+            'ticker_models': self.ticker_models,
+            'pooled_model': self.pooled_model,
+            'train_end_positions': self.train_end_positions,
+            'computed_segments': self.computed_segments,
+            'prediction_matrix': self.prediction_matrix,
+            'probability_matrix': self.probability_matrix
+        }
+    
+    def restore_state(self, state):
+        if not self.is_setup:
+            raise ValueError("Symulator nie został skonfigurowany. Uruchom setup() najpierw.")
+    
+        expected = self.get_config()
+        mismatched = [key for key, value in state['config'].items() if expected.get(key) != value]
+        if mismatched:
+            raise ValueError(f"Checkpoint nie pasuje do konfiguracji symulatora: {', '.join(mismatched)}")
+    
+        self.current_date_index = state['current_date_index']
+        self.current_predictions = state['current_predictions']
+        self.current_probabilities = state['current_probabilities']
+        self.current_prices = state['current_prices']
+        self.previous_prices = state['previous_prices']
+        self.portfolio_manager.restore_state(state['portfolio'])
+        self.logger.restore_state(state['logger'])
+    
+        self.ticker_models = state['ticker_models']
+        self.pooled_model = state['pooled_model']
+        self.train_end_positions = state['train_end_positions']
+        self.computed_segments = state['computed_segments']
+        self.prediction_matrix = state['prediction_matrix']
+        self.probability_matrix = state['probability_matrix']
+        self.is_trained = True
+    
     def get_simulation_progress(self):
         if not self.trading_dates:
             return 0
@@ -1,10 +1,16 @@
 import os
 from datetime import datetime
 import pandas as pd
+from profiling import NULL_MONITOR
+
+LOG_FILE_ATTRIBUTES = ('transaction_file', 'performance_file', 'daily_portfolio_file')
 
 class TransactionLogger:
-    def __init__(self, log_directory="logs"):
+    def __init__(self, log_directory="logs", monitor=None):
         self.log_directory = os.path.abspath(log_directory)
+        self.monitor = monitor or NULL_MONITOR
+        self.pending_writes = None
+        self.pending_outcomes = []
         print(f"DEBUG: Inicjalizuję logger w folderze: {self.log_directory}")
         
         try:
@@ -75,26 +81,62 @@ class TransactionLogger:
             print(f"BŁĄD tworzenia plików: {e}")
             raise
     
+    def begin_batch(self):
+        if self.pending_writes is None:
+            self.pending_writes = {}
+            self.pending_outcomes = []
+    
+    def flush_batch(self):
+        if self.pending_writes is None:
+            return
+        
+        pending_writes = self.pending_writes
+        pending_outcomes = self.pending_outcomes
+        self.pending_writes = None
+        self.pending_outcomes = []
+        
+        self.apply_actual_outcomes(pending_outcomes)
+        
+        for path, chunks in pending_writes.items():
+            try:
+                with self.monitor.phase('logger.flush'), open(path, 'a', encoding='utf-8') as f:
+                    f.write(''.join(chunks))
+            except Exception as e:
+                print(f"BŁĄD zapisu logów do {path}: {e}")
+    
+    def write(self, path, text, phase):
+        if self.pending_writes is not None:
+            self.pending_writes.setdefault(path, []).append(text)
+            return
+        
+        with self.monitor.phase(phase), open(path, 'a', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+    
+    def debug(self, message):
+        if self.pending_writes is None:
+            print(message)
+    
     def log_transaction(self, date, ticker, action, shares, price, commission, total_amount, success=True):
         try:
-            print(f"DEBUG: Loguję transakcję: {action} {ticker} {shares} akcji po ${price}")
-            with open(self.transaction_file, 'a', encoding='utf-8') as f:
-                status = "SUKCES" if success else "BŁĄD"
-                f.write(f"[{date}] {status} - {action}\n")
-                f.write(f"  Ticker: {ticker}\n")
-                f.write(f"  Akcje: {shares}\n")
-                f.write(f"  Cena: ${price:.2f}\n")
-                f.write(f"  prowizja: ${commission:.2f}\n")
-                f.write(f"  Łączna kwota: ${total_amount:.2f}\n")
-                f.write("-" * 50 + "\n\n")
-                f.flush()
-            print("DEBUG: Transakcja zalogowana pomyślnie")
+            self.debug(f"DEBUG: Loguję transakcję: {action} {ticker} {shares} akcji po ${price}")
+            status = "SUKCES" if success else "BŁĄD"
+            self.write(self.transaction_file, (
+                f"[{date}] {status} - {action}\n"
+                f"  Ticker: {ticker}\n"
+                f"  Akcje: {shares}\n"
+                f"  Cena: ${price:.2f}\n"
+                f"  prowizja: ${commission:.2f}\n"
+                f"  Łączna kwota: ${total_amount:.2f}\n"
+                + "-" * 50 + "\n\n"
+            ), 'logger.transaction')
+            self.debug("DEBUG: Transakcja zalogowana pomyślnie")
         except Exception as e:
             print(f"BŁĄD logowania transakcji: {e}")
     
     def log_prediction(self, date, ticker, prediction, actual_price_change=None):
         try:
-            print(f"DEBUG: Loguję przewidywanie: {ticker} prediction={prediction}")
+            self.debug(f"DEBUG: Loguję przewidywanie: {ticker} prediction={prediction}")
             
             if ticker not in self.model_predictions:
                 self.model_predictions[ticker] = []
@@ -113,35 +155,36 @@ class TransactionLogger:
                     'price_change': actual_price_change
                 })
                 
-            print("DEBUG: Przewidywanie zalogowane pomyślnie")
+            self.debug("DEBUG: Przewidywanie zalogowane pomyślnie")
         except Exception as e:
             print(f"BŁĄD logowania przewidywania: {e}")
     
     def log_daily_portfolio(self, date, portfolio_summary, predictions):
         try:
-            print(f"DEBUG: Loguję dzienny stan portfolio na {date}")
-            with open(self.daily_portfolio_file, 'a', encoding='utf-8') as f:
-                f.write(f"[{date}]\n")
-                f.write(f"Gotówka: ${portfolio_summary['cash']:,.2f}\n")
-                f.write(f"Wartość całkowita: ${portfolio_summary['total_value']:,.2f}\n")
-                f.write(f"Zwrot całkowity: ${portfolio_summary['total_return']:,.2f} ({portfolio_summary['return_percentage']:.2f}%)\n")
-                f.write("\nPozycje:\n")
-                
-                if portfolio_summary['positions']:
-                    for pos in portfolio_summary['positions']:
-                        f.write(f"  {pos['ticker']}: {pos['shares']} akcji @ ${pos['avg_price']:.2f} "
-                               f"(Obecna: ${pos['current_price']:.2f}, P&L: ${pos['unrealized_pnl']:,.2f})\n")
-                else:
-                    f.write("  Brak pozycji\n")
-                    
-                f.write("\nPrzewidywania:\n")
-                for ticker, prediction in predictions.items():
-                    signal = "BUY" if prediction == 1 else "HOLD/SELL"
-                    f.write(f"  {ticker}: {signal} (wartość: {prediction})\n")
+            self.debug(f"DEBUG: Loguję dzienny stan portfolio na {date}")
+            lines = [
+                f"[{date}]\n",
+                f"Gotówka: ${portfolio_summary['cash']:,.2f}\n",
+                f"Wartość całkowita: ${portfolio_summary['total_value']:,.2f}\n",
+                f"Zwrot całkowity: ${portfolio_summary['total_return']:,.2f} ({portfolio_summary['return_percentage']:.2f}%)\n",
+                "\nPozycje:\n"
+            ]
+            
+            if portfolio_summary['positions']:
+                for pos in portfolio_summary['positions']:
+                    lines.append(f"  {pos['ticker']}: {pos['shares']} akcji @ ${pos['avg_price']:.2f} "
+                                 f"(Obecna: ${pos['current_price']:.2f}, P&L: ${pos['unrealized_pnl']:,.2f})\n")
+            else:
+                lines.append("  Brak pozycji\n")
                 
-                f.write("-" * 60 + "\n\n")
-                f.flush()
-            print("DEBUG: Dzienny stan portfolio zalogowany pomyślnie")
+            lines.append("\nPrzewidywania:\n")
+            for ticker, prediction in predictions.items():
+                signal = "BUY" if prediction == 1 else "HOLD/SELL"
+                lines.append(f"  {ticker}: {signal} (wartość: {prediction})\n")
+            
+            lines.append("-" * 60 + "\n\n")
+            self.write(self.daily_portfolio_file, ''.join(lines), 'logger.daily_portfolio')
+            self.debug("DEBUG: Dzienny stan portfolio zalogowany pomyślnie")
         except Exception as e:
             print(f"BŁĄD logowania dziennego portfolio: {e}")
     
@@ -176,7 +219,7 @@ class TransactionLogger:
         }
     
     def log_model_performance_summary(self):
-        with open(self.performance_file, 'a', encoding='utf-8') as f:
+        with self.monitor.phase('logger.performance_summary'), open(self.performance_file, 'a', encoding='utf-8') as f:
             f.write(f"\nPODSUMOWANIE SKUTECZNOŚCI MODELU - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write("=" * 60 + "\n")
             
@@ -209,6 +252,12 @@ class TransactionLogger:
             f.write("\n" + "=" * 60 + "\n")
     
     def update_actual_outcome(self, ticker, date, price_change):
+        if self.pending_writes is not None:
+            if ticker in self.actual_outcomes:
+                self.pending_outcomes.append((ticker, date, price_change, len(self.model_predictions[ticker]),
+                                              len(self.actual_outcomes[ticker])))
+            return
+        
         if ticker in self.actual_outcomes:
             for i, pred in enumerate(self.model_predictions[ticker]):
                 if pred['date'] == date and i < len(self.actual_outcomes[ticker]):
@@ -220,10 +269,60 @@ class TransactionLogger:
                     }
                     break
     
+    def apply_actual_outcomes(self, outcomes):
+        first_index = {}
+        
+        for ticker, date, price_change, prediction_count, outcome_count in outcomes:
+            if ticker not in first_index:
+                first_index[ticker] = {}
+                for i, pred in enumerate(self.model_predictions[ticker]):
+                    first_index[ticker].setdefault(pred['date'], i)
+            
+            i = first_index[ticker].get(date)
+            if i is not None and i < prediction_count and i < outcome_count:
+                self.actual_outcomes[ticker][i] = {
+                    'date': date,
+                    'actual': 1 if price_change > 0 else 0,
+                    'price_change': price_change
+                }
+    
+    def get_state(self):
+        self.flush_batch()
+        
+        files = {}
+        for attribute in LOG_FILE_ATTRIBUTES:
+            path = getattr(self, attribute)
+            files[attribute] = (path, os.path.getsize(path) if os.path.exists(path) else 0)
+        
+        return {
+            'files': files,
+            'model_predictions': self.model_predictions,
+            'actual_outcomes': self.actual_outcomes
+        }
+    
+    def restore_state(self, state):
+        self.flush_batch()
+        
+        for attribute, (path, offset) in state['files'].items():
+            current_path = getattr(self, attribute)
+            if not os.path.exists(path) or os.path.getsize(path) < offset:
+                print(f"Uwaga: brak pliku logu {path} - kontynuacja w {current_path}")
+                continue
+            
+            with open(path, 'r+b') as f:
+                f.truncate(offset)
+            if current_path != path and os.path.exists(current_path):
+                os.remove(current_path)
+            setattr(self, attribute, path)
+        
+        self.model_predictions = state['model_predictions']
+        self.actual_outcomes = state['actual_outcomes']
+    
     def finalize_logs(self, final_portfolio_summary):
+        self.flush_batch()
         self.log_model_performance_summary()
         
-        with open(self.daily_portfolio_file, 'a', encoding='utf-8') as f:
+        with self.monitor.phase('logger.finalize'), open(self.daily_portfolio_file, 'a', encoding='utf-8') as f:
             f.write("\n" + "=" * 80 + "\n")
             f.write("KOŃCOWE PODSUMOWANIE PORTFOLIO\n")
             f.write("=" * 80 + "\n")
@@ -232,7 +331,7 @@ class TransactionLogger:
             f.write(f"Procentowy zwrot: {final_portfolio_summary['return_percentage']:.2f}%\n")
             f.write("=" * 80 + "\n")
         
-        with open(self.transaction_file, 'a', encoding='utf-8') as f:
+        with self.monitor.phase('logger.finalize'), open(self.transaction_file, 'a', encoding='utf-8') as f:
             f.write("\n" + "=" * 80 + "\n")
             f.write("SYMULACJA ZAKOŃCZONA\n")
             f.write(f"Data zakończenia: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import argparse
+import warnings
+from config import DEFAULT_SETTINGS
+from ml.models.model_registry import list_models
+from ml.models.model_tuner import ModelTuner, load_training_data
+from data.providers import DATA_PROVIDERS, create_provider
+
+warnings.filterwarnings('ignore', category=FutureWarning)
+warnings.filterwarnings('ignore', category=UserWarning)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Purged walk-forward hyperparameter search for model_params.json")
+    parser.add_argument('ticker', help="Ticker whose training data is used for tuning")
+    parser.add_argument('--start-date', default=DEFAULT_SETTINGS['start_date'],
+                        help="Start of the test period; only data before it is used")
+    parser.add_argument('--days-ahead', type=int, default=DEFAULT_SETTINGS['days_ahead'])
+    parser.add_argument('--models', nargs='+', default=list_models(),
+                        help="Model names as shown in the GUI")
+    parser.add_argument('--indicators', nargs='+', default=['SMA', 'EMA', 'RSI', 'MACD'])
+    parser.add_argument('--features', nargs='+', default=['Close'])
+    parser.add_argument('--splits', type=int, default=5)
+    parser.add_argument('--embargo', type=int, default=0, help="Extra gap (rows) on top of the days_ahead purge")
+    parser.add_argument('--candidates', type=int, default=20)
+    parser.add_argument('--eta', type=int, default=3, help="Successive halving reduction factor")
+    parser.add_argument('--n-jobs', type=int, default=-1)
+    parser.add_argument('--write', action='store_true', help="Write best parameters to model_params.json")
+    parser.add_argument('--provider', choices=list(DATA_PROVIDERS.keys()), default='yfinance',
+                        help="Market data source; 'synthetic' and 'local' work offline")
+    parser.add_argument('--data-dir', help="Directory with <TICKER>.csv/.parquet files for --provider local")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    
+    provider_options = {'directory': args.data_dir} if args.provider == 'local' else {}
+    provider = create_provider(args.provider, **provider_options)
+    
+    X, y = load_training_data(args.ticker, args.start_date, args.days_ahead, args.indicators, args.features, provider)
+    print(f"Loaded {len(X)} training rows for {args.ticker}")
+    
+    tuner = ModelTuner(
+        days_ahead=args.days_ahead,
+        n_splits=args.splits,
+        embargo=args.embargo,
+        n_candidates=args.candidates,
+        eta=args.eta,
+        n_jobs=args.n_jobs
+    )
+    results = tuner.tune_models(args.models, X, y, write=args.write)
+    
+    print("\n" + "=" * 60)
+    for model_type, result in results.items():
+        if result is None:
+            print(f"{model_type}: FAILED")
+            continue
+        print(f"{model_type}: accuracy {result['best_score']:.4f}")
+        print(f"  {result['best_params']}")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,5 @@
-import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
-import importlib
+from config import AVAILABLE_PRICE_FEATURES, DATA_COLUMNS_TO_DROP
 
 def validate_date_format(date_string):
     try:
@@ -11,6 +9,7 @@ def validate_date_format(date_string):
         return False
 
 def validate_date_range(start_date, end_date):
+    import pandas as pd
     start = pd.to_datetime(start_date)
     end = pd.to_datetime(end_date)
     return start < end
@@ -49,55 +48,27 @@ def calculate_returns(initial_value, final_value):
     return ((final_value - initial_value) / initial_value) * 100
 
 def get_model_class(model_name):
-    available_models = {
-        'Decision Tree': 'DecisionTreeModel',
-        'Random Forest': 'RandomForestModel', 
-        'SVM': 'SVMModel',
-        'KNN': 'KNNModel',
-        'Logistic Regression': 'LogisticRegressionModel',
-        'Ensemble': 'EnsembleModel'
-    }
-    
-    if model_name not in available_models:
-        raise ValueError(f"Model {model_name} not available")
-    
-    class_name = available_models[model_name]
-    
-    try:
-        if class_name == 'DecisionTreeModel':
-            from ml.models.decision_tree_model import DecisionTreeModel
-            return DecisionTreeModel
-        elif class_name == 'RandomForestModel':
-            from ml.models.random_forest_model import RandomForestModel
-            return RandomForestModel
-        elif class_name == 'SVMModel':
-            from ml.models.svm_model import SVMModel
-            return SVMModel
-        elif class_name == 'KNNModel':
-            from ml.models.knn_model import KNNModel
-            return KNNModel
-        elif class_name == 'LogisticRegressionModel':
-            from ml.models.logistic_regression_model import LogisticRegressionModel
-            return LogisticRegressionModel
-        elif class_name == 'EnsembleModel':
-            from ml.models.ensemble_model import EnsembleModel
-            return EnsembleModel
-        else:
-            raise ValueError(f"Unknown model class: {class_name}")
-    except ImportError as e:
-        raise ImportError(f"Could not import {class_name}: {str(e)}")
+    from ml.models.model_registry import get_model_class as get_registered_model_class
+    return get_registered_model_class(model_name)
+
+def get_model_capabilities(model_name):
+    from ml.models.model_registry import get_model_capabilities as get_registered_capabilities
+    return get_registered_capabilities(model_name)
+
+def get_feature_drop_columns(selected_features):
+    unselected_price_features = [col for col in AVAILABLE_PRICE_FEATURES if col not in selected_features]
+    return DATA_COLUMNS_TO_DROP + unselected_price_features
 
 def prepare_features_for_prediction(data, drop_columns=None):
     if drop_columns is None:
-        drop_columns = ['Target', 'Date']
+        drop_columns = []
     
+    drop_columns = list(DATA_COLUMNS_TO_DROP) + [col for col in drop_columns if col not in DATA_COLUMNS_TO_DROP]
     existing_drop_columns = [col for col in drop_columns if col in data.columns]
     features = data.drop(columns=existing_drop_columns)
     
-    features = features.select_dtypes(include=[np.number])
-    features = features.fillna(features.mean())
-    
-    return features
+    import numpy as np
+    return features.select_dtypes(include=[np.number])
 
 def validate_data_completeness(data, required_features=None):
     if required_features is None:
@@ -123,13 +94,18 @@ def safe_divide(numerator, denominator, default_value=0):
 def normalize_ticker_name(ticker):
     return ticker.strip().upper().replace(' ', '')
 
+def slugify(name):
+    return ''.join(char if char.isalnum() else '_' for char in name).strip('_').lower()
+
 def get_trading_days_between(start_date, end_date):
+    import pandas as pd
     start = pd.to_datetime(start_date)
     end = pd.to_datetime(end_date)
     business_days = pd.bdate_range(start=start, end=end)
     return len(business_days)
 
 def format_prediction_confidence(prediction_proba):
+    import numpy as np
     if len(prediction_proba.shape) > 1 and prediction_proba.shape[1] > 1:
         confidence = np.max(prediction_proba, axis=1)
         return [f"{conf:.1%}" for conf in confidence]